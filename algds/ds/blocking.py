@@ -0,0 +1,481 @@
+"""Implementation of thread-safe and asyncio-aware stack, queue and deque.
+
+Producers and consumers running in different threads can share one of the
+blocking structures below without adding their own locks. Removing an item from
+an empty structure blocks until an item is available, and adding an item to a
+full bounded structure blocks until there is room again. This is called
+backpressure: a fast producer is slowed down to the pace of its consumers.
+
+The asyncio flavours do the same for coroutines running in one event loop,
+where waiting suspends the coroutine instead of the thread. They need Python
+3.7 or later, and are only defined when asyncio is available.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['Empty', 'Full', 'BlockingStack', 'BlockingQueue', 'BlockingDeque']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import sys
+import threading
+import time
+sys.path.append('../../')
+
+from algds.ds.deque import Deque
+from algds.ds.queue import Queue
+from algds.ds.stack import Stack
+
+try:
+    import asyncio
+except ImportError:  # Python 2
+    asyncio = None
+
+
+class Empty(IndexError):
+    """Raised by a non-blocking or timed removal from an empty structure."""
+    pass
+
+
+class Full(RuntimeError):
+    """Raised by a non-blocking or timed addition to a full structure."""
+    pass
+
+
+class _Blocking(object):
+    """Common machinery of the blocking structures.
+
+    All methods of the wrapped container are called with the lock held. Two
+    conditions share the lock: consumers wait on _not_empty and producers wait
+    on _not_full.
+
+    Attributes:
+        _container: The wrapped Stack/Queue/Deque.
+        _maxsize (int): Maximum number of items, <= 0 means unbounded.
+        _lock (threading.Lock)
+        _not_empty (threading.Condition): Notified when an item is added.
+        _not_full (threading.Condition): Notified when an item is removed.
+    """
+    def __init__(self, container, maxsize):
+        self._container = container
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def isEmpty(self):
+        with self._lock:
+            return self._container.size() == 0
+
+    def isFull(self):
+        with self._lock:
+            return self._isFull()
+
+    def size(self):
+        with self._lock:
+            return self._container.size()
+
+    def __len__(self):
+        return self.size()
+
+    def _isFull(self):
+        return 0 < self._maxsize <= self._container.size()
+
+    def _hasItems(self):
+        return self._container.size() > 0
+
+    def _hasRoom(self):
+        return not self._isFull()
+
+    @staticmethod
+    def _wait(condition, ready, block, timeout, error):
+        """Wait on condition until ready() is true.
+
+        The lock of the condition must be held by the caller.
+
+        Args:
+            condition (threading.Condition)
+            ready (callable): Predicate telling whether to stop waiting.
+            block (bool): Whether to wait at all.
+            timeout (int/float/None): Maximum seconds to wait, None means
+                waiting forever.
+            error (type): Exception class raised when giving up.
+
+        Raises:
+            error: If ready() is still false when giving up.
+        """
+        if ready():
+            return
+        if not block:
+            raise error()
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        if timeout < 0:
+            raise ValueError('timeout should be >= 0.')
+        deadline = time.time() + timeout
+        while not ready():
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise error()
+            condition.wait(remaining)
+
+    def _add(self, add, x, block, timeout):
+        with self._not_full:
+            self._wait(self._not_full, self._hasRoom, block, timeout, Full)
+            add(x)
+            self._not_empty.notify()
+
+    def _remove(self, remove, block, timeout):
+        with self._not_empty:
+            self._wait(self._not_empty, self._hasItems, block, timeout, Empty)
+            x = remove()
+            self._not_full.notify()
+            return x
+
+
+class BlockingStack(_Blocking):
+    """Thread-safe stack.
+
+    >>> s = BlockingStack(maxsize=2)
+    >>> s.push(4)
+    >>> s.push('dog')
+    >>> s.top()
+    'dog'
+    >>> s.push(True, timeout=0.01)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    Full
+    >>> s.pop()
+    'dog'
+    >>> s.pop()
+    4
+    >>> s.pop(block=False)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    Empty
+    """
+    def __init__(self, maxsize=0):
+        """Initialize an empty stack.
+
+        Args:
+            maxsize (int) [0]: Maximum number of items, <= 0 means unbounded.
+        """
+        _Blocking.__init__(self, Stack(), maxsize)
+
+    def push(self, x, block=True, timeout=None):
+        """Push x, waiting for room if the stack is full.
+
+        Raises:
+            Full: If there is still no room when giving up.
+        """
+        self._add(self._container.push, x, block, timeout)
+
+    def pop(self, block=True, timeout=None):
+        """Pop the top item, waiting for one if the stack is empty.
+
+        Raises:
+            Empty: If there is still no item when giving up.
+        """
+        return self._remove(self._container.pop, block, timeout)
+
+    def top(self):
+        """Return the top item without waiting.
+
+        Raises:
+            Empty: If the stack is empty.
+        """
+        with self._lock:
+            if not self._hasItems():
+                raise Empty()
+            return self._container.top()
+
+
+class BlockingQueue(_Blocking):
+    """Thread-safe FIFO queue.
+
+    Several workers can pull tasks from one shared queue. Here a producer
+    thread sends numbers to a consumer thread, using None to tell it to stop.
+
+    >>> q = BlockingQueue(maxsize=4)
+    >>> results = []
+    >>> def consume():
+    ...     while True:
+    ...         x = q.dequeue()
+    ...         if x is None:
+    ...             break
+    ...         results.append(x * x)
+    >>> consumer = threading.Thread(target=consume)
+    >>> consumer.start()
+    >>> for x in range(10):
+    ...     q.enqueue(x)
+    >>> q.enqueue(None)
+    >>> consumer.join()
+    >>> results
+    [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+    >>> q.dequeue(timeout=0.01)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    Empty
+    """
+    def __init__(self, maxsize=0):
+        """Initialize an empty queue.
+
+        Args:
+            maxsize (int) [0]: Maximum number of items, <= 0 means unbounded.
+        """
+        _Blocking.__init__(self, Queue(), maxsize)
+
+    def enqueue(self, x, block=True, timeout=None):
+        """Add x to the rear, waiting for room if the queue is full.
+
+        Raises:
+            Full: If there is still no room when giving up.
+        """
+        self._add(self._container.enqueue, x, block, timeout)
+
+    def dequeue(self, block=True, timeout=None):
+        """Remove the front item, waiting for one if the queue is empty.
+
+        Raises:
+            Empty: If there is still no item when giving up.
+        """
+        return self._remove(self._container.dequeue, block, timeout)
+
+
+class BlockingDeque(_Blocking):
+    """Thread-safe deque.
+
+    >>> d = BlockingDeque()
+    >>> d.addRear(4)
+    >>> d.addFront('cat')
+    >>> d.removeRear()
+    4
+    >>> d.removeFront()
+    'cat'
+    >>> d.removeFront(timeout=0.01)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    Empty
+    """
+    def __init__(self, maxsize=0):
+        """Initialize an empty deque.
+
+        Args:
+            maxsize (int) [0]: Maximum number of items, <= 0 means unbounded.
+        """
+        _Blocking.__init__(self, Deque(), maxsize)
+
+    def addRear(self, x, block=True, timeout=None):
+        self._add(self._container.addRear, x, block, timeout)
+
+    def addFront(self, x, block=True, timeout=None):
+        self._add(self._container.addFront, x, block, timeout)
+
+    def removeRear(self, block=True, timeout=None):
+        return self._remove(self._container.removeRear, block, timeout)
+
+    def removeFront(self, block=True, timeout=None):
+        return self._remove(self._container.removeFront, block, timeout)
+
+
+if asyncio is not None:
+    __all__ += ['AsyncStack', 'AsyncQueue', 'AsyncDeque']
+
+    class AsyncQueue(asyncio.Queue):
+        """asyncio FIFO queue backed by the ring-buffer Queue.
+
+        asyncio.Queue does the waiting and wakeups, and stores its items by
+        calling the _init/_put/_get hooks, which we redirect to Queue. Besides
+        put() and get(), the usual method names are provided.
+
+        Here a producer sends numbers to a consumer through a bounded queue,
+        so it waits whenever the consumer falls 2 items behind:
+
+        >>> async def main():
+        ...     q = AsyncQueue(maxsize=2)
+        ...     results = []
+        ...     async def consume():
+        ...         while True:
+        ...             x = await q.dequeue()
+        ...             if x is None:
+        ...                 return
+        ...             results.append(x * x)
+        ...     consumer = asyncio.ensure_future(consume())
+        ...     for x in range(5):
+        ...         await q.enqueue(x)
+        ...     await q.enqueue(None)
+        ...     await consumer
+        ...     return results, q.isEmpty()
+        >>> asyncio.run(main())
+        ([0, 1, 4, 9, 16], True)
+        """
+        def _init(self, maxsize):
+            self._queue = Queue()
+
+        def _put(self, x):
+            self._queue.enqueue(x)
+
+        def _get(self):
+            return self._queue.dequeue()
+
+        def isEmpty(self):
+            return self.empty()
+
+        def size(self):
+            return self.qsize()
+
+        def enqueue(self, x):
+            return self.put(x)
+
+        def dequeue(self):
+            return self.get()
+
+    class AsyncStack(asyncio.Queue):
+        """asyncio LIFO queue backed by Stack.
+
+        >>> async def main():
+        ...     s = AsyncStack()
+        ...     for x in range(3):
+        ...         await s.push(x)
+        ...     popped = [await s.pop() for _ in range(3)]
+        ...     waiter = asyncio.ensure_future(s.pop())
+        ...     await asyncio.sleep(0)
+        ...     await s.push('dog')
+        ...     return popped, await waiter, s.size()
+        >>> asyncio.run(main())
+        ([2, 1, 0], 'dog', 0)
+        """
+        def _init(self, maxsize):
+            self._queue = Stack()
+
+        def _put(self, x):
+            self._queue.push(x)
+
+        def _get(self):
+            return self._queue.pop()
+
+        def isEmpty(self):
+            return self.empty()
+
+        def size(self):
+            return self.qsize()
+
+        def push(self, x):
+            return self.put(x)
+
+        def pop(self):
+            return self.get()
+
+    class _AtEnd(object):
+        """Run a put() or a get() coroutine of an AsyncDeque at one end.
+
+        _put() and _get() cannot be told which end to use, so the deque keeps
+        the methods to call in _add and _remove. Each step of the coroutine
+        runs without interruption, so setting them just before the step, and
+        restoring the defaults after it, applies them to this call only.
+        """
+        def __init__(self, deque, coroutine, add=None, remove=None):
+            self._deque = deque
+            self._steps = coroutine.__await__()
+            self._add = add
+            self._remove = remove
+
+        def __await__(self):
+            return self
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            return self.send(None)
+
+        def send(self, value):
+            return self._step(self._steps.send, value)
+
+        def throw(self, *args):
+            return self._step(self._steps.throw, *args)
+
+        def close(self):
+            self._steps.close()
+
+        def _step(self, step, *args):
+            deque = self._deque
+            if self._add is not None:
+                deque._add = self._add
+            if self._remove is not None:
+                deque._remove = self._remove
+            try:
+                return step(*args)
+            finally:
+                deque._add = deque._queue.addRear
+                deque._remove = deque._queue.removeFront
+
+    class AsyncDeque(asyncio.Queue):
+        """asyncio deque backed by Deque.
+
+        put() and get() add to the rear and remove from the front, as in a
+        FIFO queue. The additions and removals at either end wait in the same
+        way, and are awaited alike.
+
+        >>> async def main():
+        ...     d = AsyncDeque(maxsize=2)
+        ...     await d.addRear(4)
+        ...     await d.addFront('cat')
+        ...     adder = asyncio.ensure_future(d.addFront(True))
+        ...     await asyncio.sleep(0)
+        ...     full = adder.done()
+        ...     rear = await d.removeRear()
+        ...     await adder
+        ...     front = [await d.removeFront() for _ in range(2)]
+        ...     waiter = asyncio.ensure_future(d.removeRear())
+        ...     await asyncio.sleep(0)
+        ...     await d.put('dog')
+        ...     return full, rear, front, await waiter, d.isEmpty()
+        >>> asyncio.run(main())
+        (False, 4, [True, 'cat'], 'dog', True)
+        """
+        def _init(self, maxsize):
+            self._queue = Deque()
+            self._add = self._queue.addRear
+            self._remove = self._queue.removeFront
+
+        def _put(self, x):
+            self._add(x)
+
+        def _get(self):
+            return self._remove()
+
+        def isEmpty(self):
+            return self.empty()
+
+        def size(self):
+            return self.qsize()
+
+        def addRear(self, x):
+            return self.put(x)
+
+        def addFront(self, x):
+            return _AtEnd(self, self.put(x), add=self._queue.addFront)
+
+        def removeFront(self):
+            return self.get()
+
+        def removeRear(self):
+            return _AtEnd(self, self.get(), remove=self._queue.removeRear)
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
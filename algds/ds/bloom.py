@@ -0,0 +1,540 @@
+"""Probabilistic membership filters.
+
+A membership filter answers whether a key may be in a set, using a few bits
+per key instead of the keys themselves. The answer "no" is always right, while
+the answer "yes" is wrong with a small false-positive rate chosen when the
+filter is built. Put in front of a slower structure, a filter rejects most of
+the absent keys without searching for them, see Search.attachFilter() and
+HashTable.attachFilter().
+
+The filters hash the keys by fnv1aHash by default, which gives the same hash
+values across runs. Hence a filter serialized by toBytes() can be saved to a
+file, and fromBytes() can use the bytes in place, e.g., from a memory-mapped
+file at startup.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['BloomFilter', 'BlockedBloomFilter', 'CuckooFilter']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import math
+import random
+import struct
+import sys
+sys.path.append('../../')
+
+from algds.ds.hashfunc import fnv1aHash
+
+try:
+    xrange
+except NameError:  # Python 3
+    xrange = range
+
+
+def _bufferView(data, offset):
+    """Return the bytes of data[offset:] without copying if possible.
+
+    A memoryview of data is returned on Python 3, which is read-only if data
+    is read-only. Python 2 memoryviews cannot be cast, so the bytes are copied
+    into a bytearray instead.
+    """
+    try:
+        return memoryview(data).cast('B')[offset:]
+    except (AttributeError, TypeError):  # Python 2
+        return bytearray(data[offset:])
+
+
+def _mix(h):
+    """Return the 64-bit h with its bits mixed, the finalizer of MurmurHash3.
+
+    The high bits of fnv1aHash are poor for short keys, e.g., the strings of
+    '0' to '999' share only 12 values of bits 32 to 41.
+    """
+    h ^= h >> 33
+    h = (h * 0xff51afd7ed558ccd) & 0xffffffffffffffff
+    h ^= h >> 33
+    h = (h * 0xc4ceb9fe1a85ec53) & 0xffffffffffffffff
+    return h ^ (h >> 33)
+
+
+class BloomFilter(object):
+    """Implementation of a Bloom filter.
+
+    The filter is an array of m bits, all 0 at first. Adding a key sets the k
+    bits at the positions given by k hash functions, and a key may be in the
+    set only if all its k bits are 1. After n keys are added, a bit is still 0
+    with probability about exp(-kn / m), so the false-positive rate is
+    (1 - exp(-kn / m))^k. For a target rate p at capacity n, it is minimized
+    by m = -n ln p / (ln 2)^2 bits and k = (m / n) ln 2, i.e., about 9.6 bits
+    and 7 hash functions per key for p = 1%.
+
+    The k positions come from one 64-bit hash value h: with h1 and h2 its low
+    and high halves, the i-th position is (h1 + i h2) mod m, which is as good
+    as k independent hash functions (Kirsch and Mitzenmacher, 2006).
+
+    Keys cannot be removed, since their bits may be shared with other keys.
+
+    Attributes:
+        _bits (bytearray/memoryview): The bit array.
+        _number_bits (int): m.
+        _number_hashes (int): k.
+        _count (int): Number of keys added.
+        _hash_function (callable): Map a key to a 64-bit int.
+
+    >>> f = BloomFilter(1000, error_rate=0.01)
+    >>> for word in ['cat', 'dog', 'lion']:
+    ...     f.add(word)
+    >>> 'dog' in f, 'cow' in f
+    (True, False)
+    >>> len(f)
+    3
+    >>> g = BloomFilter.fromBytes(f.toBytes())
+    >>> 'lion' in g, 'tiger' in g
+    (True, False)
+    """
+    _MAGIC = b'BLM1'
+    _HEADER = struct.Struct('<4sIQQ')
+
+    def __init__(self, capacity, error_rate=0.01, hash_function=fnv1aHash):
+        """Initialize an empty filter.
+
+        Args:
+            capacity (int): Number of keys expected.
+            error_rate (float) [0.01]: Target false-positive rate once capacity
+                keys are added, in (0, 1).
+            hash_function (callable) [fnv1aHash]: Map a key to a 64-bit int.
+
+        Raises:
+            ValueError: If the arguments are not valid.
+        """
+        if capacity < 1:
+            raise ValueError('capacity should be >= 1.')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate should be in (0, 1).')
+        number_bits, number_hashes = self._dimensions(capacity, error_rate)
+        self._setUp(bytearray(number_bits // 8), number_bits, number_hashes,
+                    0, hash_function)
+
+    def _setUp(self, bits, number_bits, number_hashes, count, hash_function):
+        self._bits = bits
+        self._number_bits = number_bits
+        self._number_hashes = number_hashes
+        self._count = count
+        self._hash_function = hash_function
+
+    @classmethod
+    def _dimensions(cls, capacity, error_rate):
+        """Return m and k for the capacity and the false-positive rate."""
+        number_bits = cls._roundBits(int(math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)))
+        return number_bits, cls._numberHashes(number_bits, capacity)
+
+    @staticmethod
+    def _numberHashes(number_bits, capacity):
+        return max(1, int(round(number_bits / capacity * math.log(2))))
+
+    @staticmethod
+    def _roundBits(number_bits):
+        """Round the number of bits up to whole bytes."""
+        return max(8, (number_bits + 7) // 8 * 8)
+
+    def _positions(self, x):
+        h = self._hash_function(x)
+        h1 = h & 0xffffffff
+        h2 = (h >> 32) | 1
+        m = self._number_bits
+        for i in xrange(self._number_hashes):
+            yield (h1 + i * h2) % m
+
+    def add(self, x):
+        """Add the key x."""
+        bits = self._bits
+        for p in self._positions(x):
+            bits[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+    def contains(self, x):
+        """Return False if x is not in the set, and True if it may be."""
+        bits = self._bits
+        for p in self._positions(x):
+            if not (bits[p >> 3] >> (p & 7)) & 1:
+                return False
+        return True
+
+    def __contains__(self, x):
+        return self.contains(x)
+
+    def __len__(self):
+        return self._count
+
+    def falsePositiveRate(self):
+        """Return the expected false-positive rate for the keys added."""
+        k = self._number_hashes
+        return (1 - math.exp(-k * self._count / self._number_bits)) ** k
+
+    def storageBytes(self):
+        return len(self._bits)
+
+    def toBytes(self):
+        """Serialize the filter, the hash function excluded."""
+        return self._HEADER.pack(self._MAGIC, self._number_hashes,
+                                 self._number_bits,
+                                 self._count) + bytes(self._bits)
+
+    @classmethod
+    def fromBytes(cls, data, hash_function=fnv1aHash):
+        """Rebuild a filter serialized by toBytes().
+
+        The bits are used in place on Python 3, so data may be an mmap.mmap of
+        a saved filter, see _bufferView().
+
+        Args:
+            data (bytes/bytearray/mmap.mmap): The serialized filter.
+            hash_function (callable) [fnv1aHash]: The hash function of the
+                serialized filter.
+
+        Raises:
+            ValueError: If data is not a serialized filter of this class.
+
+        >>> import mmap, tempfile
+        >>> f = BloomFilter(100)
+        >>> f.add('cat')
+        >>> with tempfile.TemporaryFile() as file_:
+        ...     _ = file_.write(f.toBytes())
+        ...     file_.flush()
+        ...     data = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+        ...     g = BloomFilter.fromBytes(data)
+        ...     'cat' in g, 'dog' in g, len(g)
+        (True, False, 1)
+        """
+        magic, number_hashes, number_bits, count = cls._HEADER.unpack_from(
+            data)
+        if magic != cls._MAGIC:
+            raise ValueError('data is not a serialized {}.'.format(
+                cls.__name__))
+        bloom_filter = cls.__new__(cls)
+        bloom_filter._setUp(_bufferView(data, cls._HEADER.size), number_bits,
+                            number_hashes, count, hash_function)
+        return bloom_filter
+
+
+class BlockedBloomFilter(BloomFilter):
+    """Bloom filter whose k bits of a key are in one block of 512 bits.
+
+    A plain Bloom filter reads k random bits, i.e., k cache misses for a large
+    filter. Here the low half of the hash value picks a block of 64 bytes, a
+    cache line, and the high half seeds the k bit positions within the block,
+    so a query touches one cache line.
+
+    The blocks get unequal numbers of keys, and the false-positive rate of
+    the crowded ones dominates. With B bits per block and a = nB / m keys per
+    block on average, the number of keys of a block is about Poisson(a), so
+    the rate is the sum over j of Pr[j keys] (1 - (1 - 1 / B)^(kj))^k. The
+    filter is made larger than a plain Bloom filter until this meets the
+    target, e.g., by 0.3 bits per key for 1%, and 1.5 bits for 0.1%.
+
+    >>> f = BlockedBloomFilter(1000, error_rate=0.01)
+    >>> f.storageBytes() % 64
+    0
+    >>> f.add(54)
+    >>> 54 in f, 26 in f
+    (True, False)
+    """
+    _MAGIC = b'BBF1'
+    _BLOCK_BITS = 512
+
+    @classmethod
+    def _dimensions(cls, capacity, error_rate):
+        number_bits, number_hashes = super(
+            BlockedBloomFilter, cls)._dimensions(capacity, error_rate)
+        while cls._blockedRate(number_bits, number_hashes,
+                               capacity) > error_rate:
+            number_bits = cls._roundBits(number_bits + number_bits // 32)
+            number_hashes = cls._numberHashes(number_bits, capacity)
+        return number_bits, number_hashes
+
+    @classmethod
+    def _roundBits(cls, number_bits):
+        """Round the number of bits up to whole blocks."""
+        return max(1, -(-number_bits // cls._BLOCK_BITS)) * cls._BLOCK_BITS
+
+    @classmethod
+    def _blockedRate(cls, number_bits, number_hashes, capacity):
+        """Return the false-positive rate at capacity keys."""
+        B = cls._BLOCK_BITS
+        mean = capacity * B / number_bits
+        rate = 0
+        probability = math.exp(-mean)  # Pr[0 keys in the block].
+        for j in xrange(int(mean + 10 * math.sqrt(mean) + 10)):
+            rate += probability * (
+                1 - (1 - 1 / B) ** (number_hashes * j)) ** number_hashes
+            probability *= mean / (j + 1)
+        return rate
+
+    def _positions(self, x):
+        h = self._hash_function(x)
+        block = (h & 0xffffffff) % (self._number_bits // self._BLOCK_BITS)
+        start = block * self._BLOCK_BITS
+        # (g1 + i g2) mod 512 would repeat the same few patterns within a
+        # block, so each position takes the top 9 bits of a new 32-bit value.
+        g = h >> 32
+        for _ in xrange(self._number_hashes):
+            g = (g * 0x5bd1e995 + 0x9e3779b9) & 0xffffffff
+            yield start + (g >> 23)
+
+
+class CuckooFilter(object):
+    """Implementation of a cuckoo filter.
+
+    Instead of bits, the filter stores a short fingerprint of each key in a
+    table of buckets of 4 slots. A key can only be in two buckets: i1 given by
+    its hash value, and i2 = (hash(fingerprint) - i1) mod the number of
+    buckets, whose other bucket is i1 again. Since i2 only depends on i1 and
+    the fingerprint, a stored fingerprint can be moved to its other bucket
+    without knowing the key. An insertion into two full buckets kicks
+    a random fingerprint out to its other bucket, like the cuckoo hashing of
+    CuckooHashTable.
+
+    A query compares the fingerprint with 8 slots, so the false-positive rate
+    is about 8 / 2^f for f-bit fingerprints, and f = log2(8 / error_rate)
+    bits are used. Shorter fingerprints than 8 bits have too few other
+    buckets to fill the table, so f is at least 8. The fingerprints are packed
+    at f bits each, and there are enough buckets for a load of 95% at
+    capacity, i.e., f / 0.95 bits per key, e.g., 10.5 bits for 1% against 9.6
+    bits of a Bloom filter. It takes fewer bits than a Bloom filter only for
+    rates below about 0.4%. Unlike a Bloom filter, keys can be removed, but
+    only keys which have been added.
+
+    Attributes:
+        _slots (bytearray/memoryview): The fingerprints packed at f bits each,
+            the first one in the lowest bits. 0 marks the empty slots.
+        _number_buckets (int): Number of buckets.
+        _fingerprint_bits (int): f.
+        _count (int): Number of keys added.
+        _hash_function (callable): Map a key to a 64-bit int.
+        _random (random.Random): Choose the fingerprints to kick.
+
+    >>> f = CuckooFilter(1000, error_rate=0.01)
+    >>> for word in ['cat', 'dog', 'lion']:
+    ...     f.add(word)
+    >>> 'dog' in f, 'cow' in f
+    (True, False)
+    >>> f.remove('dog')
+    >>> 'dog' in f, len(f)
+    (False, 2)
+    >>> g = CuckooFilter.fromBytes(f.toBytes())
+    >>> 'lion' in g, 'tiger' in g
+    (True, False)
+    >>> f.storageBytes() * 8 / 1000
+    10.56
+    """
+    _MAGIC = b'CKF2'
+    _HEADER = struct.Struct('<4sIIQ')
+    _BUCKET_SIZE = 4
+    _MAX_LOAD_FACTOR = 0.95
+    _MAX_KICKS = 1000
+
+    def __init__(self, capacity, error_rate=0.01, hash_function=fnv1aHash):
+        """Initialize an empty filter.
+
+        Args:
+            capacity (int): Number of keys expected.
+            error_rate (float) [0.01]: Target false-positive rate, in (0, 1).
+            hash_function (callable) [fnv1aHash]: Map a key to a 64-bit int.
+
+        Raises:
+            ValueError: If the arguments are not valid.
+        """
+        if capacity < 1:
+            raise ValueError('capacity should be >= 1.')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate should be in (0, 1).')
+        fingerprint_bits = int(math.ceil(math.log(
+            2 * self._BUCKET_SIZE / error_rate, 2)))
+        fingerprint_bits = min(max(fingerprint_bits, 8), 32)
+        number_buckets = max(1, int(math.ceil(
+            capacity / (self._BUCKET_SIZE * self._MAX_LOAD_FACTOR))))
+        number_bytes = -(-number_buckets * self._BUCKET_SIZE *
+                         fingerprint_bits // 8)
+        self._setUp(bytearray(number_bytes), number_buckets,
+                    fingerprint_bits, 0, hash_function)
+
+    def _setUp(self, slots, number_buckets, fingerprint_bits, count,
+               hash_function):
+        self._slots = slots
+        self._number_buckets = number_buckets
+        self._fingerprint_bits = fingerprint_bits
+        self._count = count
+        self._hash_function = hash_function
+        self._random = random.Random(0)
+
+    def _readBits(self, position, width):
+        """Return the width bits starting at the bit position."""
+        slots = self._slots
+        value = 0
+        for i in xrange((position + width - 1) >> 3, (position >> 3) - 1, -1):
+            value = (value << 8) | slots[i]
+        return (value >> (position & 7)) & ((1 << width) - 1)
+
+    def _writeBits(self, position, width, value):
+        """Overwrite the width bits starting at the bit position."""
+        slots = self._slots
+        start = position >> 3
+        end = (position + width - 1) >> 3
+        old = 0
+        for i in xrange(end, start - 1, -1):
+            old = (old << 8) | slots[i]
+        shift = position & 7
+        new = (old & ~(((1 << width) - 1) << shift)) | (value << shift)
+        for i in xrange(start, end + 1):
+            slots[i] = new & 0xff
+            new >>= 8
+
+    def _slot(self, index):
+        f = self._fingerprint_bits
+        return self._readBits(index * f, f)
+
+    def _setSlot(self, index, fingerprint):
+        f = self._fingerprint_bits
+        self._writeBits(index * f, f, fingerprint)
+
+    def _fingerprintAndBucket(self, x):
+        h = _mix(self._hash_function(x))
+        fingerprint = (h >> 32) & ((1 << self._fingerprint_bits) - 1)
+        # 0 marks the empty slots.
+        return fingerprint or 1, (h & 0xffffffff) % self._number_buckets
+
+    def _otherBucket(self, bucket, fingerprint):
+        return ((fingerprint * 0x5bd1e995 & 0xffffffff) -
+                bucket) % self._number_buckets
+
+    def _slotOf(self, bucket, fingerprint):
+        """Return the index of a slot of the bucket holding the fingerprint,
+        or None."""
+        # Read the whole bucket at once.
+        f = self._fingerprint_bits
+        mask = (1 << f) - 1
+        start = bucket * self._BUCKET_SIZE
+        fingerprints = self._readBits(start * f, self._BUCKET_SIZE * f)
+        for index in xrange(start, start + self._BUCKET_SIZE):
+            if fingerprints & mask == fingerprint:
+                return index
+            fingerprints >>= f
+        return None
+
+    def add(self, x):
+        """Add the key x.
+
+        Raises:
+            RuntimeError: If the filter is too full to place x. The filter is
+                left unchanged.
+        """
+        fingerprint, first = self._fingerprintAndBucket(x)
+        second = self._otherBucket(first, fingerprint)
+        for bucket in (first, second):
+            index = self._slotOf(bucket, 0)
+            if index is not None:
+                self._setSlot(index, fingerprint)
+                self._count += 1
+                return
+        # Kick the fingerprints out, remembering them to undo on failure.
+        kicked = []
+        bucket = self._random.choice((first, second))
+        for _ in xrange(self._MAX_KICKS):
+            index = (bucket * self._BUCKET_SIZE +
+                     self._random.randrange(self._BUCKET_SIZE))
+            kicked.append(index)
+            fingerprint = self._swap(index, fingerprint)
+            bucket = self._otherBucket(bucket, fingerprint)
+            index = self._slotOf(bucket, 0)
+            if index is not None:
+                self._setSlot(index, fingerprint)
+                self._count += 1
+                return
+        for index in reversed(kicked):
+            fingerprint = self._swap(index, fingerprint)
+        raise RuntimeError('Out of storage of the cuckoo filter.')
+
+    def _swap(self, index, fingerprint):
+        """Store the fingerprint in the slot, and return the old one."""
+        old = self._slot(index)
+        self._setSlot(index, fingerprint)
+        return old
+
+    def contains(self, x):
+        """Return False if x is not in the set, and True if it may be."""
+        fingerprint, first = self._fingerprintAndBucket(x)
+        return (self._slotOf(first, fingerprint) is not None or
+                self._slotOf(self._otherBucket(first, fingerprint),
+                             fingerprint) is not None)
+
+    def __contains__(self, x):
+        return self.contains(x)
+
+    def remove(self, x):
+        """Remove the key x, which must have been added.
+
+        Removing a key which has not been added may remove the fingerprint of
+        another key, which would then be reported absent.
+
+        Raises:
+            ValueError: If the fingerprint of x is not in the filter.
+        """
+        fingerprint, first = self._fingerprintAndBucket(x)
+        for bucket in (first, self._otherBucket(first, fingerprint)):
+            index = self._slotOf(bucket, fingerprint)
+            if index is not None:
+                self._setSlot(index, 0)
+                self._count -= 1
+                return
+        raise ValueError('{} is not contained in the filter.'.format(x))
+
+    def __len__(self):
+        return self._count
+
+    def loadFactor(self):
+        return self._count / (self._number_buckets * self._BUCKET_SIZE)
+
+    def storageBytes(self):
+        return len(self._slots)
+
+    def toBytes(self):
+        """Serialize the filter, the hash function excluded."""
+        return self._HEADER.pack(self._MAGIC, self._fingerprint_bits,
+                                 self._number_buckets,
+                                 self._count) + bytes(self._slots)
+
+    @classmethod
+    def fromBytes(cls, data, hash_function=fnv1aHash):
+        """Rebuild a filter serialized by toBytes(), see
+        BloomFilter.fromBytes().
+
+        Raises:
+            ValueError: If data is not a serialized cuckoo filter.
+        """
+        magic, fingerprint_bits, number_buckets, count = (
+            cls._HEADER.unpack_from(data))
+        if magic != cls._MAGIC:
+            raise ValueError('data is not a serialized CuckooFilter.')
+        cuckoo_filter = cls.__new__(cls)
+        slots = _bufferView(data, cls._HEADER.size)
+        cuckoo_filter._setUp(slots, number_buckets, fingerprint_bits, count,
+                             hash_function)
+        return cuckoo_filter
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
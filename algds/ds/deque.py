@@ -15,17 +15,55 @@ __date__ = '2017-07-26'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-26'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
+import numbers
+
+_BLOCK_SIZE = 64
+
+
+class _Block(object):
+    """A fixed-size chunk of the deque.
+
+    Attributes:
+        items (list): _BLOCK_SIZE slots, only part of which may be used.
+        prev (_Block): Neighbor block towards the rear.
+        next (_Block): Neighbor block towards the front.
+    """
+    __slots__ = ('items', 'prev', 'next')
+
+    def __init__(self):
+        self.items = [None] * _BLOCK_SIZE
+        self.prev = None
+        self.next = None
+
 
 class Deque(object):
     """Implementation of a deque.
 
-    We will use list to build the internal representation of the deque.
+    We use a doubly linked list of fixed-size blocks to build the internal
+    representation of the deque. The rear is the first used slot of the
+    leftmost block, and the front is the last used slot of the rightmost
+    block. Adding or removing an item at either end only moves an index, and
+    allocates or releases a whole block once every _BLOCK_SIZE operations.
+    Hence all of addRear, addFront, removeRear and removeFront take O(1) time.
+
+    Items are indexed from the rear to the front, i.e., d[0] is the rear and
+    d[-1] is the front. Random access walks the blocks from the nearer end,
+    which takes O(n/B) time, where B is _BLOCK_SIZE.
+
+    If maxlen is given, the deque is bounded. Once it is full, adding an item
+    at one end discards an item from the opposite end, which is handy for
+    sliding windows.
 
     Attributes:
-        _items (list)
+        _left (_Block): The block containing the rear.
+        _right (_Block): The block containing the front.
+        _left_index (int): Index of the rear in _left.
+        _right_index (int): Index of the front in _right.
+        _size (int): Number of items in the deque.
+        _maxlen (int/None): Maximum number of items, None if unbounded.
 
     >>> d = Deque()
     >>> d.isEmpty()
@@ -43,27 +81,199 @@ class Deque(object):
     8.4
     >>> d.removeFront()
     True
+    >>> d = Deque(range(10))
+    >>> d[0], d[-1], d[4]
+    (0, 9, 4)
+    >>> d.rotate(3)
+    >>> list(d)
+    [7, 8, 9, 0, 1, 2, 3, 4, 5, 6]
+    >>> d.rotate(-3)
+    >>> list(d)
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    >>> window = Deque(maxlen=3)
+    >>> for x in range(5):
+    ...     window.addFront(x)
+    >>> list(window)
+    [2, 3, 4]
     """
-    def __init__(self):
-        self._items = []
+    def __init__(self, iterable=(), maxlen=None):
+        """Initialize the deque.
+
+        Args:
+            iterable [()]: Items to be added from the rear to the front.
+            maxlen (int/None) [None]: Maximum number of items. None means the
+                deque is unbounded.
+
+        Raises:
+            ValueError: If maxlen is not valid.
+        """
+        if maxlen is not None and (
+                not isinstance(maxlen, numbers.Integral) or maxlen < 0):
+            raise ValueError('maxlen should be int >= 0.')
+        self._maxlen = maxlen
+        self._reset()
+        for x in iterable:
+            self.addFront(x)
+
+    def _reset(self):
+        """Make the deque empty with a single block.
+
+        The indices start in the middle of the block, so that the first few
+        items can be added to either end without allocating a new block.
+        """
+        self._left = self._right = _Block()
+        self._left_index = _BLOCK_SIZE // 2 + 1
+        self._right_index = _BLOCK_SIZE // 2
+        self._size = 0
+
+    @property
+    def maxlen(self):
+        return self._maxlen
 
     def isEmpty(self):
-        return self._items == []
+        return self._size == 0
 
     def size(self):
-        return len(self._items)
+        return self._size
+
+    def __len__(self):
+        return self._size
 
     def addRear(self, x):
-        self._items.insert(0, x)
+        if self._maxlen == 0:
+            return
+        if self._left_index == 0:
+            block = _Block()
+            block.next = self._left
+            self._left.prev = block
+            self._left = block
+            self._left_index = _BLOCK_SIZE
+        self._left_index -= 1
+        self._left.items[self._left_index] = x
+        self._size += 1
+        if self._maxlen is not None and self._size > self._maxlen:
+            self.removeFront()
 
     def addFront(self, x):
-        self._items.append(x)
+        if self._maxlen == 0:
+            return
+        if self._right_index == _BLOCK_SIZE - 1:
+            block = _Block()
+            block.prev = self._right
+            self._right.next = block
+            self._right = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right.items[self._right_index] = x
+        self._size += 1
+        if self._maxlen is not None and self._size > self._maxlen:
+            self.removeRear()
 
     def removeRear(self):
-        return self._items.pop(0)
+        """Remove and return the rear item.
+
+        Raises:
+            IndexError: If the deque is empty.
+        """
+        if self._size == 0:
+            raise IndexError('remove from an empty deque.')
+        x = self._left.items[self._left_index]
+        self._left.items[self._left_index] = None
+        self._left_index += 1
+        self._size -= 1
+        if self._size == 0:
+            self._reset()
+        elif self._left_index == _BLOCK_SIZE:
+            # The leftmost block is used up, release it.
+            self._left = self._left.next
+            self._left.prev = None
+            self._left_index = 0
+        return x
 
     def removeFront(self):
-        return self._items.pop()
+        """Remove and return the front item.
+
+        Raises:
+            IndexError: If the deque is empty.
+        """
+        if self._size == 0:
+            raise IndexError('remove from an empty deque.')
+        x = self._right.items[self._right_index]
+        self._right.items[self._right_index] = None
+        self._right_index -= 1
+        self._size -= 1
+        if self._size == 0:
+            self._reset()
+        elif self._right_index == -1:
+            # The rightmost block is used up, release it.
+            self._right = self._right.prev
+            self._right.next = None
+            self._right_index = _BLOCK_SIZE - 1
+        return x
+
+    def _locate(self, i):
+        """Return the block and the index in the block of the i-th item.
+
+        We walk the blocks from whichever end is nearer to the item.
+
+        Raises:
+            IndexError: If i is out of range.
+        """
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('deque index out of range.')
+        if i < self._size // 2:
+            block = self._left
+            i += self._left_index
+            while i >= _BLOCK_SIZE:
+                block = block.next
+                i -= _BLOCK_SIZE
+        else:
+            block = self._right
+            i = self._right_index - (self._size - 1 - i)
+            while i < 0:
+                block = block.prev
+                i += _BLOCK_SIZE
+        return block, i
+
+    def __getitem__(self, i):
+        block, i = self._locate(i)
+        return block.items[i]
+
+    def __setitem__(self, i, x):
+        block, i = self._locate(i)
+        block.items[i] = x
+
+    def __iter__(self):
+        """Iterate from the rear to the front."""
+        block = self._left
+        start = self._left_index
+        remaining = self._size
+        while remaining > 0:
+            stop = min(_BLOCK_SIZE, start + remaining)
+            for j in xrange(start, stop):
+                yield block.items[j]
+            remaining -= stop - start
+            block = block.next
+            start = 0
+
+    def rotate(self, k=1):
+        """Rotate the deque k steps towards the front.
+
+        That is, the k front items are moved to the rear. If k is negative,
+        rotate towards the rear instead. We always move the smaller part, so
+        it takes O(min(k, n - k)) time.
+        """
+        if self._size <= 1:
+            return
+        k %= self._size
+        if k <= self._size // 2:
+            for _ in xrange(k):
+                self.addRear(self.removeFront())
+        else:
+            for _ in xrange(self._size - k):
+                self.addFront(self.removeRear())
 
 
 def test():
@@ -5,16 +5,49 @@ Searching in a hash table can take O(1) time.
 
 from __future__ import division, print_function
 
-__all__ = ['HashTable']
+__all__ = ['HashTable', 'IntHashTable', 'QuadraticHashTable', 'DoubleHashTable',
+           'RobinHoodHashTable', 'CuckooHashTable', 'ChainedHashTable',
+           'compareHashFunctions']
 __author__ = 'Hao Zhang'
 __copyright__ = 'Copyright @2017'
 __date__ = '2017-07-28'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-28'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
+import array
+import numbers
+import random
+import sys
+sys.path.append('../../')
+
+from algds.ds.bloom import BloomFilter
+from algds.ds.hashfunc import (builtinHash, fnv1aHash, foldingHash,
+                               polynomialHash, sipHash)
+
+
+def _hashTypecode():
+    """Return the typecode of 64-bit signed integers of array.array.
+
+    The typecode 'q' is not available before Python 3.3, where 'l' is 64-bit
+    on most 64-bit platforms.
+    """
+    try:
+        array.array('q')
+        return 'q'
+    except ValueError:
+        return 'l'
+
+
+_HASH_TYPECODE = _hashTypecode()
+# The cached hash values are the hash values truncated to be non-negative
+# signed integers, so that the negative ones can mark the state of a slot.
+_HASH_MASK = (1 << (8 * array.array(_HASH_TYPECODE).itemsize - 1)) - 1
+_EMPTY = -1
+_DELETED = -2
+
 
 class HashTable(object):
     """We create a hash table by using a list.
@@ -22,8 +55,46 @@ class HashTable(object):
     The collisions are resolved by open addressing, to be more precise, linear
     probing.
 
+    The load factor is the fraction of the slots in use. Once it would exceed
+    max_load_factor, the table grows to a prime number of slots at least twice
+    as many, and all the key-value pairs are inserted again. Since the number
+    of slots grows geometrically, inserting n pairs takes O(n) time in total,
+    i.e., amortized O(1) for each insertion.
+
+    The keys can be of any hashable type supported by the hash function. The
+    default builtinHash is computed in C, and is several times faster than
+    the hash functions written in Python, such as FNV-1a or the keyed
+    SipHash, see algds.ds.hashfunc. probeStats() tells how well a hash
+    function does on a given set of keys.
+
+    Linear probing suffers from primary clustering: keys hashed into a run of
+    used slots extend the run, so the probe sequences get long as the table
+    fills up. The subclasses below resolve the collisions in other ways behind
+    the same interface.
+
+    The slots are stored as a struct of arrays: the keys, the values and the
+    cached hash values live in three parallel arrays, and slot i is made of
+    their i-th elements. Compared with one [key, value] list for each slot,
+    there are no per-slot objects at all. The hash values are kept in an
+    array.array of machine integers, which also records whether a slot is
+    empty (_EMPTY) or deleted (_DELETED). Comparing the cached hash values
+    first skips most key comparisons, and growing the table needs no hashing.
+
+    If most lookups are for absent keys, attachFilter() puts a membership
+    filter in front of the table, which rejects most of them without probing.
+
     Attributes:
-        _slots (list): Store the key-value pairs.
+        _keys (list): The key of each slot.
+        _values (list): The value of each slot.
+        _hashes (array.array): The hash value of the key of each slot, or
+            _EMPTY/_DELETED.
+        _size (int): Number of key-value pairs.
+        _used (int): Number of slots which are not empty, i.e., containing
+            either a key-value pair or a deleted marker.
+        _max_load_factor (float): Grow the table beyond this load factor.
+        _hash_function (callable): Map a key to a non-negative int.
+        _filter (BloomFilter/CuckooFilter/None): Membership filter of the keys
+            consulted before the lookups, see attachFilter().
 
     >>> h = HashTable()
     >>> h[54] = 'cat'
@@ -44,65 +115,164 @@ class HashTable(object):
     duck
     >>> print(h[99])
     None
+    >>> len(h)
+    9
+    >>> 17 in h
+    True
+    >>> del h[17]
+    >>> 17 in h
+    False
+    >>> del h[17]
+    Traceback (most recent call last):
+        ...
+    KeyError: 17
+    >>> sorted(h.items())[:3]
+    [(20, 'duck'), (25, 'pig'), (26, 'dog')]
+    >>> sorted(h)
+    [20, 25, 26, 31, 44, 54, 77, 93]
     """
-    def __init__(self, number_slots=11):
-        self._slots = [[None, None] for _ in xrange(number_slots)]
+    # Upper bound of max_load_factor.
+    _LOAD_FACTOR_LIMIT = 1
+    # Contents of the key and the value of a slot without key-value pair.
+    _NO_KEY = None
+    _NO_VALUE = None
+    _filter = None
+
+    def __init__(self, number_slots=11, max_load_factor=0.75,
+                 hash_function=builtinHash):
+        """Initialize an empty hash table.
+
+        Args:
+            number_slots (int) [11]: Initial number of slots.
+            max_load_factor (float) [0.75]: Grow the table beyond this load
+                factor, should be in (0, 1].
+            hash_function (callable) [builtinHash]: Map a key to an int,
+                see algds.ds.hashfunc.
+
+        Raises:
+            ValueError: If the arguments are not valid.
+        """
+        if (not isinstance(number_slots, numbers.Integral) or
+                number_slots < 1):
+            raise ValueError('number_slots should be int >= 1.')
+        if not 0 < max_load_factor <= self._LOAD_FACTOR_LIMIT:
+            raise ValueError('max_load_factor should be in (0, {}].'.format(
+                self._LOAD_FACTOR_LIMIT))
+        self._max_load_factor = max_load_factor
+        self._hash_function = hash_function
+        self._allocate(self._tableSize(number_slots))
+        self._size = 0
+        self._used = 0
+
+    def _allocate(self, number_slots):
+        """Create the empty slots."""
+        self._keys = [self._NO_KEY] * number_slots
+        self._values = [self._NO_VALUE] * number_slots
+        self._hashes = array.array(_HASH_TYPECODE, [_EMPTY]) * number_slots
+
+    def _tableSize(self, n):
+        """Return the number of slots to use for at least n slots."""
+        return _nextPrime(n)
+
+    def capacity(self):
+        """Return the number of slots."""
+        return len(self._hashes)
+
+    def _hashOf(self, key):
+        """Return the hash value of the key to be cached."""
+        return self._hash_function(key) & _HASH_MASK
 
     def _hash(self, key):
-        """Copmute hash value for the key.
+        """Compute the home slot of the key, i.e., the hash value modulo the
+        number of slots."""
+        return self._hashOf(key) % self.capacity()
+
+    def _probeStart(self, hash_value):
+        """Return (home slot, step, increment) of the probe sequence of a key
+        with the hash value. The step is added to the index after each probe,
+        and the increment to the step.
 
-        When key is string, we use the folding method the compute the hash
-        value. It begins by dividing the element into equal-size pieces (the
-        last piece may not be of equal size). These pieces are then added
-        together to give the resulting hash value, e.g., 4365554601 ->
-        43 + 65 + 55 + 46 + 01 = 210, and then module the slot numbers.
+        Linear probing looks for the next slot, one by one.
+        """
+        return hash_value % len(self._hashes), 1, 0
 
-        We can create hash functions for character-based items such as strings.
-        The word "cat" can be thought of as a sequence of ordinal values:
-        ord('c') == 99, ord('a') == 97, and ord('t') == 116. Note that anagrams
-        will always be given the same hash value.
+    def _probeIndices(self, hash_value):
+        """Generate the indices of the slots to be examined in order, for a key
+        with the hash value.
 
-        Args:
-            key (str/int)
+        The lookups and the insertions inline this loop, which saves creating
+        a generator for each of them.
+        """
+        n = len(self._hashes)
+        index, step, increment = self._probeStart(hash_value)
+        for _ in xrange(n):
+            yield index
+            index = (index + step) % n
+            step += increment
 
-        Raises:
-            ValueError: If the key type is not valid.
+    def _find(self, key):
+        """Return the index of the slot containing key, or None otherwise.
+
+        Deleted slots do not stop the probing, since key may have been placed
+        after them. Only an empty slot does.
         """
-        if isinstance(key, str):
-            # TODO (Hao): Use the position of the character as a weight.
-            return sum([ord(ch) for ch in key]) % len(self._slots)
-        if isinstance(key, int):
-            return key % len(self._slots)
-        else:
-            raise ValueError('key type should be str/int.')
+        hash_value = self._hashOf(key)
+        hashes = self._hashes
+        keys = self._keys
+        n = len(hashes)
+        index, step, increment = self._probeStart(hash_value)
+        for _ in xrange(n):
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY:
+                return None
+            if slot_hash == hash_value and keys[index] == key:
+                return index
+            index = (index + step) % n
+            step += increment
+        return None
 
     def __setitem__(self, key, val):
         """Add a new key-value pair to the hash table.
 
         If the key is already in the map, then replace the old value with the
-        new one.
+        new one. Otherwise the pair is put into the first deleted or empty slot
+        along the probe sequence.
 
         Args:
-            key (int/str)
+            key
             val
-
-        Raises:
-            RuntimeError: If the slots are out of storage.
-        """
-        hash_value = self._hash(key)
-        new_hash_value = None
-        for i in xrange(len(self._slots)):
-            new_hash_value = (hash_value + i) % len(self._slots)
-            if self._slots[new_hash_value][0] is None:
-                # The slot is not used.
-                self._slots[new_hash_value][0] = key
-                self._slots[new_hash_value][1] = val
-                return
-            if self._slots[new_hash_value][0] == key:
+        """
+        if self._used + 1 > self._max_load_factor * self.capacity():
+            self._grow()
+        hash_value = self._hashOf(key)
+        hashes = self._hashes
+        n = len(hashes)
+        index, step, increment = self._probeStart(hash_value)
+        first_deleted = None
+        for _ in xrange(n):
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY:
+                # The key is not in the table.
+                break
+            if slot_hash == _DELETED:
+                if first_deleted is None:
+                    first_deleted = index
+            elif slot_hash == hash_value and self._keys[index] == key:
                 # Replace the old value.
-                self._slots[new_hash_value][1] = val
+                self._values[index] = val
                 return
-        raise RuntimeError('Out of storage of the slots.')
+            index = (index + step) % n
+            step += increment
+        self._filterAdd(key)
+        if first_deleted is not None:
+            # Reuse the deleted slot, which does not change _used.
+            index = first_deleted
+        else:
+            self._used += 1
+        self._keys[index] = key
+        self._values[index] = val
+        self._hashes[index] = hash_value
+        self._size += 1
 
     def __getitem__(self, key):
         """Given a key.
@@ -110,27 +280,780 @@ class HashTable(object):
         Return the value stored in the hash table or None otherwise.
 
         Args:
-            key (int/str)
+            key
+        """
+        if not self._mayContain(key):
+            return None
+        index = self._find(key)
+        if index is None:
+            return None
+        return self._values[index]
+
+    def __delitem__(self, key):
+        """Delete the key-value pair from the hash table using 'del h[key]'.
+
+        We cannot simply empty the slot, since that would cut the probe
+        sequences of the keys placed after it. Instead we leave a deleted marker
+        (tombstone), which lookups skip and insertions reuse. The markers are
+        dropped when the table is rebuilt.
+
+        Raises:
+            KeyError: If the key is not in the hash table.
+        """
+        index = self._find(key)
+        if index is None:
+            raise KeyError(key)
+        self._keys[index] = self._NO_KEY
+        self._values[index] = self._NO_VALUE
+        self._hashes[index] = _DELETED
+        self._size -= 1
+        self._filterRemove(key)
+
+    def __contains__(self, key):
+        """For the statement 'key in d'."""
+        return self._mayContain(key) and self._find(key) is not None
+
+    def attachFilter(self, filter_=None, error_rate=0.01):
+        """Consult a membership filter before each lookup.
+
+        A lookup of an absent key probes the table until an empty slot, which
+        is several probes at a high load factor. The filter rejects most of
+        the absent keys with a few bit tests instead, and the others are
+        looked up as usual, so the results do not change. The insertions add
+        their keys to the filter. A BloomFilter cannot remove keys, so the
+        deleted keys keep passing it, while a CuckooFilter removes them.
+
+        The filter is sized for a fixed number of keys: the default one for
+        twice the current keys or the number of slots, whichever is more. A
+        table growing beyond that should be given a larger filter.
+
+        Args:
+            filter_ (BloomFilter/CuckooFilter/None) [None]: An empty filter.
+                None means a new BloomFilter.
+            error_rate (float) [0.01]: False-positive rate of the new
+                BloomFilter.
+
+        Returns:
+            The filter, holding all the keys of the table.
+
+        >>> h = HashTable()
+        >>> for i in range(100):
+        ...     h[i] = str(i)
+        >>> f = h.attachFilter()
+        >>> h[42], h[100], 100 in h, len(f)
+        ('42', None, False, 100)
+        >>> h[100] = '100'
+        >>> 100 in h, 100 in f
+        (True, True)
+
+        An insertion fails without changing the table when a CuckooFilter is
+        full:
+
+        >>> from algds.ds.bloom import CuckooFilter
+        >>> h = HashTable()
+        >>> f = h.attachFilter(CuckooFilter(8))
+        >>> for i in range(17):
+        ...     h[i] = i
+        Traceback (most recent call last):
+            ...
+        RuntimeError: Out of storage of the cuckoo filter.
+        >>> len(h) == len(f), all(h[k] == k and k in h for k in h)
+        (True, True)
+        """
+        if filter_ is None:
+            filter_ = BloomFilter(max(2 * len(self), self.capacity()),
+                                  error_rate)
+        for key in self:
+            filter_.add(key)
+        self._filter = filter_
+        return filter_
+
+    def _mayContain(self, key):
+        """Return False if the filter rules the key out."""
+        return self._filter is None or key in self._filter
+
+    def _filterAdd(self, key):
+        """Record a new key in the filter.
+
+        It is called before the key is stored, so that if a full filter
+        raises, the table is left unchanged, and the filter never misses a
+        key of the table.
+        """
+        if self._filter is not None:
+            self._filter.add(key)
+
+    def _filterRemove(self, key):
+        """Remove a deleted key from the filter, if it can remove keys."""
+        if self._filter is not None and hasattr(self._filter, 'remove'):
+            self._filter.remove(key)
+
+    def __len__(self):
+        return self._size
+
+    def _indices(self):
+        """Generate the indices of the slots holding a key-value pair."""
+        for index, slot_hash in enumerate(self._hashes):
+            if slot_hash >= 0:
+                yield index
+
+    def __iter__(self):
+        """Iterate over the keys in slot order."""
+        for index in self._indices():
+            yield self._keys[index]
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self._values[index] for index in self._indices()]
+
+    def items(self):
+        return [(self._keys[index], self._values[index])
+                for index in self._indices()]
+
+    def loadFactor(self):
+        return self._size / self.capacity()
+
+    def storageBytes(self):
+        """Return the number of bytes taken by the slots.
+
+        It counts the containers of the slots, but not the key and value
+        objects referred to by them.
+        """
+        return (sys.getsizeof(self._keys) + sys.getsizeof(self._values) +
+                sys.getsizeof(self._hashes))
+
+    def _probeLength(self, key):
+        """Return the number of slots examined to find the key."""
+        target = self._find(key)
+        for count, index in enumerate(self._probeIndices(self._hashOf(key))):
+            if index == target:
+                return count + 1
+
+    def _missLength(self, hash_value):
+        """Return the number of slots examined to find out that a key with the
+        hash value is not in the table."""
+        count = 0
+        for index in self._probeIndices(hash_value):
+            count += 1
+            if self._hashes[index] == _EMPTY:
+                break
+        return count
+
+    def probeStats(self):
+        """Report how well the keys are spread over the slots.
+
+        The probe length of a key is the number of slots examined by a
+        successful search for it. The miss length is the number of slots
+        examined by an unsuccessful search, which is averaged over the home
+        slots (at most 10000 evenly spaced ones) with random hash values.
+
+        Returns:
+            dict: With keys
+                'size': Number of key-value pairs.
+                'slots': Number of slots.
+                'load_factor': size / slots.
+                'collisions': Number of keys not found at the first probe.
+                'average_probe_length': Mean probe length of the keys.
+                'max_probe_length': Longest probe length of the keys.
+                'average_miss_length': Mean miss length.
+        """
+        probe_lengths = [self._probeLength(key) for key in self]
+        n = self.capacity()
+        number_homes = min(n, 10000)
+        generator = random.Random(0)
+        miss_lengths = [
+            self._missLength(i * n // number_homes +
+                             n * generator.randrange(1 << 32))
+            for i in xrange(number_homes)]
+        return {
+            'size': self._size,
+            'slots': n,
+            'load_factor': self.loadFactor(),
+            'collisions': sum(1 for l in probe_lengths if l > 1),
+            'average_probe_length': (sum(probe_lengths) / len(probe_lengths)
+                                     if probe_lengths else 0),
+            'max_probe_length': max(probe_lengths) if probe_lengths else 0,
+            'average_miss_length': sum(miss_lengths) / len(miss_lengths),
+        }
+
+    def reserve(self, n):
+        """Pre-size the table, so that n key-value pairs can be held without
+        growing again."""
+        needed = int(n / self._max_load_factor) + 1
+        if needed > self.capacity():
+            self._rebuild(self._tableSize(needed))
+
+    def _grow(self):
+        """Make room for more key-value pairs.
+
+        If many slots are only occupied by deleted markers, rebuilding at the
+        same size is enough to get rid of them.
+        """
+        if self._size + 1 <= self._max_load_factor * self.capacity() / 2:
+            self._rebuild(self._tableSize(self.capacity()))
+        else:
+            self._rebuild(self._tableSize(2 * self.capacity()))
+
+    def _entries(self):
+        """Return the (key, value, hash value) triples of the table."""
+        return [(self._keys[index], self._values[index], self._hashes[index])
+                for index in self._indices()]
+
+    def _rebuild(self, number_slots):
+        """Insert all the key-value pairs again into number_slots slots.
+
+        The cached hash values are reused, so no key is hashed again.
         """
-        hash_value = self._hash(key)
-        new_hash_value = None
-        for i in xrange(len(self._slots)):
-            new_hash_value = (hash_value + i) % len(self._slots)
-            if self._slots[new_hash_value][0] is None:
+        entries = self._entries()
+        self._allocate(number_slots)
+        for key, val, hash_value in entries:
+            self._insertNew(key, val, hash_value)
+        self._size = len(entries)
+        self._used = len(entries)
+
+    def _insertNew(self, key, val, hash_value):
+        """Insert a key known not to be in the table, when there is neither a
+        deleted marker nor a need to grow."""
+        hashes = self._hashes
+        n = len(hashes)
+        index, step, increment = self._probeStart(hash_value)
+        while hashes[index] != _EMPTY:
+            index = (index + step) % n
+            step += increment
+        self._keys[index] = key
+        self._values[index] = val
+        hashes[index] = hash_value
+
+
+class IntHashTable(HashTable):
+    """Hash table specialised for integer keys and numeric values.
+
+    The keys and the values are stored in array.array of machine numbers
+    instead of lists of references to int objects. Each slot then takes 24
+    bytes in all (8 bytes each for the key, the value and the hash value),
+    and a key-value pair needs no Python object at all. The keys should fit in
+    a signed 64-bit integer, and the values in value_typecode.
+
+    >>> h = IntHashTable()
+    >>> for i in range(1000):
+    ...     h[i] = i * i
+    >>> h[999], len(h), 1000 in h, h[1000] is None
+    (998001, 1000, False, True)
+    >>> del h[999]
+    >>> len(h), 999 in h
+    (999, False)
+    >>> h = IntHashTable(value_typecode='d')
+    >>> h[3] = 0.5
+    >>> h[3]
+    0.5
+    """
+    _NO_KEY = 0
+    _NO_VALUE = 0
+
+    def __init__(self, number_slots=11, max_load_factor=0.75,
+                 hash_function=builtinHash, value_typecode=_HASH_TYPECODE):
+        """Initialize an empty hash table.
+
+        Args:
+            value_typecode (str) [_HASH_TYPECODE]: Typecode of the values,
+                e.g., 'q' for 64-bit integers or 'd' for floats.
+
+        See HashTable.__init__() for the other arguments.
+        """
+        self._value_typecode = value_typecode
+        HashTable.__init__(self, number_slots, max_load_factor, hash_function)
+
+    def _allocate(self, number_slots):
+        self._keys = array.array(_HASH_TYPECODE, [0]) * number_slots
+        self._values = array.array(self._value_typecode, [0]) * number_slots
+        self._hashes = array.array(_HASH_TYPECODE, [_EMPTY]) * number_slots
+
+
+class QuadraticHashTable(HashTable):
+    """Open addressing with quadratic probing.
+
+    Instead of looking at the next slot, the i-th probe skips i slots further
+    from the previous one, i.e., the offsets from the home slot are the
+    triangular numbers 0, 1, 3, 6, 10, .... Keys hashed into the same cluster
+    soon jump out of it, which avoids primary clustering. When the number of
+    slots is a power of two, the probe sequence visits every slot.
+
+    >>> h = QuadraticHashTable()
+    >>> for i in range(100):
+    ...     h[i] = i * i
+    >>> h[7], len(h), 100 in h
+    (49, 100, False)
+    >>> del h[7]
+    >>> print(h[7])
+    None
+    """
+    def _tableSize(self, n):
+        size = 1
+        while size < n:
+            size *= 2
+        return size
+
+    def _probeStart(self, hash_value):
+        return hash_value % len(self._hashes), 1, 1
+
+
+class DoubleHashTable(HashTable):
+    """Open addressing with double hashing.
+
+    The step between probes is derived from the higher part of the hash value,
+    so keys sharing the home slot most likely follow different probe
+    sequences. It avoids both primary and secondary clustering. Since the
+    number of slots is a prime, every step in [1, n - 1] visits every slot.
+
+    >>> h = DoubleHashTable()
+    >>> for i in range(100):
+    ...     h[str(i)] = i
+    >>> h['42'], len(h), '100' in h
+    (42, 100, False)
+    """
+    def _probeStart(self, hash_value):
+        n = len(self._hashes)
+        step = 1 + (hash_value // n) % (n - 1) if n > 1 else 1
+        return hash_value % n, step, 0
+
+
+class RobinHoodHashTable(HashTable):
+    """Open addressing with Robin Hood hashing.
+
+    It is linear probing, except that when the key being inserted is farther
+    from its home slot than the key occupying a slot, they swap, and we go on
+    inserting the evicted key. The distance of each key to its home slot is
+    thereby evened out, and the longest probe sequence stays short even at a
+    high load factor.
+
+    The distances along a probe sequence never decrease by more than one, so
+    a lookup stops as soon as it meets a key closer to its home slot than the
+    searched one would be. Deletion shifts the following keys back by one slot
+    until a key at its home slot or an empty slot, so no deleted marker is
+    needed. The distances are computed from the cached hash values.
+
+    >>> h = RobinHoodHashTable()
+    >>> for i in range(100):
+    ...     h['key%d' % i] = i
+    >>> h['key42'], len(h), 'key100' in h
+    (42, 100, False)
+    >>> for i in range(0, 100, 2):
+    ...     del h['key%d' % i]
+    >>> len(h), 'key42' in h, h['key43']
+    (50, False, 43)
+    """
+    def _distance(self, index, hash_value):
+        """Return how far the slot index is from the home slot."""
+        return (index - hash_value) % len(self._hashes)
+
+    def _find(self, key):
+        hash_value = self._hashOf(key)
+        hashes = self._hashes
+        n = len(hashes)
+        index = hash_value % n
+        for distance in xrange(n):
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY or self._distance(index,
+                                                     slot_hash) < distance:
                 return None
-            if self._slots[new_hash_value][0] == key:
-                return self._slots[new_hash_value][1]
+            if slot_hash == hash_value and self._keys[index] == key:
+                return index
+            index = (index + 1) % n
         return None
 
+    def __setitem__(self, key, val):
+        index = self._find(key)
+        if index is not None:
+            self._values[index] = val
+            return
+        self._filterAdd(key)
+        if self._size + 1 > self._max_load_factor * self.capacity():
+            self._grow()
+        self._insertNew(key, val, self._hashOf(key))
+        self._size += 1
+        self._used += 1
+
+    def _insertNew(self, key, val, hash_value):
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        n = len(hashes)
+        index = hash_value % n
+        distance = 0
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash == _EMPTY:
+                keys[index] = key
+                values[index] = val
+                hashes[index] = hash_value
+                return
+            slot_distance = self._distance(index, slot_hash)
+            if slot_distance < distance:
+                # Take the slot from the richer key, and go on inserting it.
+                keys[index], key = key, keys[index]
+                values[index], val = val, values[index]
+                hashes[index], hash_value = hash_value, slot_hash
+                distance = slot_distance
+            index = (index + 1) % n
+            distance += 1
+
     def __delitem__(self, key):
-        """Delete the key-value pair from the hash table using 'del h[key]'."""
-        # TODO (Hao): Implement this method.
-        raise NotImplementedError
+        """Delete the key-value pair by backward shifting.
+
+        Raises:
+            KeyError: If the key is not in the hash table.
+        """
+        index = self._find(key)
+        if index is None:
+            raise KeyError(key)
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        n = len(hashes)
+        next_index = (index + 1) % n
+        while (hashes[next_index] != _EMPTY and
+               self._distance(next_index, hashes[next_index]) > 0):
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            hashes[index] = hashes[next_index]
+            index = next_index
+            next_index = (next_index + 1) % n
+        keys[index] = self._NO_KEY
+        values[index] = self._NO_VALUE
+        hashes[index] = _EMPTY
+        self._size -= 1
+        self._used -= 1
+        self._filterRemove(key)
+
+    def _probeLength(self, key):
+        index = self._find(key)
+        return self._distance(index, self._hashes[index]) + 1
+
+    def _missLength(self, hash_value):
+        n = len(self._hashes)
+        index = hash_value % n
+        for distance in xrange(n):
+            slot_hash = self._hashes[index]
+            if slot_hash == _EMPTY or self._distance(index,
+                                                     slot_hash) < distance:
+                return distance + 1
+            index = (index + 1) % n
+        return n
+
+
+class CuckooHashTable(HashTable):
+    """Bucketized cuckoo hashing.
+
+    The slots are grouped into buckets of _BUCKET_SIZE consecutive slots. Each
+    key has two candidate buckets derived from its hash value, and it is always
+    stored in one of them, so a lookup examines at most two buckets. To insert
+    a key whose two buckets are both full, we kick a random key out of one of
+    them and move it to its other bucket, which may kick out another key, and
+    so on. If it goes on for too long, the table grows.
+
+    Keys with the same hash value always share the same two buckets, however
+    large the table is, so at most 2 * _BUCKET_SIZE of them fit. Inserting one
+    more raises RuntimeError and leaves the table unchanged.
+
+    With two candidate buckets of four slots, the table can be filled up to a
+    load factor of about 0.95. The probe lengths count buckets instead of
+    slots.
+
+    Attributes:
+        _random (random.Random): Choose the keys to be kicked out.
+
+    >>> h = CuckooHashTable(max_load_factor=0.9)
+    >>> for i in range(1000):
+    ...     h[i] = -i
+    >>> h[999], len(h), 1000 in h
+    (-999, 1000, False)
+    >>> del h[999]
+    >>> len(h), 999 in h
+    (999, False)
+
+    The anagrams of a string all have the same folding hash value.
+
+    >>> import itertools
+    >>> h = CuckooHashTable(hash_function=foldingHash)
+    >>> words = [''.join(p) for p in itertools.permutations('abcdefg', 7)]
+    >>> for word in words[:8]:
+    ...     h[word] = len(h)
+    >>> h[words[8]] = 8  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    RuntimeError: More than 8 keys share one hash value.
+    >>> len(h), words[8] in h, h[words[7]]
+    (8, False, 7)
+    """
+    _BUCKET_SIZE = 4
+    _MAX_KICKS = 500
+
+    def __init__(self, number_slots=11, max_load_factor=0.9,
+                 hash_function=builtinHash):
+        self._random = random.Random(0)
+        HashTable.__init__(self, number_slots, max_load_factor, hash_function)
+
+    def _tableSize(self, n):
+        # Round up to whole buckets, and at least two buckets.
+        number_buckets = max(-(-n // self._BUCKET_SIZE), 2)
+        return number_buckets * self._BUCKET_SIZE
+
+    def _buckets(self, hash_value):
+        """Return the first slot indices of the two candidate buckets."""
+        m = len(self._hashes) // self._BUCKET_SIZE
+        first = hash_value % m
+        second = (hash_value // m) % m
+        if second == first:
+            second = (first + 1) % m
+        return first * self._BUCKET_SIZE, second * self._BUCKET_SIZE
+
+    def _find(self, key):
+        hash_value = self._hashOf(key)
+        hashes = self._hashes
+        for start in self._buckets(hash_value):
+            for index in xrange(start, start + self._BUCKET_SIZE):
+                if hashes[index] == hash_value and self._keys[index] == key:
+                    return index
+        return None
+
+    def __setitem__(self, key, val):
+        index = self._find(key)
+        if index is not None:
+            self._values[index] = val
+            return
+        hash_value = self._hashOf(key)
+        if self._sharedHash(hash_value):
+            raise RuntimeError('More than {} keys share one hash value.'.format(
+                2 * self._BUCKET_SIZE))
+        self._filterAdd(key)
+        if self._size + 1 > self._max_load_factor * self.capacity():
+            self._grow()
+        self._insertNew(key, val, hash_value)
+        self._size += 1
+        self._used += 1
+
+    def _sharedHash(self, hash_value):
+        """Whether both candidate buckets are full of keys with hash_value.
+
+        Then no table size can fit another such key, and _insertNew() would
+        grow the table forever.
+        """
+        hashes = self._hashes
+        first, second = self._buckets(hash_value)
+        if hashes[first] != hash_value:  # Fast path.
+            return False
+        for start in (first, second):
+            for index in xrange(start, start + self._BUCKET_SIZE):
+                if hashes[index] != hash_value:
+                    return False
+        return True
+
+    def _insertNew(self, key, val, hash_value):
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        for _ in xrange(self._MAX_KICKS):
+            first, second = self._buckets(hash_value)
+            for start in (first, second):
+                for index in xrange(start, start + self._BUCKET_SIZE):
+                    if hashes[index] == _EMPTY:
+                        keys[index] = key
+                        values[index] = val
+                        hashes[index] = hash_value
+                        return
+            index = (self._random.choice((first, second)) +
+                     self._random.randrange(self._BUCKET_SIZE))
+            keys[index], key = key, keys[index]
+            values[index], val = val, values[index]
+            hashes[index], hash_value = hash_value, hashes[index]
+        # The homeless key-value pair is not in the table, so _rebuild() does
+        # not see it. Grow and try again.
+        size = self._size
+        self._rebuild(self._tableSize(2 * self.capacity()))
+        self._insertNew(key, val, hash_value)
+        self._size = self._used = size
+
+    def __delitem__(self, key):
+        index = self._find(key)
+        if index is None:
+            raise KeyError(key)
+        self._keys[index] = self._NO_KEY
+        self._values[index] = self._NO_VALUE
+        self._hashes[index] = _EMPTY
+        self._size -= 1
+        self._used -= 1
+        self._filterRemove(key)
+
+    def _probeLength(self, key):
+        first, _ = self._buckets(self._hashOf(key))
+        if first <= self._find(key) < first + self._BUCKET_SIZE:
+            return 1
+        return 2
+
+    def _missLength(self, hash_value):
+        return 2
+
+
+class ChainedHashTable(HashTable):
+    """Separate chaining.
+
+    Each slot holds a list (chain) of the [key, value] pairs hashed into it.
+    The chains never overflow, so the load factor may exceed one, and deletion
+    simply removes the pair from its chain. The probe lengths count the pairs
+    examined along the chain, plus one for reaching the slot.
+
+    Attributes:
+        _slots (list): The chains.
+
+    >>> h = ChainedHashTable(max_load_factor=2)
+    >>> for i in range(100):
+    ...     h[i] = str(i)
+    >>> h[42], len(h), 100 in h
+    ('42', 100, False)
+    >>> del h[42]
+    >>> 42 in h
+    False
+    """
+    _LOAD_FACTOR_LIMIT = float('inf')
+
+    def _allocate(self, number_slots):
+        self._slots = [[] for _ in xrange(number_slots)]
+
+    def capacity(self):
+        return len(self._slots)
+
+    def _hash(self, key):
+        return self._hash_function(key) % len(self._slots)
+
+    def _findEntry(self, key):
+        for entry in self._slots[self._hash(key)]:
+            if entry[0] == key:
+                return entry
+        return None
+
+    def __setitem__(self, key, val):
+        entry = self._findEntry(key)
+        if entry is not None:
+            entry[1] = val
+            return
+        self._filterAdd(key)
+        if self._size + 1 > self._max_load_factor * self.capacity():
+            self._grow()
+        self._slots[self._hash(key)].append([key, val])
+        self._size += 1
+        self._used += 1
+
+    def __getitem__(self, key):
+        if not self._mayContain(key):
+            return None
+        entry = self._findEntry(key)
+        if entry is None:
+            return None
+        return entry[1]
 
     def __contains__(self, key):
-        """For the statement 'key in d'."""
-        # TODO (Hao): Implement this method.
-        raise NotImplementedError
+        return self._mayContain(key) and self._findEntry(key) is not None
+
+    def __delitem__(self, key):
+        chain = self._slots[self._hash(key)]
+        for i, entry in enumerate(chain):
+            if entry[0] == key:
+                del chain[i]
+                self._size -= 1
+                self._used -= 1
+                self._filterRemove(key)
+                return
+        raise KeyError(key)
+
+    def __iter__(self):
+        for chain in self._slots:
+            for entry in chain:
+                yield entry[0]
+
+    def values(self):
+        return [entry[1] for chain in self._slots for entry in chain]
+
+    def items(self):
+        return [(entry[0], entry[1]) for chain in self._slots
+                for entry in chain]
+
+    def storageBytes(self):
+        return sys.getsizeof(self._slots) + sum(
+            sys.getsizeof(chain) + sum(sys.getsizeof(entry) for entry in chain)
+            for chain in self._slots)
+
+    def _rebuild(self, number_slots):
+        entries = [entry for chain in self._slots for entry in chain]
+        self._allocate(number_slots)
+        for entry in entries:
+            self._slots[self._hash(entry[0])].append(entry)
+
+    def _probeLength(self, key):
+        for count, entry in enumerate(self._slots[self._hash(key)]):
+            if entry[0] == key:
+                return count + 2
+
+    def _missLength(self, hash_value):
+        return len(self._slots[hash_value % len(self._slots)]) + 1
+
+
+def compareHashFunctions(keys, hash_functions=None, max_load_factor=0.75):
+    """Insert the same keys with each hash function and report the probe
+    statistics, so that a hash function can be chosen on real keys.
+
+    Besides HashTable.probeStats(), the report also counts 'hash_collisions',
+    i.e., the number of keys sharing their full hash value with an earlier key,
+    which no table size can separate.
+
+    Args:
+        keys (list): Distinct keys.
+        hash_functions (dict/None) [None]: Map a name to a hash function.
+            Defaults to all the hash functions in algds.ds.hashfunc.
+        max_load_factor (float) [0.75]
+
+    Returns:
+        dict: Map the name of each hash function to its report.
+
+    >>> keys = ['/user/%d/profile' % i for i in range(200)]
+    >>> keys += ['abc', 'bca', 'cab']
+    >>> report = compareHashFunctions(keys)
+    >>> sorted(report)
+    ['builtin', 'fnv1a', 'folding', 'polynomial', 'siphash']
+    >>> report['folding']['hash_collisions'] > report['fnv1a']['hash_collisions']
+    True
+    """
+    if hash_functions is None:
+        hash_functions = {'builtin': builtinHash,
+                          'folding': foldingHash,
+                          'polynomial': polynomialHash,
+                          'fnv1a': fnv1aHash,
+                          'siphash': sipHash}
+    report = {}
+    for name, hash_function in hash_functions.items():
+        table = HashTable(max_load_factor=max_load_factor,
+                          hash_function=hash_function)
+        table.reserve(len(keys))
+        for key in keys:
+            table[key] = None
+        stats = table.probeStats()
+        stats['hash_collisions'] = len(keys) - len(
+            set(hash_function(key) for key in keys))
+        report[name] = stats
+    return report
+
+
+def _nextPrime(n):
+    """Return the smallest prime >= n.
+
+    A prime number of slots spreads the keys more evenly for the remainder
+    method.
+    """
+    n = max(n, 2)
+    while True:
+        if all(n % d != 0 for d in xrange(2, int(n ** 0.5) + 1)):
+            return n
+        n += 1
 
 
 def test():
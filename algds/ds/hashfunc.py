@@ -0,0 +1,255 @@
+"""Hash functions for the hash table.
+
+A hash function maps a key to a non-negative integer, and the hash table takes
+it modulo the number of slots. A good hash function spreads similar keys, such
+as anagrams or URLs sharing a long prefix, over all the slots.
+
+Every function here accepts any hashable key. builtinHash() is computed in C
+by the built-in hash(), and is by far the fastest. The other functions are
+written in Python. They hash strings and integers by their content, so the
+hash values are the same across runs, which the built-in hash() does not
+promise for strings. Tuples are hashed by their items, and numbers equal to an
+int, such as 2.0 or True, as that int. Other keys fall back to the built-in
+hash().
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['builtinHash', 'foldingHash', 'polynomialHash', 'fnv1aHash',
+           'sipHash', 'makeSipHash']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import numbers
+import os
+import struct
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _integral(key):
+    """Return the int equal to the number key, e.g., 2 for 2.0, or the key
+    itself if there is none.
+
+    Keys which compare equal must get the same hash value, while an int is
+    hashed by its bytes and a float falls back to the built-in hash().
+    """
+    if isinstance(key, numbers.Number) and not isinstance(key, int):
+        number = key
+        if isinstance(number, numbers.Complex) and number.imag == 0:
+            number = number.real
+        try:
+            integer = int(number)
+        except (TypeError, ValueError, OverflowError):
+            # A complex number, an infinity or a NaN.
+            return key
+        if integer == key:
+            return integer
+    return key
+
+
+def _toBytes(key):
+    """Return a bytearray representing the key.
+
+    Raises:
+        TypeError: If the key is not hashable.
+
+    >>> _toBytes(-1) == _toBytes(-1.0) == _toBytes(-1 + 0j)
+    True
+    >>> _toBytes(True) == _toBytes(1), _toBytes(0.5) == _toBytes(0)
+    (True, False)
+    """
+    if isinstance(key, bytearray):
+        raise TypeError('unhashable type: bytearray.')
+    if isinstance(key, bytes):
+        return bytearray(key)
+    if isinstance(key, type(u'')):
+        return bytearray(key.encode('utf-8'))
+    if isinstance(key, int) and -(1 << 63) <= key < (1 << 63):
+        return bytearray(struct.pack('<q', key))
+    if isinstance(key, tuple):
+        # Prefix each item with its length, so that ('ab', 'c') and
+        # ('a', 'bc') are different.
+        data = bytearray(b'(')
+        for item in key:
+            item = _toBytes(item)
+            data += struct.pack('<I', len(item)) + item
+        return data
+    integer = _integral(key)
+    if integer is not key:
+        return _toBytes(integer)
+    return bytearray(struct.pack('<q', hash(key)))
+
+
+def builtinHash(key):
+    """The built-in hash(), mixed.
+
+    The built-in hash() of a small int is the int itself, so the probe
+    sequences which take the hash value apart, e.g., the step of double
+    hashing or the second bucket of cuckoo hashing, would be degenerate for
+    consecutive ints. Hashing a tuple of the key instead multiplies the hash
+    value by a large odd constant, still in C. Keys which compare equal, such
+    as 1 and 1.0, get the same hash value.
+
+    The hash values of strings differ across runs of Python 3, unless
+    PYTHONHASHSEED is set, so use fnv1aHash() for hash values to be stored.
+
+    >>> builtinHash(1) == builtinHash(1.0) == builtinHash(True)
+    True
+    >>> builtinHash(1) // 1000 != builtinHash(2) // 1000
+    True
+    """
+    return hash((key,))
+
+
+def foldingHash(key):
+    """Sum the ordinal values of the characters.
+
+    The word "cat" can be thought of as a sequence of ordinal values:
+    ord('c') == 99, ord('a') == 97, and ord('t') == 116, and the hash value is
+    their sum. It is cheap but poor: anagrams are always given the same hash
+    value, and short keys only use a small range of hash values. Integers are
+    their own hash values.
+
+    Raises:
+        ValueError: If the key type is not valid.
+
+    >>> foldingHash('cat') == foldingHash('act') == 312
+    True
+    >>> foldingHash(54), foldingHash(54.0)
+    (54, 54)
+    """
+    key = _integral(key)
+    if isinstance(key, str):
+        return sum([ord(ch) for ch in key])
+    if isinstance(key, int):
+        return key
+    raise ValueError('key type should be str/int.')
+
+
+def polynomialHash(key, base=31):
+    """Polynomial rolling hash.
+
+    Use the position of each byte as a weight: the hash value of b_0 b_1 ...
+    b_{n-1} is b_0 * base^(n-1) + b_1 * base^(n-2) + ... + b_{n-1}, computed
+    by Horner's rule modulo 2^64. Hence anagrams get different hash values.
+
+    >>> polynomialHash('cat') == polynomialHash('act')
+    False
+    """
+    h = 0
+    for b in _toBytes(key):
+        h = (h * base + b) & _MASK_64
+    return h
+
+
+def fnv1aHash(key):
+    """64-bit FNV-1a hash.
+
+    For each byte, xor it into the hash value and then multiply by the FNV
+    prime. The multiplication spreads every input bit over the high bits, so
+    keys sharing a long prefix still get unrelated hash values.
+
+    >>> fnv1aHash(b'') == 0xcbf29ce484222325
+    True
+    >>> fnv1aHash(b'a') == 0xaf63dc4c8601ec8c
+    True
+    """
+    h = 0xcbf29ce484222325
+    for b in _toBytes(key):
+        h = ((h ^ b) * 0x100000001b3) & _MASK_64
+    return h
+
+
+def _rotl(x, b):
+    return ((x << b) | (x >> (64 - b))) & _MASK_64
+
+
+def sipHash(key, secret=b'\0' * 16):
+    """Keyed SipHash-2-4.
+
+    Unlike the hash functions above, the hash value depends on a 16-byte secret.
+    Without knowing the secret, an adversary cannot choose keys which collide
+    on purpose to slow down the hash table. Use makeSipHash() to fix a random
+    secret.
+
+    Args:
+        key: Key to be hashed.
+        secret (bytes) [b'\\0' * 16]: The 128-bit secret.
+
+    Raises:
+        ValueError: If the secret is not 16 bytes long.
+
+    >>> secret = bytes(bytearray(range(16)))
+    >>> sipHash(bytes(bytearray(range(15))), secret) == 0xa129ca6149be45e5
+    True
+    """
+    if len(secret) != 16:
+        raise ValueError('secret should be 16 bytes.')
+    k0, k1 = struct.unpack('<QQ', secret)
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def sipRound(v0, v1, v2, v3):
+        v0 = (v0 + v1) & _MASK_64
+        v1 = _rotl(v1, 13) ^ v0
+        v0 = _rotl(v0, 32)
+        v2 = (v2 + v3) & _MASK_64
+        v3 = _rotl(v3, 16) ^ v2
+        v0 = (v0 + v3) & _MASK_64
+        v3 = _rotl(v3, 21) ^ v0
+        v2 = (v2 + v1) & _MASK_64
+        v1 = _rotl(v1, 17) ^ v2
+        v2 = _rotl(v2, 32)
+        return v0, v1, v2, v3
+
+    data = _toBytes(key)
+    n = len(data)
+    # Pad the last block with zeros and the message length in the top byte.
+    data += b'\0' * (7 - n % 8) + struct.pack('<B', n & 0xff)
+    for i in xrange(0, len(data), 8):
+        m = struct.unpack_from('<Q', data, i)[0]
+        v3 ^= m
+        v0, v1, v2, v3 = sipRound(v0, v1, v2, v3)
+        v0, v1, v2, v3 = sipRound(v0, v1, v2, v3)
+        v0 ^= m
+    v2 ^= 0xff
+    for _ in xrange(4):
+        v0, v1, v2, v3 = sipRound(v0, v1, v2, v3)
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+def makeSipHash(secret=None):
+    """Return a SipHash function bound to the secret.
+
+    Args:
+        secret (bytes/None) [None]: The 128-bit secret. A random one is drawn
+            from os.urandom() if None.
+
+    >>> h = makeSipHash(b'0123456789abcdef')
+    >>> h('cat') == sipHash('cat', b'0123456789abcdef')
+    True
+    """
+    if secret is None:
+        secret = os.urandom(16)
+
+    def keyedSipHash(key):
+        return sipHash(key, secret)
+    return keyedSipHash
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
@@ -10,24 +10,29 @@ that there is no next item.
 
 from __future__ import division, print_function
 
-__all__ = ['UnorderedList', 'OrderedList']
+__all__ = ['UnorderedList', 'DoublyLinkedList', 'OrderedList']
 __author__ = 'Hao Zhang'
 __copyright__ = 'Copyright @2017'
 __date__ = '2017-07-27'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-27'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
 
 class Node(object):
     """The basic building block for the linked list.
 
+    With __slots__, a node does not carry a per-instance __dict__, which saves
+    memory for long lists.
+
     Attributes:
         data: Contain the list item.
         next (Node): Reference to the next Node.
     """
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -39,8 +44,13 @@ class UnorderedList(object):
     It contains a collection of nodes, each linked to the next by explicit
     references. The trick is, we use the head as the sentinel element.
 
+    We also keep a reference to the last node and the number of items, so
+    that append() and size() take O(1) time instead of walking the list.
+
     Attributes:
         _head (Node): Reference to the first node.
+        _tail (Node): Reference to the last node, or _head if empty.
+        _size (int): Number of items.
 
     >>> l = UnorderedList()
     >>> l.isEmpty()
@@ -73,10 +83,22 @@ class UnorderedList(object):
     >>> l.remove(54)
     >>> l.size()
     4
+    >>> l.extend([1, 2])
+    >>> list(l)
+    [26, 93, 17, 77, 1, 2]
+    >>> l.pop()
+    2
+    >>> l.pop(0)
+    26
+    >>> l.insert(1, 'x')
+    >>> list(l), len(l)
+    ([93, 'x', 17, 77, 1], 5)
     """
 
     def __init__(self):
         self._head = Node(None)
+        self._tail = self._head
+        self._size = 0
 
     def isEmpty(self):
         return self._head.next is None
@@ -90,6 +112,9 @@ class UnorderedList(object):
         node = Node(x)
         node.next = self._head.next
         self._head.next = node
+        if self._tail is self._head:
+            self._tail = node
+        self._size += 1
 
     def contains(self, x):
         p = self._head.next
@@ -101,12 +126,16 @@ class UnorderedList(object):
             return True
 
     def size(self):
-        count = 0
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
         p = self._head.next
         while p is not None:
-            count += 1
+            yield p.data
             p = p.next
-        return count
 
     def remove(self, x):
         """Remove the item x.
@@ -129,13 +158,228 @@ class UnorderedList(object):
         if p_current is None:
             raise ValueError('{} is not contained in the list.'.format(x))
         else:
-            p_prev.next = p_current.next
+            self._unlinkAfter(p_prev)
 
     def append(self, x):
+        """Add the item x after the last node in O(1) time."""
+        node = Node(x)
+        self._tail.next = node
+        self._tail = node
+        self._size += 1
+
+    def extend(self, iterable):
+        """Append all items of the iterable."""
+        for x in iterable:
+            self.append(x)
+
+    def _nodeBefore(self, i):
+        """Return the node before the i-th node, i.e., _head if i == 0."""
         p = self._head
-        while p.next is not None:
+        for _ in xrange(i):
+            p = p.next
+        return p
+
+    def _unlinkAfter(self, p_prev):
+        """Unlink the node after p_prev and return its item."""
+        node = p_prev.next
+        p_prev.next = node.next
+        if node is self._tail:
+            self._tail = p_prev
+        self._size -= 1
+        return node.data
+
+    def pop(self, i=-1):
+        """Remove and return the item at position i, the last one by default.
+
+        It takes O(i) time, since we have to walk to the node before.
+
+        Raises:
+            IndexError: If the list is empty or i is out of range.
+        """
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('pop index out of range.')
+        return self._unlinkAfter(self._nodeBefore(i))
+
+    def insert(self, i, x):
+        """Insert the item x before position i.
+
+        Like list.insert(), i is clipped to the range of the list, so that
+        insert(0, x) is add(x) and insert(len(l), x) is append(x).
+        """
+        if i < 0:
+            i = max(i + self._size, 0)
+        if i >= self._size:
+            self.append(x)
+            return
+        p_prev = self._nodeBefore(i)
+        node = Node(x)
+        node.next = p_prev.next
+        p_prev.next = node
+        self._size += 1
+
+
+class _DoublyNode(object):
+    """Node of the doubly linked list.
+
+    Attributes:
+        data: Contain the list item.
+        prev (_DoublyNode): Reference to the previous node.
+        next (_DoublyNode): Reference to the next node.
+    """
+    __slots__ = ('data', 'prev', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+
+class DoublyLinkedList(object):
+    """Implementation of a doubly linked list.
+
+    Each node also refers to the previous node. The list is made circular by
+    a sentinel node, whose next is the first node and whose prev is the last
+    node. Hence there is no special case for an empty list or for either end.
+
+    add() and append() return the node holding the new item. Given such a node
+    handle, removeNode() unlinks it in O(1) time, without searching.
+
+    Attributes:
+        _sentinel (_DoublyNode)
+        _size (int): Number of items.
+
+    >>> l = DoublyLinkedList()
+    >>> l.isEmpty()
+    True
+    >>> node = l.append(31)
+    >>> _ = l.add(77)
+    >>> _ = l.append(54)
+    >>> list(l), l.size()
+    ([77, 31, 54], 3)
+    >>> l.removeNode(node)
+    31
+    >>> l.contains(31)
+    False
+    >>> l.insert(1, 'x')
+    >>> l.pop(0), l.pop(), list(l)
+    (77, 54, ['x'])
+    >>> l.remove('x')
+    >>> l.isEmpty()
+    True
+    """
+
+    def __init__(self):
+        self._sentinel = _DoublyNode(None)
+        self._sentinel.prev = self._sentinel
+        self._sentinel.next = self._sentinel
+        self._size = 0
+
+    def isEmpty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        p = self._sentinel.next
+        while p is not self._sentinel:
+            yield p.data
             p = p.next
-        p.next = Node(x)
+
+    def _linkAfter(self, p_prev, x):
+        """Link a new node holding x after p_prev and return it."""
+        node = _DoublyNode(x)
+        node.prev = p_prev
+        node.next = p_prev.next
+        p_prev.next.prev = node
+        p_prev.next = node
+        self._size += 1
+        return node
+
+    def add(self, x):
+        """Add the item x at the front, and return its node."""
+        return self._linkAfter(self._sentinel, x)
+
+    def append(self, x):
+        """Add the item x at the end, and return its node."""
+        return self._linkAfter(self._sentinel.prev, x)
+
+    def extend(self, iterable):
+        for x in iterable:
+            self.append(x)
+
+    def contains(self, x):
+        return self._findNode(x) is not None
+
+    def _findNode(self, x):
+        p = self._sentinel.next
+        while p is not self._sentinel:
+            if p.data == x:
+                return p
+            p = p.next
+        return None
+
+    def removeNode(self, node):
+        """Unlink the node in O(1) time and return its item.
+
+        Args:
+            node (_DoublyNode): A node of this list, returned by add() or
+                append().
+        """
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self._size -= 1
+        return node.data
+
+    def remove(self, x):
+        """Remove the first occurrence of the item x.
+
+        Raises:
+            ValueError: If x is not in the list.
+        """
+        node = self._findNode(x)
+        if node is None:
+            raise ValueError('{} is not contained in the list.'.format(x))
+        self.removeNode(node)
+
+    def _node(self, i):
+        """Return the i-th node, walking from the nearer end."""
+        if i < self._size // 2:
+            p = self._sentinel.next
+            for _ in xrange(i):
+                p = p.next
+        else:
+            p = self._sentinel.prev
+            for _ in xrange(self._size - 1 - i):
+                p = p.prev
+        return p
+
+    def pop(self, i=-1):
+        """Remove and return the item at position i, the last one by default.
+
+        Raises:
+            IndexError: If the list is empty or i is out of range.
+        """
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('pop index out of range.')
+        return self.removeNode(self._node(i))
+
+    def insert(self, i, x):
+        """Insert the item x before position i, clipped like list.insert()."""
+        if i < 0:
+            i = max(i + self._size, 0)
+        if i >= self._size:
+            self.append(x)
+        else:
+            self._linkAfter(self._node(i).prev, x)
 
 
 class OrderedList(object):
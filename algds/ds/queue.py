@@ -20,19 +20,32 @@ __date__ = '2017-07-26'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-25'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
+import numbers
+
 
 class Queue(object):
     """Implementation of a queque.
 
-    We will use list to build the internal representation of the queue. Assume
-    that the rear is at position 0 in the list, and the last element is the
-    front.
+    We use a growable circular buffer (ring buffer) to build the internal
+    representation of the queue. The items live in a list whose length is the
+    capacity of the buffer; _head points at the front and the rear is
+    (_head + _size) % capacity. Both enqueue and dequeue only move an index,
+    hence they take O(1) time, instead of the O(n) list.insert(0, x).
+
+    When the buffer is full, an unbounded queue doubles its capacity, which
+    keeps enqueue amortized O(1). A bounded queue (capacity is given) either
+    refuses the new item (policy='block') or overwrites the front item
+    (policy='overwrite'), i.e., it keeps the latest capacity items.
 
     Attributes:
-        _items (list):
+        _items (list): The circular buffer.
+        _head (int): Index of the front item.
+        _size (int): Number of items in the queue.
+        _capacity (int/None): Maximum number of items, None if unbounded.
+        _policy (str): What to do when a bounded queue is full.
 
     >>> q = Queue()
     >>> q.isEmpty()
@@ -51,21 +64,174 @@ class Queue(object):
     'dog'
     >>> q.size()
     2
+    >>> q.enqueue_many(range(10))
+    >>> q.dequeue_many(4)
+    [True, 8.4, 0, 1]
+    >>> len(q)
+    8
+    >>> q = Queue(capacity=3, policy='overwrite')
+    >>> q.enqueue_many('abcde')
+    >>> q.dequeue_many(3)
+    ['c', 'd', 'e']
+    >>> q = Queue(capacity=2)
+    >>> q.enqueue_many('ab')
+    >>> q.enqueue('c')
+    Traceback (most recent call last):
+        ...
+    RuntimeError: Out of storage of the queue.
+    >>> q.dequeue_many(-1)
+    Traceback (most recent call last):
+        ...
+    ValueError: n should be >= 0.
     """
-    def __init__(self):
-        self._items = []
+    _MIN_CAPACITY = 8
+
+    def __init__(self, capacity=None, policy='block'):
+        """Initialize an empty queue.
+
+        Args:
+            capacity (int/None) [None]: Maximum number of items. None means the
+                buffer grows without limit.
+            policy (str) ['block']: Used when a bounded queue is full. 'block'
+                refuses the new item, 'overwrite' drops the front item.
+
+        Raises:
+            ValueError: If capacity or policy is not valid.
+        """
+        if capacity is not None and (
+                not isinstance(capacity, numbers.Integral) or capacity < 1):
+            raise ValueError('capacity should be int >= 1.')
+        if policy not in ('block', 'overwrite'):
+            raise ValueError("policy should be 'block' or 'overwrite'.")
+        self._capacity = capacity
+        self._policy = policy
+        if capacity is None:
+            self._items = [None] * self._MIN_CAPACITY
+        else:
+            self._items = [None] * capacity
+        self._head = 0
+        self._size = 0
 
     def isEmpty(self):
-        return self._items == []
+        return self._size == 0
+
+    def isFull(self):
+        return self._capacity is not None and self._size == self._capacity
 
     def size(self):
-        return len(self._items)
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Iterate from the front to the rear."""
+        return iter(self._ordered())
 
     def enqueue(self, x):
-        self._items.insert(0, x)
+        """Add the item x to the rear of the queue.
+
+        Raises:
+            RuntimeError: If the queue is full and the policy is 'block'.
+        """
+        if self._size == len(self._items):
+            if self._capacity is None:
+                self._resize(2 * len(self._items))
+            elif self._policy == 'overwrite':
+                # Drop the front item to make room for x.
+                self._items[self._head] = x
+                self._head = (self._head + 1) % len(self._items)
+                return
+            else:
+                raise RuntimeError('Out of storage of the queue.')
+        self._items[(self._head + self._size) % len(self._items)] = x
+        self._size += 1
 
     def dequeue(self):
-        return self._items.pop()
+        """Remove and return the front item of the queue.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if self._size == 0:
+            raise IndexError('dequeue from empty queue.')
+        x = self._items[self._head]
+        # Release the reference so that the item can be garbage collected.
+        self._items[self._head] = None
+        self._head = (self._head + 1) % len(self._items)
+        self._size -= 1
+        return x
+
+    def enqueue_many(self, iterable):
+        """Add all items of the iterable to the rear of the queue.
+
+        The items are copied into the buffer by at most two slice assignments,
+        which is much faster than calling enqueue() for every item.
+
+        Raises:
+            RuntimeError: If the queue is full and the policy is 'block'. The
+                items fit in the queue are still added.
+        """
+        items = list(iterable)
+        if self._capacity is None:
+            if self._size + len(items) > len(self._items):
+                new_capacity = len(self._items)
+                while new_capacity < self._size + len(items):
+                    new_capacity *= 2
+                self._resize(new_capacity)
+        elif self._size + len(items) > self._capacity:
+            if self._policy == 'block':
+                self.enqueue_many(items[:self._capacity - self._size])
+                raise RuntimeError('Out of storage of the queue.')
+            # Only the latest capacity items survive.
+            items = items[-self._capacity:]
+            self.dequeue_many(self._size + len(items) - self._capacity)
+        self._write((self._head + self._size) % len(self._items), items)
+        self._size += len(items)
+
+    def dequeue_many(self, n):
+        """Remove and return the n front items of the queue in FIFO order.
+
+        Raises:
+            ValueError: If n < 0.
+            IndexError: If there are less than n items in the queue.
+        """
+        if n < 0:
+            raise ValueError('n should be >= 0.')
+        if n > self._size:
+            raise IndexError('dequeue from empty queue.')
+        capacity = len(self._items)
+        end = self._head + n
+        if end <= capacity:
+            result = self._items[self._head:end]
+            self._items[self._head:end] = [None] * n
+        else:
+            result = self._items[self._head:] + self._items[:end - capacity]
+            self._items[self._head:] = [None] * (capacity - self._head)
+            self._items[:end - capacity] = [None] * (end - capacity)
+        self._head = end % capacity
+        self._size -= n
+        return result
+
+    def _write(self, start, items):
+        """Copy items into the buffer starting from index start, wrapping
+        around the end of the buffer if necessary."""
+        capacity = len(self._items)
+        split = min(len(items), capacity - start)
+        self._items[start:start + split] = items[:split]
+        self._items[:len(items) - split] = items[split:]
+
+    def _ordered(self):
+        """Return a list of the items from the front to the rear."""
+        end = self._head + self._size
+        if end <= len(self._items):
+            return self._items[self._head:end]
+        return self._items[self._head:] + self._items[:end - len(self._items)]
+
+    def _resize(self, new_capacity):
+        """Move the items into a new buffer with the front item at index 0."""
+        self._items = self._ordered() + [None] * (new_capacity - self._size)
+        self._head = 0
 
 
 def test():
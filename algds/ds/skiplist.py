@@ -0,0 +1,290 @@
+"""Implementation of a skip list.
+
+A skip list is an ordered linked list with express lanes. Every node is on the
+bottom level, and each node on a level is promoted to the level above with
+probability 1/2. A search starts on the top level and drops one level down
+whenever the next node would overshoot, so it only visits O(log n) nodes in
+expectation. It provides the same ordered list ADT as OrderedList, with add,
+contains and remove taking expected O(log n) time instead of O(n).
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['SkipList']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import random
+
+
+class _SkipNode(object):
+    """Node of the skip list.
+
+    Attributes:
+        data: Contain the list item.
+        next (list of _SkipNode): Reference to the next node on each level,
+            None at the end of the level.
+        width (list of int): Number of bottom-level steps spanned by each
+            next reference. The end of a level is taken as the position just
+            after the last node.
+    """
+    __slots__ = ('data', 'next', 'width')
+
+    def __init__(self, data, level):
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class SkipList(object):
+    """Implementation of an indexable skip list.
+
+    The head is a sentinel node of _MAX_LEVEL levels at position 0, and the
+    items are at positions 1, 2, ..., n. Each link also records its width,
+    i.e., the difference of the positions it connects. Summing the widths
+    along a search path gives the position of a node, so rank() and select()
+    take expected O(log n) time as well.
+
+    Attributes:
+        _head (_SkipNode): The sentinel node.
+        _level (int): Number of levels in use.
+        _size (int): Number of items.
+        _random (random.Random): Draw the levels of the new nodes.
+
+    >>> l = SkipList()
+    >>> l.isEmpty()
+    True
+    >>> l.size()
+    0
+    >>> l.add(31)
+    >>> l.isEmpty()
+    False
+    >>> l.size()
+    1
+    >>> l.add(77)
+    >>> l.add(17)
+    >>> l.add(93)
+    >>> l.add(26)
+    >>> l.add(54)
+    >>> l.isEmpty()
+    False
+    >>> l.size()
+    6
+    >>> l.contains(17)
+    True
+    >>> l.contains(93)
+    True
+    >>> l.contains(54)
+    True
+    >>> l.contains(44)
+    False
+    >>> l.remove(31)
+    >>> l.remove(54)
+    >>> l.size()
+    4
+    >>> print(l)
+    17, 26, 77, 93
+    >>> list(l.range(20, 80))
+    [26, 77]
+    >>> l.rank(77), l.select(2)
+    (2, 77)
+    >>> l = SkipList.fromSorted(range(0, 100, 10))
+    >>> l.rank(35), l.select(-1), list(l.range(70, None))
+    (4, 90, [70, 80, 90])
+    """
+    _MAX_LEVEL = 32
+
+    def __init__(self, seed=None):
+        """Initialize an empty skip list.
+
+        Args:
+            seed [None]: Seed of the random levels.
+        """
+        self._head = _SkipNode(None, self._MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed)
+
+    @classmethod
+    def fromSorted(cls, iterable, seed=None):
+        """Build a skip list from sorted items in O(n) time.
+
+        The nodes are appended one by one, keeping the last node and its
+        position on each level, so no search is needed.
+
+        Raises:
+            ValueError: If the items are not sorted.
+        """
+        skip_list = cls(seed)
+        head = skip_list._head
+        last = [head] * cls._MAX_LEVEL
+        last_position = [0] * cls._MAX_LEVEL
+        position = 0
+        previous = None
+        for x in iterable:
+            if position > 0 and x < previous:
+                raise ValueError('The items are not sorted.')
+            previous = x
+            position += 1
+            level = skip_list._randomLevel()
+            node = _SkipNode(x, level)
+            for i in xrange(level):
+                last[i].next[i] = node
+                last[i].width[i] = position - last_position[i]
+                last[i] = node
+                last_position[i] = position
+            skip_list._level = max(skip_list._level, level)
+        for i in xrange(skip_list._level):
+            last[i].width[i] = position + 1 - last_position[i]
+        skip_list._size = position
+        return skip_list
+
+    def _randomLevel(self):
+        level = 1
+        while level < self._MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def _search(self, x):
+        """Find the last node < x on each level.
+
+        Returns:
+            update (list of _SkipNode): The last node < x on each level in use.
+            positions (list of int): Their positions.
+        """
+        update = [None] * self._level
+        positions = [0] * self._level
+        node = self._head
+        position = 0
+        for i in xrange(self._level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].data < x:
+                position += node.width[i]
+                node = node.next[i]
+            update[i] = node
+            positions[i] = position
+        return update, positions
+
+    def isEmpty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not None:
+            yield node.data
+            node = node.next[0]
+
+    def add(self, x):
+        """Add the item x to the correct position in the list.
+
+        Args:
+            x: Item to be added.
+        """
+        level = self._randomLevel()
+        if level > self._level:
+            # The new levels of the head span the whole list.
+            for i in xrange(self._level, level):
+                self._head.next[i] = None
+                self._head.width[i] = self._size + 1
+            self._level = level
+        update, positions = self._search(x)
+        # The new node is just after the last node < x on the bottom level.
+        position = positions[0] + 1
+        node = _SkipNode(x, level)
+        for i in xrange(level):
+            prev = update[i]
+            node.next[i] = prev.next[i]
+            prev.next[i] = node
+            node.width[i] = positions[i] + prev.width[i] - positions[0]
+            prev.width[i] = position - positions[i]
+        for i in xrange(level, self._level):
+            update[i].width[i] += 1
+        self._size += 1
+
+    def contains(self, x):
+        update, _ = self._search(x)
+        node = update[0].next[0]
+        return node is not None and node.data == x
+
+    def remove(self, x):
+        """Remove the item x.
+
+        Args:
+            x: Item to be removed.
+
+        Raises:
+            ValueError: If x is not in the list.
+        """
+        update, _ = self._search(x)
+        node = update[0].next[0]
+        if node is None or node.data != x:
+            raise ValueError('{} is not contained in the list.'.format(x))
+        for i in xrange(self._level):
+            if update[i].next[i] is node:
+                update[i].width[i] += node.width[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].width[i] -= 1
+        self._size -= 1
+
+    def rank(self, x):
+        """Return the number of items < x."""
+        _, positions = self._search(x)
+        return positions[0]
+
+    def select(self, k):
+        """Return the k-th smallest item, counting from 0.
+
+        Raises:
+            IndexError: If k is out of range.
+        """
+        if k < 0:
+            k += self._size
+        if not 0 <= k < self._size:
+            raise IndexError('skip list index out of range.')
+        node = self._head
+        position = 0
+        for i in xrange(self._level - 1, -1, -1):
+            while node.next[i] is not None and position + node.width[i] <= k + 1:
+                position += node.width[i]
+                node = node.next[i]
+        return node.data
+
+    def range(self, lo=None, hi=None):
+        """Iterate over the items x with lo <= x < hi in order.
+
+        Args:
+            lo [None]: Lower bound, None means no lower bound.
+            hi [None]: Upper bound (exclusive), None means no upper bound.
+        """
+        if lo is None:
+            node = self._head.next[0]
+        else:
+            update, _ = self._search(lo)
+            node = update[0].next[0]
+        while node is not None and (hi is None or node.data < hi):
+            yield node.data
+            node = node.next[0]
+
+    def __str__(self):
+        return ', '.join(str(x) for x in self)
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
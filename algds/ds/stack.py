@@ -22,9 +22,11 @@ __date__ = '2017-07-25'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-25'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
+import array
+
 
 class Stack(object):
     """Implementation of a stack.
@@ -32,8 +34,17 @@ class Stack(object):
     The stack is implemented by a list, and the end of the list will hold the
     top element of the stack.
 
+    If a typecode is given, the items are stored in an array.array instead,
+    e.g., Stack(typecode='d') holds floats as packed machine doubles instead
+    of references to boxed float objects. It takes far less memory for
+    millions of numeric operands.
+
+    For tight loops, primitives() returns the bound push and pop methods of
+    the underlying container, which skips one Python method call per
+    operation.
+
     Attributes:
-        _items (list): Used to store items in the stack.
+        _items (list/array.array): Used to store items in the stack.
 
     >>> s = Stack()
     >>> s.isEmpty()
@@ -54,13 +65,33 @@ class Stack(object):
     True
     >>> s.size()
     2
+    >>> s = Stack(typecode='d')
+    >>> s.push_many([1, 2, 3, 4])
+    >>> s.peek(), s.peek(1)
+    (4.0, 3.0)
+    >>> s.pop_many(3)
+    [4.0, 3.0, 2.0]
+    >>> push, pop = s.primitives()
+    >>> push(5.5)
+    >>> pop(), s.size()
+    (5.5, 1)
     """
 
-    def __init__(self):
-        self._items = []
+    def __init__(self, typecode=None):
+        """Initialize an empty stack.
+
+        Args:
+            typecode (str/None) [None]: Typecode of array.array to store the
+                items, e.g., 'd' for floats or 'q' for 64-bit integers. None
+                means a list of arbitrary objects.
+        """
+        if typecode is None:
+            self._items = []
+        else:
+            self._items = array.array(typecode)
 
     def isEmpty(self):
-        return self._items == []
+        return len(self._items) == 0
 
     def push(self, x):
         self._items.append(x)
@@ -69,11 +100,54 @@ class Stack(object):
         return self._items.pop()
 
     def top(self):
-        return self._items[self.size() - 1]
+        return self._items[-1]
 
     def size(self):
         return len(self._items)
 
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        """Iterate from the base to the top."""
+        return iter(self._items)
+
+    def push_many(self, iterable):
+        """Push all items of the iterable in order, the last one on top."""
+        self._items.extend(iterable)
+
+    def pop_many(self, k):
+        """Pop k items and return them as a list in popping order.
+
+        Raises:
+            IndexError: If there are less than k items.
+        """
+        if not 0 <= k <= len(self._items):
+            raise IndexError('pop from empty stack.')
+        start = len(self._items) - k
+        result = list(self._items[start:])
+        del self._items[start:]
+        result.reverse()
+        return result
+
+    def peek(self, k=0):
+        """Return the item k below the top, so peek() is top().
+
+        Raises:
+            IndexError: If there are not more than k items.
+        """
+        if not 0 <= k < len(self._items):
+            raise IndexError('stack index out of range.')
+        return self._items[-1 - k]
+
+    def primitives(self):
+        """Return the bound (push, pop) of the underlying container.
+
+        They bypass the Stack methods, so they must not be used once the stack
+        is replaced or subclassed.
+        """
+        return self._items.append, self._items.pop
+
 
 def test():
     import doctest
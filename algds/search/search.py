@@ -1,4 +1,9 @@
-"""Linear search and binary search."""
+"""Linear search and binary search.
+
+Besides the membership tests, Search gives the positions of the items in a
+sorted list like the bisect module, and answers many queries at once. A
+membership filter can reject most of the absent items before any search.
+"""
 
 from __future__ import division, print_function
 
@@ -9,9 +14,22 @@ __date__ = '2017-07-28'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-28'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
+import array
+import bisect
+import sys
+sys.path.append('../../')
+
+from algds.ds.bloom import BloomFilter
+from algds.search.staticindex import EytzingerIndex, StaticBTreeIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class Search(object):
     """Sequential search through a list.
@@ -34,18 +52,75 @@ class Search(object):
     >>> s = Search([])
     >>> s.binary(1)
     False
+    >>> s = Search([0, 1, 1, 2, 3, 5, 8, 13, 21, 34])
+    >>> s.bisect_left(1), s.bisect_right(1), s.bisect_left(4)
+    (1, 3, 5)
+    >>> s.exponential(21), s.exponential(22)
+    (True, False)
+    >>> s.interpolation(34), s.interpolation(4)
+    (True, False)
+    >>> s.binary_many([34, 4, 0, 1, 100])
+    [True, False, True, True, False]
+    >>> s.staticIndex('btree').rank(4)
+    5
     """
 
     def __init__(self, list_):
         self._list = list_
+        self._filter = None
+
+    def attachFilter(self, filter_=None, error_rate=0.01):
+        """Consult a membership filter before each membership test.
+
+        linear(), binary(), exponential(), interpolation() and binary_many()
+        return False at once for the items which the filter rules out, and
+        search for the others as usual, so the results do not change. For a
+        linear search, an absent item costs n comparisons without the filter
+        and a few bit tests with it. The filter does not follow later changes
+        of the list.
+
+        Args:
+            filter_ (BloomFilter/CuckooFilter/None) [None]: A filter holding
+                all the items of the list, e.g., loaded by fromBytes(). None
+                means a new BloomFilter of the items.
+            error_rate (float) [0.01]: False-positive rate of the new
+                BloomFilter.
+
+        Returns:
+            The filter.
+
+        >>> s = Search([54, 26, 93, 17, 77, 31])
+        >>> f = s.attachFilter()
+        >>> s.linear(93), s.linear(94)
+        (True, False)
+        >>> s = Search(sorted([54, 26, 93, 17, 77, 31]))
+        >>> s.attachFilter(f) is f
+        True
+        >>> s.binary_many([94, 17]), s.interpolation(31)
+        ([False, True], True)
+        """
+        if filter_ is None:
+            filter_ = BloomFilter(max(1, len(self._list)), error_rate)
+            for x in self._list:
+                filter_.add(x)
+        self._filter = filter_
+        return filter_
+
+    def _mayContain(self, x):
+        """Return False if the filter rules x out."""
+        return self._filter is None or x in self._filter
 
     def linear(self, x):
+        if not self._mayContain(x):
+            return False
         for val in self._list:
             if val == x:
                 return True
         return False
 
     def binary(self, x):
+        if not self._mayContain(x):
+            return False
         low = 0
         high = len(self._list)
         mid = (low + high) // 2
@@ -59,6 +134,144 @@ class Search(object):
             mid = (low + high) // 2
         return False
 
+    def bisect_left(self, x, lo=0, hi=None):
+        """Return the first position in the sorted list where x could be
+        inserted, i.e., the number of items < x in list[lo:hi].
+
+        Same as bisect.bisect_left(), which does the binary search in C, so
+        a query does not pay for a Python loop.
+        """
+        if hi is None:
+            hi = len(self._list)
+        return bisect.bisect_left(self._list, x, lo, hi)
+
+    def bisect_right(self, x, lo=0, hi=None):
+        """Return the last position in the sorted list where x could be
+        inserted, i.e., lo + the number of items <= x in list[lo:hi]."""
+        if hi is None:
+            hi = len(self._list)
+        return bisect.bisect_right(self._list, x, lo, hi)
+
+    def exponential(self, x):
+        """Exponential (galloping) search in the sorted list.
+
+        Probe positions 0, 1, 3, 7, 15, ... until an item >= x is found, then
+        do a binary search in the last gap. If x is at position i, it takes
+        O(log i) time, so it is faster than the binary search for items near
+        the front.
+        """
+        if not self._mayContain(x):
+            return False
+        i = self._exponentialLeft(x, 0)
+        return i < len(self._list) and self._list[i] == x
+
+    def _exponentialLeft(self, x, lo):
+        """Return bisect_left(x, lo) by galloping from lo."""
+        n = len(self._list)
+        left = right = lo
+        offset = 1
+        while right < n and self._list[right] < x:
+            left = right + 1
+            right = lo + offset
+            offset = 2 * offset + 1
+        return bisect.bisect_left(self._list, x, left, min(right, n))
+
+    def interpolation(self, x):
+        """Interpolation search in the sorted list of numbers.
+
+        Instead of the middle, probe where x would be if the items were evenly
+        spaced between list[low] and list[high], like looking a name up in a
+        phone book. For uniformly distributed keys, it takes O(log log n)
+        probes on average. Skewed keys can make it O(n), so after 2 log n
+        probes the rest of the range is searched by bisection.
+        """
+        if not self._mayContain(x):
+            return False
+        L = self._list
+        low = 0
+        high = len(L) - 1
+        probes = 2 * len(L).bit_length()
+        while low <= high and L[low] <= x <= L[high]:
+            if L[high] == L[low]:
+                return L[low] == x
+            if probes == 0:
+                i = bisect.bisect_left(L, x, low, high + 1)
+                return L[i] == x
+            probes -= 1
+            mid = low + int((x - L[low]) * (high - low) / (L[high] - L[low]))
+            if L[mid] == x:
+                return True
+            elif L[mid] < x:
+                low = mid + 1
+            else:
+                high = mid - 1
+        return False
+
+    def binary_many(self, queries):
+        """Test whether each of the queries is in the sorted list.
+
+        Instead of one binary search per query, the queries are sorted and
+        found in one sweep over the list: each query gallops from the position
+        of the previous one, so m queries take O(m log m + m log(n / m))
+        time, and only a few Python operations per query. If NumPy is
+        available and the list is an array.array, numpy.searchsorted() does
+        the whole batch in C.
+
+        Args:
+            queries (sequence): Items to look for.
+
+        Returns:
+            list of bool: Whether each query is in the list, in the order of
+                the queries.
+        """
+        if self._filter is not None:
+            # Only search for the queries passing the filter.
+            passing = [j for j, x in enumerate(queries) if x in self._filter]
+            result = [False] * len(queries)
+            search = Search(self._list)
+            found = search.binary_many([queries[j] for j in passing])
+            for j, is_found in zip(passing, found):
+                result[j] = is_found
+            return result
+        L = self._list
+        n = len(L)
+        if numpy is not None and isinstance(L, array.array) and n > 0:
+            keys = numpy.frombuffer(L, dtype=L.typecode)
+            queries = numpy.asarray(queries)
+            positions = numpy.searchsorted(keys, queries)
+            found = positions < n
+            found[found] = keys[positions[found]] == queries[found]
+            return found.tolist()
+        result = [False] * len(queries)
+        i = 0
+        for j in sorted(xrange(len(queries)), key=queries.__getitem__):
+            x = queries[j]
+            i = self._exponentialLeft(x, i)
+            if i == n:
+                break
+            result[j] = L[i] == x
+        return result
+
+    def staticIndex(self, layout='eytzinger', typecode='l'):
+        """Build a cache-friendly static index of the sorted list.
+
+        The index does not follow later changes of the list.
+
+        Args:
+            layout (str) ['eytzinger']: 'eytzinger' for EytzingerIndex, or
+                'btree' for StaticBTreeIndex.
+            typecode (str/None) ['l']: Typecode of the array.array storing the
+                keys, None means a list of arbitrary keys.
+
+        Raises:
+            ValueError: If the layout is not valid.
+        """
+        if layout == 'eytzinger':
+            return EytzingerIndex(self._list, typecode)
+        if layout == 'btree':
+            return StaticBTreeIndex(self._list, typecode)
+        raise ValueError('layout should be eytzinger/btree.')
+
 
 def test():
     import doctest
@@ -0,0 +1,255 @@
+"""Static search indexes with cache-friendly layouts.
+
+A binary search on a sorted array jumps n / 2, n / 4, n / 8, ... positions
+away at each step, so on a large array nearly every probe misses the cache.
+The indexes below store the same keys in an order where the items probed one
+after another are close to each other. They are static: built once from a
+sorted sequence, and never modified.
+
+Both store the keys in an array.array, so that they take 8 bytes per key
+instead of a list of int objects. In Python the interpreter dominates the cost
+of each probe, so the gain from the layouts is smaller than in C, but the
+B+ tree also does the search within each node by the C bisect module.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['EytzingerIndex', 'StaticBTreeIndex']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import abc
+import array
+import bisect
+
+
+# Base class with ABCMeta as the metaclass, in the syntax of both Python 2
+# and 3.
+_ABC = abc.ABCMeta('_ABC', (object,), {})
+
+
+class _StaticIndex(_ABC):
+    """Common interface of the static indexes.
+
+    A subclass implements rank() and lowerBound(), and cannot be instantiated
+    otherwise.
+
+    >>> class Index(_StaticIndex):
+    ...     def rank(self, x):
+    ...         return 0
+    >>> Index()  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    TypeError: Can't instantiate abstract class Index
+
+    Attributes:
+        _size (int): Number of keys.
+    """
+    def __len__(self):
+        return self._size
+
+    def size(self):
+        return self._size
+
+    def __contains__(self, x):
+        return self.contains(x)
+
+    def contains(self, x):
+        k = self.lowerBound(x)
+        return k is not None and k == x
+
+    @abc.abstractmethod
+    def rank(self, x):
+        """Return the number of keys < x."""
+
+    @abc.abstractmethod
+    def lowerBound(self, x):
+        """Return the smallest key >= x, or None if there is not any."""
+
+    @staticmethod
+    def _storage(typecode, n):
+        """Return an empty container for n keys."""
+        if typecode is None:
+            return [None] * n
+        return array.array(typecode, [0]) * n
+
+
+class EytzingerIndex(_StaticIndex):
+    """Static index in Eytzinger (breadth-first) order.
+
+    The keys are the nodes of a perfect binary search tree, stored level by
+    level as in a binary heap: the root at position 1, and the children of
+    node k at 2k and 2k + 1. The first probes of all searches hit the same
+    few positions at the front, which stay in the cache, and the two children
+    of a node are next to each other.
+
+    The search goes down by k = 2k + (key[k] < x) without any branch on the
+    comparison. When it falls off the tree, the last node where it went left
+    holds the lower bound. Going right appends a 1 bit to k and going left a
+    0 bit, so that node is found by stripping the trailing 1 bits and one 0
+    bit from k.
+
+    The tree is padded to 2^h - 1 nodes with copies of the largest key, so
+    that the sorted position of node k follows from k by arithmetic.
+
+    Attributes:
+        _keys (array.array/list): Keys in Eytzinger order, from position 1.
+        _height (int): Number of levels.
+
+    >>> index = EytzingerIndex([2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+    >>> index.rank(11), index.rank(12), index.rank(1), index.rank(30)
+    (4, 5, 0, 10)
+    >>> index.lowerBound(12), index.lowerBound(30)
+    (13, None)
+    >>> 17 in index, 18 in index
+    (True, False)
+    """
+    def __init__(self, sorted_keys, typecode='l'):
+        """Build the index.
+
+        Args:
+            sorted_keys (sequence): Keys in ascending order.
+            typecode (str/None) ['l']: Typecode of the array.array storing the
+                keys, None means a list of arbitrary keys.
+        """
+        n = len(sorted_keys)
+        self._size = n
+        self._height = n.bit_length()
+        number_nodes = (1 << self._height) - 1
+        self._keys = self._storage(typecode, number_nodes + 1)
+        for k in xrange(1, number_nodes + 1):
+            self._keys[k] = sorted_keys[min(self._sortedPosition(k), n - 1)]
+
+    def _sortedPosition(self, k):
+        """Return the position of node k in the sorted order."""
+        depth = k.bit_length() - 1
+        return ((2 * (k - (1 << depth)) + 1) << (self._height - 1 - depth)) - 1
+
+    def _lowerBoundNode(self, x):
+        """Return the node holding the lower bound of x, or 0 if none."""
+        keys = self._keys
+        number_nodes = len(keys) - 1
+        k = 1
+        while k <= number_nodes:
+            k = 2 * k + (keys[k] < x)
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def rank(self, x):
+        k = self._lowerBoundNode(x)
+        return self._size if k == 0 else self._sortedPosition(k)
+
+    def lowerBound(self, x):
+        k = self._lowerBoundNode(x)
+        return None if k == 0 else self._keys[k]
+
+
+class StaticBTreeIndex(_StaticIndex):
+    """Static index as an implicit B+ tree.
+
+    The sorted keys are cut into nodes of B keys, which are the leaves. Each
+    node of the level above holds the largest keys of B nodes of the level
+    below, and so on up to a single root node. A search reads one node of B
+    consecutive keys per level, usually one or two cache lines, and descends
+    into the first child whose largest key is >= x. There are only log_B(n)
+    levels, against log_2(n) probes of the binary search.
+
+    The children of node j are nodes jB, jB + 1, ..., jB + B - 1 of the next
+    level, so no pointers are stored. All the levels are kept in one array,
+    the leaves first, so the position of a key in the leaves is its rank. Each
+    level is padded to whole nodes with copies of the largest key, which adds
+    about 1 / B of space.
+
+    Attributes:
+        _keys (array.array/list): All the levels, the leaves first.
+        _offsets (list of int): Position of the first node of each level,
+            the root level last.
+        _node_size (int): B.
+
+    >>> index = StaticBTreeIndex(list(range(0, 200, 2)), node_size=4)
+    >>> len(index._offsets)
+    4
+    >>> index.rank(51), index.rank(50), index.rank(-1), index.rank(1000)
+    (26, 25, 0, 100)
+    >>> index.lowerBound(51), index.lowerBound(1000)
+    (52, None)
+    >>> 198 in index, 199 in index
+    (True, False)
+    """
+    def __init__(self, sorted_keys, typecode='l', node_size=16):
+        """Build the index.
+
+        Args:
+            sorted_keys (sequence): Keys in ascending order.
+            typecode (str/None) ['l']: Typecode of the array.array storing the
+                keys, None means a list of arbitrary keys.
+            node_size (int) [16]: B, the number of keys of each node. 16
+                64-bit keys fill two cache lines.
+
+        Raises:
+            ValueError: If node_size < 2.
+        """
+        if node_size < 2:
+            raise ValueError('node_size should be >= 2.')
+        B = node_size
+        n = len(sorted_keys)
+        self._size = n
+        self._node_size = B
+        self._offsets = []
+        if n == 0:
+            self._keys = self._storage(typecode, 0)
+            return
+        # Number of nodes of each level, from the leaves up.
+        level_nodes = [(n + B - 1) // B]
+        while level_nodes[-1] > 1:
+            level_nodes.append((level_nodes[-1] + B - 1) // B)
+        self._keys = self._storage(typecode, B * sum(level_nodes))
+        keys = self._keys
+        largest = sorted_keys[n - 1]
+        for i in xrange(B * level_nodes[0]):
+            keys[i] = sorted_keys[i] if i < n else largest
+        offset = 0
+        for number_nodes, number_parents in zip(level_nodes,
+                                                level_nodes[1:]):
+            self._offsets.append(offset)
+            parent_offset = offset + B * number_nodes
+            for j in xrange(B * number_parents):
+                keys[parent_offset + j] = (
+                    keys[offset + B * j + B - 1] if j < number_nodes
+                    else largest)
+            offset = parent_offset
+        self._offsets.append(offset)
+        self._offsets.reverse()
+
+    def rank(self, x):
+        if self._size == 0:
+            return 0
+        B = self._node_size
+        keys = self._keys
+        node = 0
+        for offset in self._offsets[:-1]:
+            start = offset + B * node
+            child = bisect.bisect_left(keys, x, start, start + B) - start
+            if child == B:
+                return self._size
+            node = B * node + child
+        return min(bisect.bisect_left(keys, x, B * node, B * node + B),
+                   self._size)
+
+    def lowerBound(self, x):
+        r = self.rank(x)
+        return None if r == self._size else self._keys[r]
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
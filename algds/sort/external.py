@@ -0,0 +1,200 @@
+"""External merge sort for data larger than memory.
+
+An external sort only keeps a bounded number of records in memory. It reads
+the input in runs which fit in memory, sorts each run by an in-memory sort,
+and spills it to a temporary file. Then the runs are merged from their files,
+fan_in runs at a time, holding one buffer for each run. If there are more
+than fan_in runs, the merged runs are spilled again, and the passes go on
+until at most fan_in runs are left for the final merge.
+
+With m records per run and fan-in f, n records are merged in
+ceil(log_f(n / m)) passes over the disk.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['externalSort']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+sys.path.append('../../')
+
+from algds.sort.sort import kWayMerge, sort
+
+try:
+    import cPickle as pickle
+except ImportError:  # Python 3
+    import pickle
+
+
+def externalSort(source, key=None, reverse=False, run_size=10 ** 6,
+                 fan_in=64, record_size=None, buffer_size=1 << 16,
+                 temp_dir=None):
+    """Sort the records of source with bounded memory, yielding them in
+    order.
+
+    The records are either arbitrary picklable objects from an iterable, e.g.,
+    the lines of a text file, or fixed-width binary records read from a binary
+    file. At most run_size records, plus one buffered record from each of
+    fan_in runs, are in memory at any time. If all the records fit in one run,
+    no file is written. The temporary files are removed once the generator is
+    exhausted or closed. It is stable: the runs are sorted stably, and
+    kWayMerge() breaks the ties by the order of the runs.
+
+    Args:
+        source (iterable/file): The records, or a binary file of fixed-width
+            records if record_size is given.
+        key (callable/None) [None]: Extract the comparison key from each
+            record.
+        reverse (bool) [False]: Sort in descending order.
+        run_size (int) [10^6]: Maximum number of records sorted in memory.
+        fan_in (int) [64]: Maximum number of runs merged at once.
+        record_size (int/None) [None]: Number of bytes of each record, None
+            means the records are pickled to the temporary files.
+        buffer_size (int) [2^16]: Number of bytes buffered for each temporary
+            file.
+        temp_dir (str/None) [None]: Where to put the temporary files, None
+            means the default of the tempfile module.
+
+    Yields:
+        The records in sorted order.
+
+    Raises:
+        ValueError: If run_size < 1 or fan_in < 2, or a fixed-width record
+            is truncated.
+
+    >>> records = [(i * 7919) % 1009 for i in range(1009)]
+    >>> merged = externalSort(records, run_size=100, fan_in=4)
+    >>> list(merged) == list(range(1009))
+    True
+    >>> lines = ['pear\\n', 'Apple\\n', 'fig\\n']
+    >>> list(externalSort(lines, key=str.lower, run_size=2))
+    ['Apple\\n', 'fig\\n', 'pear\\n']
+    >>> import io
+    >>> data = io.BytesIO(b'dogcatantbee')
+    >>> merged = externalSort(data, reverse=True, run_size=2, record_size=3)
+    >>> list(merged) == [b'dog', b'cat', b'bee', b'ant']
+    True
+    """
+    if run_size < 1:
+        raise ValueError('run_size should be >= 1.')
+    if fan_in < 2:
+        raise ValueError('fan_in should be >= 2.')
+    if record_size is not None:
+        source = _readFixed(source, record_size)
+    records = iter(source)
+    run = _sortRun(list(itertools.islice(records, run_size)), key, reverse)
+    if len(run) < run_size:
+        for x in run:
+            yield x
+        return
+
+    directory = tempfile.mkdtemp(prefix='externalsort', dir=temp_dir)
+    try:
+        paths = []
+        while run:
+            paths.append(_spill(directory, len(paths), run, record_size,
+                                buffer_size))
+            run = _sortRun(list(itertools.islice(records, run_size)), key,
+                           reverse)
+        number_runs = len(paths)
+        while len(paths) > fan_in:
+            merged_paths = []
+            for i in xrange(0, len(paths), fan_in):
+                group = paths[i:i + fan_in]
+                readers = [_read(path, record_size, buffer_size)
+                           for path in group]
+                merged_paths.append(_spill(
+                    directory, number_runs,
+                    kWayMerge(readers, key=key, reverse=reverse),
+                    record_size, buffer_size))
+                number_runs += 1
+                for path in group:
+                    os.remove(path)
+            paths = merged_paths
+        readers = [_read(path, record_size, buffer_size) for path in paths]
+        for x in kWayMerge(readers, key=key, reverse=reverse):
+            yield x
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _sortRun(run, key, reverse):
+    """Sort a run in memory stably.
+
+    sort() is stable with a key, but without one it may pick the unstable
+    introspective sort, so the natural merge sort is used instead.
+
+    >>> run = [1.0, 0, 1, True] * 10
+    >>> _sortRun(run, None, False)[9:14]
+    [0, 1.0, 1, True, 1.0]
+    """
+    if key is None:
+        return sort(run, 'natural_merge', reverse=reverse)
+    return sort(run, key=key, reverse=reverse)
+
+
+def _readFixed(f, record_size):
+    """Read fixed-width records from the binary file f.
+
+    Raises:
+        ValueError: If the last record is truncated.
+    """
+    while True:
+        record = f.read(record_size)
+        if not record:
+            return
+        if len(record) != record_size:
+            raise ValueError('The last record is truncated.')
+        yield record
+
+
+def _spill(directory, number, records, record_size, buffer_size):
+    """Write the records to the number-th run file, and return its path."""
+    path = os.path.join(directory, 'run{}'.format(number))
+    with open(path, 'wb', buffer_size) as f:
+        if record_size is None:
+            pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+            for x in records:
+                pickler.dump(x)
+                # Do not keep every pickled record in the memo.
+                pickler.clear_memo()
+        else:
+            for x in records:
+                f.write(x)
+    return path
+
+
+def _read(path, record_size, buffer_size):
+    """Iterate over the records of a run file."""
+    with open(path, 'rb', buffer_size) as f:
+        if record_size is None:
+            unpickler = pickle.Unpickler(f)
+            while True:
+                try:
+                    yield unpickler.load()
+                except EOFError:
+                    return
+        else:
+            for x in _readFixed(f, record_size):
+                yield x
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,249 @@
+"""Parallel sorting on multiple processes.
+
+Python threads cannot sort in parallel because of the global interpreter lock,
+so the work is spread over worker processes. The list is cut into one chunk
+per worker, and the chunks are sorted in parallel. Then the sorted runs are
+cut again by common splitters into one partition per worker, and each worker
+merges its partition of all the runs with a heap. The partitions are in order,
+so the merged partitions only need to be concatenated, and no step is left for
+a single process.
+
+Sending items to a worker process pickles them, which costs as much as the
+sorting itself. An array.array of numbers is therefore copied once into shared
+memory, which the workers read and write directly, and only the boundaries of
+the chunks are sent.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['parallelSort']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import array
+import bisect
+import ctypes
+import multiprocessing
+import sys
+sys.path.append('../../')
+
+from algds.sort.sort import kWayMerge, sort
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # Python 2
+    ProcessPoolExecutor = None
+
+try:
+    xrange
+except NameError:  # Python 3
+    xrange = range
+
+# Lists shorter than this for each worker are sorted in this process, since
+# starting the workers would take longer.
+_PARALLEL_CUTOFF = 1 << 14
+
+# (typecode, input, output) shared memory, set in each worker process.
+_shared = None
+
+
+def parallelSort(A, workers=None, key=None, reverse=False):
+    """Sort A in place on several processes.
+
+    The steps are
+    1. Cut A into one chunk per worker, and sort the chunks in parallel by
+       sort(), which picks the algorithm for each chunk.
+    2. Take workers - 1 splitters from a regular sample of the sorted runs.
+       Cut each run by bisection at the splitters, so that the p-th partition
+       of every run holds the items between the (p - 1)-th and p-th splitters.
+    3. Merge the p-th partitions of all the runs by kWayMerge() in parallel.
+
+    With a key, the keys are computed in this process, and the workers sort
+    (key, index) pairs, so neither the key function nor the items need to be
+    pickled. It is stable.
+
+    Args:
+        A (list/array.array): Sequence to be sorted in place.
+        workers (int/None) [None]: Number of worker processes, None means the
+            number of CPUs.
+        key (callable/None) [None]: Extract the comparison key from each item.
+        reverse (bool) [False]: Sort in descending order.
+
+    Returns:
+        A
+
+    >>> A = [(i * 7919) % 100003 for i in range(100003)]
+    >>> parallelSort(A, workers=2) == list(range(100003))
+    True
+    >>> A = array.array('d', [(i * 7919) % 100003 for i in range(100003)])
+    >>> parallelSort(A, workers=2, reverse=True)[:3].tolist()
+    [100002.0, 100001.0, 100000.0]
+    >>> A = [str(i) for i in range(100003)]
+    >>> B = parallelSort(list(A), workers=2, key=len)
+    >>> B == sorted(A, key=len)
+    True
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    n = len(A)
+    if workers <= 1 or n < workers * _PARALLEL_CUTOFF:
+        return sort(A, key=key, reverse=reverse)
+    if reverse:
+        A.reverse()
+    if (isinstance(A, array.array) and A.typecode in 'bBhHiIlLqQfd' and
+            key is None):
+        _sortShared(A, workers)
+    else:
+        records = A if key is None else [(key(x), i) for i, x in enumerate(A)]
+        records = _sortRecords(records, workers)
+        if key is None:
+            A[:] = records
+        else:
+            items = list(A)
+            A[:] = [items[i] for _, i in records]
+    if reverse:
+        A.reverse()
+    return A
+
+
+def _chunks(n, workers):
+    """Return the boundaries of one chunk of [0, n) per worker."""
+    return [(n * w // workers, n * (w + 1) // workers)
+            for w in xrange(workers)]
+
+
+def _splitRuns(runs, bounds, workers):
+    """Cut the sorted runs into one partition per worker.
+
+    Args:
+        runs (sequence): A sequence holding all the runs.
+        bounds (list of tuple): (lo, hi) of each run in runs.
+        workers (int): Number of partitions.
+
+    Returns:
+        list of list of tuple: (lo, hi) of each run in each partition.
+    """
+    samples = []
+    for lo, hi in bounds:
+        step = max(1, (hi - lo) // workers)
+        samples.extend(runs[i] for i in xrange(lo, hi, step))
+    sort(samples)
+    splitters = [samples[len(samples) * p // workers]
+                 for p in xrange(1, workers)]
+    partitions = [[] for _ in xrange(workers)]
+    for lo, hi in bounds:
+        cuts = ([lo] + [bisect.bisect_left(runs, x, lo, hi)
+                        for x in splitters] + [hi])
+        for p in xrange(workers):
+            partitions[p].append((cuts[p], cuts[p + 1]))
+    return partitions
+
+
+def _makePool(workers, initializer=None, initargs=()):
+    if ProcessPoolExecutor is not None:
+        return ProcessPoolExecutor(workers, initializer=initializer,
+                                   initargs=initargs)
+    return multiprocessing.Pool(workers, initializer, initargs)
+
+
+def _closePool(pool):
+    if ProcessPoolExecutor is not None:
+        pool.shutdown()
+    else:
+        pool.close()
+        pool.join()
+
+
+def _sortRecords(records, workers):
+    """Sort a list in parallel, pickling the items to the workers."""
+    bounds = _chunks(len(records), workers)
+    pool = _makePool(workers)
+    try:
+        runs = list(pool.map(_sortChunk,
+                             [records[lo:hi] for lo, hi in bounds]))
+        # Put the runs back together, so that they can be cut by bisection.
+        records = [x for run in runs for x in run]
+        partitions = _splitRuns(records, bounds, workers)
+        merged = pool.map(_mergeChunks,
+                          [[records[lo:hi] for lo, hi in partition]
+                           for partition in partitions])
+        return [x for partition in merged for x in partition]
+    finally:
+        _closePool(pool)
+
+
+def _sortChunk(chunk):
+    return sort(chunk)
+
+
+def _mergeChunks(runs):
+    return list(kWayMerge(runs))
+
+
+def _sortShared(A, workers):
+    """Sort an array.array in parallel through shared memory."""
+    n = len(A)
+    itemsize = A.itemsize
+    shared_in = multiprocessing.RawArray(A.typecode, n)
+    shared_out = multiprocessing.RawArray(A.typecode, n)
+    ctypes.memmove(shared_in, A.buffer_info()[0], n * itemsize)
+    bounds = _chunks(n, workers)
+    pool = _makePool(workers, _initShared,
+                     (A.typecode, shared_in, shared_out))
+    try:
+        list(pool.map(_sortSharedChunk, bounds))
+        partitions = _splitRuns(shared_in, bounds, workers)
+        starts = [0]
+        for partition in partitions:
+            starts.append(starts[-1] + sum(hi - lo for lo, hi in partition))
+        list(pool.map(_mergeSharedChunks, zip(partitions, starts)))
+    finally:
+        _closePool(pool)
+    ctypes.memmove(A.buffer_info()[0], shared_out, n * itemsize)
+
+
+def _initShared(typecode, shared_in, shared_out):
+    global _shared
+    _shared = (typecode, shared_in, shared_out)
+
+
+def _readShared(shared, lo, hi):
+    """Copy shared[lo:hi] into an array.array."""
+    typecode = _shared[0]
+    itemsize = array.array(typecode).itemsize
+    return array.array(typecode, ctypes.string_at(
+        ctypes.addressof(shared) + lo * itemsize, (hi - lo) * itemsize))
+
+
+def _writeShared(shared, lo, chunk):
+    """Copy the array.array chunk into shared[lo:lo + len(chunk)]."""
+    ctypes.memmove(ctypes.addressof(shared) + lo * chunk.itemsize,
+                   chunk.buffer_info()[0], len(chunk) * chunk.itemsize)
+
+
+def _sortSharedChunk(bound):
+    _, shared_in, _ = _shared
+    lo, hi = bound
+    _writeShared(shared_in, lo, sort(_readShared(shared_in, lo, hi)))
+
+
+def _mergeSharedChunks(partition_start):
+    typecode, shared_in, shared_out = _shared
+    partition, start = partition_start
+    runs = [_readShared(shared_in, lo, hi) for lo, hi in partition]
+    _writeShared(shared_out, start, array.array(typecode, kWayMerge(runs)))
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,221 @@
+"""Selection and partial sorting.
+
+Often only a few items of the sorted order are needed, such as the median or
+the top 100 scores. Selecting them without sorting everything takes O(n) time
+instead of O(n log n).
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['nthElement', 'medianOfMediansSelect', 'topK', 'partialSort']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import sys
+sys.path.append('../../')
+
+from algds.sort.sort import (_INSERTION_CUTOFF, _ReverseKey, _hoarePartition,
+                             _insertionSortRange, _introSortRange, _sortWith)
+from algds.tree.priorityqueue import PriorityQueue
+
+
+def _checkIndex(A, k):
+    """Return k as a non-negative index of A.
+
+    Raises:
+        IndexError: If k is out of range.
+    """
+    if k < 0:
+        k += len(A)
+    if not 0 <= k < len(A):
+        raise IndexError('selection index out of range.')
+    return k
+
+
+def nthElement(A, k, key=None):
+    """Rearrange A in place, so that A[k] is the item which would be there if
+    A were sorted, and return it.
+
+    Every item of A[:k] is <= A[k], and every item of A[k + 1:] is >= A[k],
+    as in std::nth_element. The quickselect partitions A like the quick sort,
+    but only goes on with the side containing k, so it takes O(n) expected
+    time. This is an introselect: the pivots are chosen like the introsort,
+    and if the range has not shrunk after 2 log n partitions, the pivots are
+    chosen by the median of medians, so the worst case is O(n) as well.
+
+    Args:
+        A (list/array.array): Sequence to be rearranged.
+        k (int): Index in the sorted order, negative values count from the
+            end.
+        key (callable/None) [None]: Extract the comparison key from each item.
+
+    Raises:
+        IndexError: If k is out of range.
+
+    >>> A = [54, 26, 93, 17, 77, 31, 44, 55, 20]
+    >>> nthElement(A, 4)
+    44
+    >>> max(A[:4]) <= A[4] <= min(A[5:])
+    True
+    >>> nthElement(list(range(1000)), -1)
+    999
+    >>> nthElement(['bb', 'a', 'ccc'], 0, key=len)
+    'a'
+    """
+    k = _checkIndex(A, k)
+    _sortWith(lambda D: _select(D, 0, len(D), k, True), A, key, False)
+    return A[k]
+
+
+def medianOfMediansSelect(A, k, key=None):
+    """Same as nthElement(), but every pivot is chosen by the median of
+    medians, which guarantees O(n) time.
+
+    The items are divided into groups of 5, and the median of each group is
+    found by the insertion sort. The pivot is the median of these n / 5
+    medians, found recursively. At least half of the medians are <= the
+    pivot, and each of them is >= 3 items of its group, so at least 3n / 10
+    items are <= the pivot, and as many are >= the pivot. Each partition
+    discards at least 3n / 10 items, so T(n) <= T(n / 5) + T(7n / 10) + O(n),
+    i.e., T(n) = O(n). The constant is large, so nthElement() is faster in
+    practice.
+
+    Raises:
+        IndexError: If k is out of range.
+
+    >>> A = [54, 26, 93, 17, 77, 31, 44, 55, 20]
+    >>> medianOfMediansSelect(A, 4)
+    44
+    >>> A = [(i * 7919) % 1009 for i in range(1009)]
+    >>> medianOfMediansSelect(A, 504)
+    504
+    """
+    k = _checkIndex(A, k)
+    _sortWith(lambda D: _select(D, 0, len(D), k, False), A, key, False)
+    return A[k]
+
+
+def _select(A, lo, hi, k, introspective):
+    """Rearrange A[lo:hi] so that A[k] is in its sorted position.
+
+    Args:
+        introspective (bool): Start with the pivots of the introsort and
+            fall back to the median of medians. Otherwise, always use the
+            median of medians.
+    """
+    depth = 2 * (hi - lo).bit_length() if introspective else 0
+    while hi - lo > _INSERTION_CUTOFF:
+        if depth > 0:
+            depth -= 1
+            q = _hoarePartition(A, lo, hi)
+        else:
+            q = _hoarePartition(A, lo, hi, _medianOfMedians(A, lo, hi))
+        if k == q:
+            return
+        if k < q:
+            hi = q
+        else:
+            lo = q + 1
+    _insertionSortRange(A, lo, hi)
+
+
+def _medianOfMedians(A, lo, hi):
+    """Return the index of the median of the medians of the groups of 5 items
+    of A[lo:hi]. The medians are moved to the front of the range."""
+    j = lo
+    for i in xrange(lo, hi, 5):
+        end = min(i + 5, hi)
+        _insertionSortRange(A, i, end)
+        median = (i + end - 1) // 2
+        A[j], A[median] = A[median], A[j]
+        j += 1
+    mid = lo + (j - lo) // 2
+    _select(A, lo, j, mid, False)
+    return mid
+
+
+def topK(iterable, k, key=None, largest=True):
+    """Return the k largest (or smallest) items of the iterable, the best
+    first.
+
+    The items are streamed through a priority queue of at most k items, whose
+    root is the worst item kept so far. A new item better than the root
+    replaces it, otherwise it is dropped. Hence it takes O(n log k) time and
+    only O(k) memory, so the iterable may be much larger than memory. Equal
+    items are returned in their original order, like heapq.nlargest().
+
+    Args:
+        iterable: Items to select from.
+        k (int): Number of items to return.
+        key (callable/None) [None]: Extract the comparison key from each item.
+        largest (bool) [True]: Return the largest items, otherwise the
+            smallest ones.
+
+    Returns:
+        list: The min(k, n) best items, the best first.
+
+    >>> topK([54, 26, 93, 17, 77, 31, 44, 55, 20], 3)
+    [93, 77, 55]
+    >>> topK([54, 26, 93, 17, 77, 31, 44, 55, 20], 3, largest=False)
+    [17, 20, 26]
+    >>> topK(iter(range(10 ** 5)), 2, key=lambda x: x % 1000)
+    [999, 1999]
+    >>> topK(['b', 'a'], 5)
+    ['b', 'a']
+    """
+    if k <= 0:
+        return []
+    queue = PriorityQueue()
+    for i, x in enumerate(iterable):
+        kx = x if key is None else key(x)
+        if not largest:
+            kx = _ReverseKey(kx)
+        # -i makes the entries distinct, so x is never compared, and makes a
+        # later item worse than an earlier one with an equal key.
+        entry = (kx, -i, x)
+        if queue.size() < k:
+            queue.insert(entry)
+        elif queue.findMin()[0] < kx:
+            queue.replaceMin(entry)
+    result = []
+    while not queue.isEmpty():
+        result.append(queue.delMin()[2])
+    result.reverse()
+    return result
+
+
+def partialSort(A, k, key=None):
+    """Rearrange A in place, so that A[:k] holds the k smallest items in
+    sorted order, and return A.
+
+    The order of the other items is unspecified. The k-th smallest item is
+    selected by nthElement(), and then the k smallest ones are sorted by the
+    introsort, which takes O(n + k log k) time.
+
+    >>> partialSort([54, 26, 93, 17, 77, 31, 44, 55, 20], 3)[:3]
+    [17, 20, 26]
+    >>> partialSort(['ccc', 'a', 'bb'], 2, key=len)[:2]
+    ['a', 'bb']
+    """
+    k = min(max(k, 0), len(A))
+
+    def partialSortFunction(D):
+        if k < len(D):
+            _select(D, 0, len(D), k, True)
+        _introSortRange(D, 0, k, 2 * k.bit_length())
+    return _sortWith(partialSortFunction, A, key, False)
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
@@ -3,16 +3,51 @@
 from __future__ import division, print_function
 
 __all__ = ['bubbleSort', 'selectionSort', 'insertionSort', 'shellSort',
-           'mergeSort', 'quickSort']
+           'mergeSort', 'quickSort', 'heapSort', 'introSort',
+           'naturalMergeSort', 'bufferedMergeSort', 'bottomUpMergeSort',
+           'countingSort', 'lsdRadixSort', 'msdRadixSort', 'bucketSort',
+           'sort', 'kWayMerge']
 __author__ = 'Hao Zhang'
 __copyright__ = 'Copyright @2017 LAMDA'
 __date__ = '2017-07-28'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-07-28'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
+import array
+import bisect
+import collections
+import heapq
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    _INTEGER_TYPES = (int, long)
+    _STRING_TYPES = (str, unicode)
+except NameError:  # Python 3
+    _INTEGER_TYPES = (int,)
+    _STRING_TYPES = (str, bytes)
+
+try:
+    xrange
+except NameError:  # Python 3
+    xrange = range
+
+# Ranges no longer than this are finished by insertion sort.
+_INSERTION_CUTOFF = 16
+# Number of consecutive wins of one run before a merge starts galloping.
+_MIN_GALLOP = 7
+# The radix sorts distribute integer keys by one byte in each pass.
+_RADIX_BITS = 8
+_RADIX = 1 << _RADIX_BITS
+# Typecodes of array.array holding integers.
+_INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
 
 def bubbleSort(A):
     """The bubble sort compares adjacent items and exchanges those that are out
@@ -289,6 +324,1037 @@ def _partition(A, p, r):
     return right_mark
 
 
+def _insertionSortRange(A, lo, hi):
+    """Insertion sort on A[lo:hi]."""
+    for i in xrange(lo + 1, hi):
+        current_value = A[i]
+        j = i - 1
+        while j >= lo and current_value < A[j]:
+            A[j + 1] = A[j]
+            j -= 1
+        A[j + 1] = current_value
+
+
+def _sortWith(sort_function, A, key, reverse, keys=None):
+    """Run sort_function on A with the key and reverse options of sorted().
+
+    With a key, A is decorated into (key(x), i, x) triples. The index i makes
+    the triples distinct, so the items themselves are never compared and
+    equal keys keep their original order, even for an unstable sort_function.
+    For reverse, A is reversed before and after an ascending sort, which keeps
+    the equal items in their original order as well.
+
+    Args:
+        sort_function (callable): Sort a list in ascending order in place.
+        A (list/array.array): Sequence to be sorted in place.
+        key (callable/None): Extract the comparison key from each item.
+        reverse (bool): Sort in descending order.
+        keys (list/None) [None]: key(x) for each item of A, if computed
+            already.
+
+    Returns:
+        A
+    """
+    if reverse:
+        A.reverse()
+        if keys is not None:
+            keys = keys[::-1]
+    if key is None:
+        sort_function(A)
+    else:
+        if keys is None:
+            keys = [key(x) for x in A]
+        decorated = [(keys[i], i, x) for i, x in enumerate(A)]
+        sort_function(decorated)
+        for i, item in enumerate(decorated):
+            A[i] = item[2]
+    if reverse:
+        A.reverse()
+    return A
+
+
+def heapSort(A, key=None, reverse=False):
+    """Heap sort builds a max heap in place, and then repeatedly swaps the
+    maximum to the end of the unsorted part.
+
+    It takes O(n log n) time in the worst case and O(1) extra space, but jumps
+    around the list a lot, so it is slower than the quick sort on average.
+
+    >>> heapSort([])
+    []
+    >>> heapSort([2, 1, 3])
+    [1, 2, 3]
+    >>> heapSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> heapSort(['b', 'C', 'a'], key=str.lower, reverse=True)
+    ['C', 'b', 'a']
+    """
+    return _sortWith(_heapSort, A, key, reverse)
+
+
+def _heapSort(A):
+    _heapSortRange(A, 0, len(A))
+
+
+def _heapSortRange(A, lo, hi):
+    """Heap sort on A[lo:hi]."""
+    n = hi - lo
+    for i in xrange(n // 2 - 1, -1, -1):
+        _siftDown(A, lo, i, n)
+    for end in xrange(n - 1, 0, -1):
+        A[lo], A[lo + end] = A[lo + end], A[lo]
+        _siftDown(A, lo, 0, end)
+
+
+def _siftDown(A, lo, i, n):
+    """Sift A[lo + i] down the max heap A[lo:lo + n]."""
+    current_value = A[lo + i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and A[lo + child] < A[lo + child + 1]:
+            child += 1
+        if not current_value < A[lo + child]:
+            break
+        A[lo + i] = A[lo + child]
+        i = child
+    A[lo + i] = current_value
+
+
+def introSort(A, key=None, reverse=False):
+    """The introspective sort is a quick sort which cannot degrade to O(n^2).
+
+    It improves the quick sort in three ways:
+    1. The pivot is the median of the first, middle and last items, or
+       Tukey's ninther (the median of three such medians) for long ranges.
+       Sorted and reversed lists are split in half instead of the worst case.
+    2. The recursion depth is limited to 2 log n. Beyond that, the range is
+       handed to the heap sort, so the worst case is O(n log n). Only the
+       smaller side is sorted recursively and the larger one by the loop, so
+       the stack is O(log n) deep anyway.
+    3. Ranges of at most 16 items are finished by the insertion sort, which
+       is faster than partitioning on short ranges.
+
+    The partition stops at items equal to the pivot on both sides, so lists
+    with many duplicates are split in half as well.
+
+    >>> introSort([])
+    []
+    >>> introSort([1])
+    [1]
+    >>> introSort([2, 1, 3])
+    [1, 2, 3]
+    >>> introSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> introSort(list(range(10 ** 5))) == list(range(10 ** 5))
+    True
+    >>> introSort([(1, 'b'), (0, 'c'), (1, 'a')], key=lambda x: x[0])
+    [(0, 'c'), (1, 'b'), (1, 'a')]
+    """
+    return _sortWith(_introSort, A, key, reverse)
+
+
+def _introSort(A):
+    n = len(A)
+    _introSortRange(A, 0, n, 2 * n.bit_length())
+
+
+def _introSortRange(A, lo, hi, depth):
+    """Introspective sort on A[lo:hi], with depth partitioning levels left."""
+    while hi - lo > _INSERTION_CUTOFF:
+        if depth == 0:
+            _heapSortRange(A, lo, hi)
+            return
+        depth -= 1
+        q = _hoarePartition(A, lo, hi)
+        if q - lo < hi - q:
+            _introSortRange(A, lo, q, depth)
+            lo = q + 1
+        else:
+            _introSortRange(A, q + 1, hi, depth)
+            hi = q
+    _insertionSortRange(A, lo, hi)
+
+
+def _medianOfThree(A, i, j, k):
+    """Return the index of the median of A[i], A[j] and A[k]."""
+    a, b, c = A[i], A[j], A[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def _pivotIndex(A, lo, hi):
+    """Choose the pivot of A[lo:hi], which has at least 3 items."""
+    n = hi - lo
+    mid = lo + n // 2
+    if n >= 128:
+        step = n // 8
+        return _medianOfThree(
+            A, _medianOfThree(A, lo, lo + step, lo + 2 * step),
+            _medianOfThree(A, mid - step, mid, mid + step),
+            _medianOfThree(A, hi - 1 - 2 * step, hi - 1 - step, hi - 1))
+    return _medianOfThree(A, lo, mid, hi - 1)
+
+
+def _hoarePartition(A, lo, hi, p=None):
+    """Partite A[lo:hi] around the pivot A[p], chosen by _pivotIndex() if p is
+    None.
+
+    Returns:
+        int: Final position q of the pivot. Items in A[lo:q] are <= the pivot,
+            and items in A[q + 1:hi] are >= the pivot.
+    """
+    if p is None:
+        p = _pivotIndex(A, lo, hi)
+    A[lo], A[p] = A[p], A[lo]
+    pivot = A[lo]
+    left_mark = lo
+    right_mark = hi
+    while True:
+        # Stop at a value that is >= pivot.
+        left_mark += 1
+        while left_mark < hi and A[left_mark] < pivot:
+            left_mark += 1
+        # Stop at a value that is <= pivot. A[lo] stops the scan.
+        right_mark -= 1
+        while pivot < A[right_mark]:
+            right_mark -= 1
+        if left_mark >= right_mark:
+            break
+        A[left_mark], A[right_mark] = A[right_mark], A[left_mark]
+    A[lo], A[right_mark] = A[right_mark], A[lo]
+    return right_mark
+
+
+def naturalMergeSort(A, key=None, reverse=False):
+    """The natural merge sort merges the runs already present in the list, in
+    the manner of Timsort.
+
+    1. The list is cut into runs: maximal ascending runs, and strictly
+       descending runs which are reversed in place. Runs shorter than minrun
+       (between 32 and 64) are extended by binary insertion sort.
+    2. The runs are pushed on a stack, and adjacent runs are merged whenever
+       their lengths break the invariants of Timsort. Hence the merges stay
+       balanced and the stack is O(log n) deep.
+    3. A merge first skips the prefix of the left run and the suffix of the
+       right run which are already in place. If one run wins 7 times in a row,
+       the merge starts galloping: it finds by exponential search how many
+       items to take from that run, and moves them with one slice assignment.
+
+    It is stable, takes O(n) time on sorted or reversed lists and O(n log n)
+    time in the worst case, and uses at most n / 2 extra space.
+
+    >>> naturalMergeSort([])
+    []
+    >>> naturalMergeSort([2, 1, 3])
+    [1, 2, 3]
+    >>> naturalMergeSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> A = list(range(1000, 2000)) + list(range(1000))
+    >>> naturalMergeSort(A) == list(range(2000))
+    True
+    >>> naturalMergeSort(['b', 'C', 'a'], key=str.lower)
+    ['a', 'b', 'C']
+    """
+    return _sortWith(_naturalMergeSort, A, key, reverse)
+
+
+def _minRun(n):
+    """Return the minimum run length, so that n / minrun is a power of 2 or
+    a bit less than one."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _countRun(A, lo, hi):
+    """Return the end of the run starting at lo, which is made ascending."""
+    i = lo + 1
+    if i == hi:
+        return hi
+    if A[i] < A[lo]:
+        while i + 1 < hi and A[i + 1] < A[i]:
+            i += 1
+        A[lo:i + 1] = A[lo:i + 1][::-1]
+    else:
+        while i + 1 < hi and not A[i + 1] < A[i]:
+            i += 1
+    return i + 1
+
+
+def _binaryInsertionSort(A, lo, hi, start):
+    """Sort A[lo:hi], given that A[lo:start] is sorted."""
+    for i in xrange(start, hi):
+        current_value = A[i]
+        j = bisect.bisect_right(A, current_value, lo, i)
+        A[j + 1:i + 1] = A[j:i]
+        A[j] = current_value
+
+
+def _naturalMergeSort(A):
+    n = len(A)
+    min_run = _minRun(n)
+    runs = []  # (start, length) of the pending runs.
+    lo = 0
+    while lo < n:
+        end = _countRun(A, lo, n)
+        if end - lo < min_run:
+            forced_end = min(lo + min_run, n)
+            _binaryInsertionSort(A, lo, forced_end, end)
+            end = forced_end
+        runs.append((lo, end - lo))
+        _mergeCollapse(A, runs)
+        lo = end
+    while len(runs) > 1:
+        _mergeAt(A, runs, len(runs) - 2)
+
+
+def _mergeCollapse(A, runs):
+    """Merge the runs on top of the stack until the lengths satisfy
+    len[i - 2] > len[i - 1] + len[i] and len[i - 1] > len[i]."""
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or
+                (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _mergeAt(A, runs, i)
+
+
+def _mergeAt(A, runs, i):
+    """Merge the i-th and (i + 1)-th runs on the stack."""
+    start, n1 = runs[i]
+    n2 = runs[i + 1][1]
+    _mergeRuns(A, start, start + n1, start + n1 + n2)
+    runs[i] = (start, n1 + n2)
+    del runs[i + 1]
+
+
+def _gallopLeft(x, A, lo, hi):
+    """Return the first index i in [lo, hi] with x <= A[i], probing lo, lo + 1,
+    lo + 3, lo + 7, ... before a binary search."""
+    left = right = lo
+    offset = 1
+    while right < hi and A[right] < x:
+        left = right + 1
+        right = lo + offset
+        offset = 2 * offset + 1
+    return bisect.bisect_left(A, x, left, min(right, hi))
+
+
+def _gallopRight(x, A, lo, hi):
+    """Return the first index i in [lo, hi] with x < A[i], probing lo, lo + 1,
+    lo + 3, lo + 7, ... before a binary search."""
+    left = right = lo
+    offset = 1
+    while right < hi and not x < A[right]:
+        left = right + 1
+        right = lo + offset
+        offset = 2 * offset + 1
+    return bisect.bisect_right(A, x, left, min(right, hi))
+
+
+def _mergeRuns(A, lo, mid, hi):
+    """Merge the sorted runs A[lo:mid] and A[mid:hi] stably."""
+    # Items of the left run <= A[mid] are already in place, and so are items
+    # of the right run >= A[mid - 1].
+    lo = bisect.bisect_right(A, A[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect.bisect_left(A, A[mid - 1], mid, hi)
+
+    temp = A[lo:mid]
+    n1 = mid - lo
+    i = 0  # Next item of the left run, in temp.
+    j = mid  # Next item of the right run.
+    k = lo  # Next place to fill.
+    min_gallop = _MIN_GALLOP
+    while i < n1 and j < hi:
+        # Take one item at a time until a run wins min_gallop times in a row.
+        count1 = count2 = 0
+        while i < n1 and j < hi:
+            if A[j] < temp[i]:
+                A[k] = A[j]
+                j += 1
+                count1 = 0
+                count2 += 1
+            else:
+                A[k] = temp[i]
+                i += 1
+                count1 += 1
+                count2 = 0
+            k += 1
+            if count1 >= min_gallop or count2 >= min_gallop:
+                break
+        # Gallop while it pays off.
+        while i < n1 and j < hi:
+            end = _gallopRight(A[j], temp, i, n1)
+            count1 = end - i
+            A[k:k + count1] = temp[i:end]
+            k += count1
+            i = end
+            if i == n1:
+                break
+            A[k] = A[j]
+            k += 1
+            j += 1
+            if j == hi:
+                break
+            end = _gallopLeft(temp[i], A, j, hi)
+            count2 = end - j
+            A[k:k + count2] = A[j:end]
+            k += count2
+            j = end
+            if j == hi:
+                break
+            A[k] = temp[i]
+            k += 1
+            i += 1
+            if count1 < _MIN_GALLOP and count2 < _MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+    # The rest of the right run is already in place.
+    A[k:k + n1 - i] = temp[i:]
+
+
+def bufferedMergeSort(A, key=None, reverse=False):
+    """Top-down merge sort which sorts A in place with one auxiliary buffer.
+
+    mergeSort() slices both halves and builds a new list in every merge, which
+    makes O(n log n) short-lived allocations. Here a copy B of A is made once,
+    and the recursion merges by index ranges, alternating the roles of A and B:
+    the halves are sorted into B, and then merged into A. Hence no item is
+    copied except by the merges, and ranges of at most 16 items are finished by
+    the insertion sort. If the two halves are already in order, the merge is
+    replaced by one slice copy.
+
+    It is stable, and uses n extra references of space.
+
+    >>> bufferedMergeSort([])
+    []
+    >>> bufferedMergeSort([2, 1, 3])
+    [1, 2, 3]
+    >>> bufferedMergeSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> A = [(i % 7, i) for i in range(100)]
+    >>> first = lambda x: x[0]
+    >>> bufferedMergeSort(A, key=first) == sorted(A, key=first)
+    True
+    """
+    return _sortWith(_bufferedMergeSort, A, key, reverse)
+
+
+def _bufferedMergeSort(A):
+    _mergeSortRange(A[:], A, 0, len(A))
+
+
+def _mergeSortRange(src, dst, lo, hi):
+    """Sort the items of src[lo:hi] into dst[lo:hi].
+
+    Both src and dst hold the same items in [lo, hi) on entry. src is used
+    as the buffer, so it is scrambled on exit.
+    """
+    if hi - lo <= _INSERTION_CUTOFF:
+        _insertionSortRange(dst, lo, hi)
+        return
+    mid = (lo + hi) // 2
+    _mergeSortRange(dst, src, lo, mid)
+    _mergeSortRange(dst, src, mid, hi)
+    if not src[mid] < src[mid - 1]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    _mergeInto(src, dst, lo, mid, hi)
+
+
+def _mergeInto(src, dst, lo, mid, hi):
+    """Merge the sorted src[lo:mid] and src[mid:hi] into dst[lo:hi] stably."""
+    i = lo
+    j = mid
+    k = lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def bottomUpMergeSort(A, key=None, reverse=False):
+    """Iterative merge sort without recursion.
+
+    Blocks of 16 items are sorted by the insertion sort first. Then runs of
+    width 16, 32, 64, ... are merged pairwise, from A into the buffer and back
+    in alternate passes. If the last pass ends in the buffer, it is copied back
+    to A.
+
+    It is stable, and uses n extra references of space.
+
+    >>> bottomUpMergeSort([])
+    []
+    >>> bottomUpMergeSort([2, 1, 3])
+    [1, 2, 3]
+    >>> bottomUpMergeSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> bottomUpMergeSort(list(range(10)), reverse=True)
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+    """
+    return _sortWith(_bottomUpMergeSort, A, key, reverse)
+
+
+def _bottomUpMergeSort(A):
+    n = len(A)
+    for lo in xrange(0, n, _INSERTION_CUTOFF):
+        _insertionSortRange(A, lo, min(lo + _INSERTION_CUTOFF, n))
+    if n <= _INSERTION_CUTOFF:
+        return
+    src = A
+    dst = A[:]
+    width = _INSERTION_CUTOFF
+    while width < n:
+        for lo in xrange(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid == hi or not src[mid] < src[mid - 1]:
+                dst[lo:hi] = src[lo:hi]
+            else:
+                _mergeInto(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    if src is not A:
+        A[:] = src
+
+
+def _distributeWith(sort_function, A, key, reverse, keys=None):
+    """Run a non-comparison sort_function on A with the key and reverse
+    options of sorted().
+
+    Unlike _sortWith(), the keys are passed to sort_function as a separate
+    list, since the items are never compared. For reverse, the items are
+    reversed before and after a stable ascending sort.
+
+    Args:
+        sort_function (callable): Given the items and their keys, return a
+            list of the items stably sorted by the keys.
+        A (list/array.array): Sequence to be sorted in place.
+        key (callable/None): Extract the sort key from each item.
+        reverse (bool): Sort in descending order.
+        keys (list/None) [None]: key(x) for each item of A, if computed
+            already.
+
+    Returns:
+        A
+    """
+    items = list(A)
+    if keys is None:
+        keys = items if key is None else [key(x) for x in items]
+    if reverse:
+        items.reverse()
+        if keys is not items:
+            keys = keys[::-1]
+    result = sort_function(items, keys)
+    if reverse:
+        result.reverse()
+    if isinstance(A, array.array):
+        A[:] = array.array(A.typecode, result)
+    else:
+        A[:] = result
+    return A
+
+
+def _isIntegerArray(A):
+    return isinstance(A, array.array) and A.typecode in _INTEGER_TYPECODES
+
+
+def _numpyRadixSort(A, reverse):
+    """LSD radix sort of an integer array.array vectorised by NumPy.
+
+    The items are shifted to non-negative offsets from the minimum. In each
+    pass, numpy.argsort() of the byte digits is a stable counting sort, so the
+    whole sort takes O(n) time per byte of the range of the items.
+    """
+    if len(A) == 0:
+        return A
+    view = numpy.frombuffer(A, dtype=A.typecode)
+    unsigned = numpy.dtype(view.dtype.str.replace('i', 'u'))
+    keys = view.view(unsigned)
+    if view.dtype.kind == 'i':
+        # Flip the sign bit, so that the unsigned order is the signed order.
+        sign = unsigned.type(1 << (8 * unsigned.itemsize - 1))
+        keys = keys ^ sign
+    lo = keys.min()
+    keys = keys - lo
+    top = int(keys.max())
+    shift = 0
+    while top >> shift:
+        digits = ((keys >> unsigned.type(shift)) &
+                  unsigned.type(_RADIX - 1)).astype(numpy.uint8)
+        keys = keys[numpy.argsort(digits, kind='stable')]
+        shift += _RADIX_BITS
+    keys = keys + lo
+    if view.dtype.kind == 'i':
+        keys = keys ^ sign
+    result = keys.view(view.dtype)
+    if reverse:
+        result = result[::-1]
+    A[:] = array.array(A.typecode, result.tobytes())
+    return A
+
+
+def countingSort(A, key=None, reverse=False):
+    """The counting sort counts the items with each integer key.
+
+    The prefix sums of the counts give the first position of each key in the
+    output, and the items are placed there in their original order. It takes
+    O(n + k) time and space, where k is the range of the keys, so it is linear
+    when the keys are bounded, such as ages or scores. It is stable.
+
+    An integer array.array without key is sorted by NumPy if available.
+
+    >>> countingSort([])
+    []
+    >>> countingSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> countingSort([3, -1, 2, -1, 0], reverse=True)
+    [3, 2, 0, -1, -1]
+    >>> countingSort(['bb', 'a', 'c', 'dd'], key=len)
+    ['a', 'c', 'bb', 'dd']
+    """
+    if key is None and numpy is not None and _isIntegerArray(A):
+        return _numpyRadixSort(A, reverse)
+    return _distributeWith(_countingSorted, A, key, reverse)
+
+
+def _countingSorted(items, keys):
+    n = len(items)
+    if n == 0:
+        return []
+    lo = min(keys)
+    counts = [0] * (max(keys) - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+    total = 0
+    for i, count in enumerate(counts):
+        counts[i] = total
+        total += count
+    result = [None] * n
+    for i in xrange(n):
+        j = keys[i] - lo
+        result[counts[j]] = items[i]
+        counts[j] += 1
+    return result
+
+
+def lsdRadixSort(A, key=None, reverse=False):
+    """The least significant digit (LSD) radix sort distributes the items by
+    one digit of their keys at a time, starting from the last digit.
+
+    Each pass is a stable distribution into buckets, so after the pass on the
+    d-th last digit, the items are sorted by their last d digits. The keys are
+    either integers, which are distributed by one byte of their offsets from
+    the minimum in each pass, or strings of the same length, which are
+    distributed by one character in each pass. It takes O(n) time per byte of
+    the range of the integer keys, or per character of the string keys. It is
+    stable.
+
+    An integer array.array without key is sorted by NumPy if available.
+
+    Raises:
+        ValueError: If the string keys have different lengths.
+
+    >>> lsdRadixSort([])
+    []
+    >>> lsdRadixSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> lsdRadixSort([1 << 40, -5, 1 << 20, 0])
+    [-5, 0, 1048576, 1099511627776]
+    >>> lsdRadixSort(['dab', 'cab', 'fad', 'bad', 'dad', 'ebb', 'ace'])
+    ['ace', 'bad', 'cab', 'dab', 'dad', 'ebb', 'fad']
+    """
+    if key is None and numpy is not None and _isIntegerArray(A):
+        return _numpyRadixSort(A, reverse)
+    return _distributeWith(_lsdRadixSorted, A, key, reverse)
+
+
+def _lsdRadixSorted(items, keys):
+    n = len(items)
+    if n == 0:
+        return []
+    order = list(xrange(n))
+    if isinstance(keys[0], _STRING_TYPES):
+        width = len(keys[0])
+        for k in keys:
+            if len(k) != width:
+                raise ValueError('The string keys should have the same '
+                                 'length.')
+        for d in xrange(width - 1, -1, -1):
+            groups = collections.defaultdict(list)
+            for i in order:
+                groups[keys[i][d]].append(i)
+            order = [i for c in sorted(groups) for i in groups[c]]
+    else:
+        lo = min(keys)
+        span = max(keys) - lo
+        shift = 0
+        while span >> shift:
+            buckets = [[] for _ in xrange(_RADIX)]
+            appends = [bucket.append for bucket in buckets]
+            for i in order:
+                appends[((keys[i] - lo) >> shift) & (_RADIX - 1)](i)
+            order = [i for bucket in buckets for i in bucket]
+            shift += _RADIX_BITS
+    return [items[i] for i in order]
+
+
+def msdRadixSort(A, key=None, reverse=False):
+    """The most significant digit (MSD) radix sort distributes the items by
+    the first digit of their keys, and then sorts each bucket recursively by
+    the next digit.
+
+    Unlike the LSD radix sort, string keys may have different lengths: a
+    string which has ended goes before all strings continuing with another
+    character. Buckets of at most 16 items are finished by the insertion sort,
+    and a bucket is never examined beyond the digits needed to tell its keys
+    apart. Integer keys are distributed by one byte of their offsets from the
+    minimum at each level. It is stable.
+
+    >>> msdRadixSort([])
+    []
+    >>> msdRadixSort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> words = ['she', 'sells', 'seashells', 'by', 'the', 'sea', 'shore']
+    >>> msdRadixSort(words * 3) == sorted(words * 3)
+    True
+    """
+    return _distributeWith(_msdRadixSorted, A, key, reverse)
+
+
+def _msdRadixSorted(items, keys):
+    n = len(items)
+    if n == 0:
+        return []
+    order = []
+    if isinstance(keys[0], _STRING_TYPES):
+        # k[d:d + 1] is empty once the string has ended, and the empty string
+        # goes before any character.
+        _msdSortInto(order, list(xrange(n)), keys,
+                     lambda k, d: k[d:d + 1], 0, None)
+    else:
+        lo = min(keys)
+        width = (max(keys) - lo).bit_length()
+        width = (width + _RADIX_BITS - 1) // _RADIX_BITS
+
+        def digit(k, d):
+            shift = (width - 1 - d) * _RADIX_BITS
+            return ((k - lo) >> shift) & (_RADIX - 1)
+        _msdSortInto(order, list(xrange(n)), keys, digit, 0, width)
+    return [items[i] for i in order]
+
+
+def _msdSortInto(order, indices, keys, digit, d, width):
+    """Append the indices to order, stably sorted by keys[i] from the d-th
+    digit on.
+
+    Args:
+        order (list of int): The sorted indices so far.
+        indices (list of int): Indices of the items with the same first d
+            digits.
+        keys (list): Keys of all the items.
+        digit (callable): digit(k, d) returns the d-th digit of the key k.
+        d (int): The digit to distribute by.
+        width (int/None): Number of digits of the integer keys, None for the
+            string keys, which are done when the digit is empty.
+    """
+    if d == width:
+        order.extend(indices)
+        return
+    if len(indices) <= _INSERTION_CUTOFF:
+        start = len(order)
+        order.extend(indices)
+        for i in xrange(start + 1, len(order)):
+            current_index = order[i]
+            current_key = keys[current_index]
+            j = i - 1
+            while j >= start and current_key < keys[order[j]]:
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = current_index
+        return
+    groups = collections.defaultdict(list)
+    for i in indices:
+        groups[digit(keys[i], d)].append(i)
+    for c in sorted(groups):
+        if width is None and not c:
+            order.extend(groups[c])
+        else:
+            _msdSortInto(order, groups[c], keys, digit, d + 1, width)
+
+
+def bucketSort(A, key=None, reverse=False, number_buckets=None):
+    """The bucket sort divides the range of the numeric keys into equal
+    intervals, distributes the items into one bucket for each interval, and
+    sorts each bucket by a comparison sort.
+
+    If the keys are uniformly distributed, each bucket holds O(1) items on
+    average, so it takes O(n) expected time. It is stable.
+
+    Args:
+        number_buckets (int/None) [None]: Number of buckets, None means one
+            bucket per item.
+
+    >>> bucketSort([])
+    []
+    >>> bucketSort([0.78, 0.17, 0.39, 0.26, 0.72, 0.94, 0.21, 0.12, 0.23])
+    [0.12, 0.17, 0.21, 0.23, 0.26, 0.39, 0.72, 0.78, 0.94]
+    >>> bucketSort([54, 26, 93, 17, 77, 31, 44, 55, 20], number_buckets=3)
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    """
+    def sortFunction(items, keys):
+        return _bucketSorted(items, keys, number_buckets)
+    return _distributeWith(sortFunction, A, key, reverse)
+
+
+def _bucketSorted(items, keys, number_buckets=None):
+    n = len(items)
+    if n == 0:
+        return []
+    lo = min(keys)
+    hi = max(keys)
+    if lo == hi:
+        return items
+    if number_buckets is None:
+        number_buckets = n
+    scale = number_buckets / (hi - lo)
+    buckets = [[] for _ in xrange(number_buckets)]
+    for i in xrange(n):
+        b = min(int((keys[i] - lo) * scale), number_buckets - 1)
+        buckets[b].append(i)
+    order = []
+    for bucket in buckets:
+        if len(bucket) > 1:
+            _sortWith(_autoSort, bucket, keys.__getitem__, False)
+        order.extend(bucket)
+    return [items[i] for i in order]
+
+
+def _countRuns(A):
+    """Return the number of ascending or strictly descending runs of A."""
+    n = len(A)
+    runs = 0
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and A[j] < A[i]:
+            while j + 1 < n and A[j + 1] < A[j]:
+                j += 1
+        else:
+            while j + 1 < n and not A[j + 1] < A[j]:
+                j += 1
+        runs += 1
+        i = j + 1
+    return runs
+
+
+def _autoSort(A):
+    """Choose a sort by the length and the presortedness of A."""
+    n = len(A)
+    if n <= _INSERTION_CUTOFF:
+        _insertionSortRange(A, 0, n)
+    elif _countRuns(A) * 32 <= n:
+        _naturalMergeSort(A)
+    else:
+        _introSort(A)
+
+
+def _insertionSort(A):
+    _insertionSortRange(A, 0, len(A))
+
+
+_SORTS = {
+    'auto': _autoSort,
+    'bottom_up_merge': _bottomUpMergeSort,
+    'heap': _heapSort,
+    'insertion': _insertionSort,
+    'intro': _introSort,
+    'merge': _bufferedMergeSort,
+    'natural_merge': _naturalMergeSort,
+}
+
+_DISTRIBUTION_SORTS = {
+    'bucket': _bucketSorted,
+    'counting': _countingSorted,
+    'lsd_radix': _lsdRadixSorted,
+    'msd_radix': _msdRadixSorted,
+}
+
+
+def _chooseAlgorithm(A, key):
+    """Choose the algorithm of sort(A, 'auto', key).
+
+    Returns:
+        algorithm (str): Name of the algorithm.
+        keys (list/None): key(x) for each item of A if key is given and the
+            keys have been computed.
+    """
+    n = len(A)
+    if n <= _INSERTION_CUTOFF:
+        return 'auto', None
+    keys = A if key is None else [key(x) for x in A]
+    if not (_isIntegerArray(A) and key is None or
+            all(isinstance(k, _INTEGER_TYPES) for k in keys)):
+        return 'auto', (None if key is None else keys)
+    if key is None and numpy is not None and _isIntegerArray(A):
+        return 'lsd_radix', None
+    span = max(keys) - min(keys)
+    # One pass of the LSD radix sort costs about as much as 6 of the log2(n)
+    # levels of the introspective sort.
+    passes = max(1, (span.bit_length() + _RADIX_BITS - 1) // _RADIX_BITS)
+    if span <= 2 * n:
+        algorithm = 'counting'
+    elif 6 * passes <= n.bit_length():
+        algorithm = 'lsd_radix'
+    else:
+        algorithm = 'auto'
+    return algorithm, (None if key is None else keys)
+
+
+def sort(A, algorithm='auto', key=None, reverse=False):
+    """Sort A in place, with the same key and reverse options as sorted().
+
+    The 'auto' algorithm uses the insertion sort on at most 16 items. If the
+    keys are integers, it uses the counting sort when their range is at most
+    2n, or the LSD radix sort when it needs few passes for the number of
+    items; an integer array.array without key always goes to the NumPy radix
+    sort if available. Otherwise, it counts the runs in one pass: if the runs
+    are 32 items long on average, the natural merge sort merges them, and the
+    introspective sort is used otherwise.
+
+    The distribution sorts and the merge sorts are stable. The others are
+    made stable by a key, see _sortWith().
+
+    Args:
+        A (list/array.array): Sequence to be sorted in place.
+        algorithm (str) ['auto']: One of 'auto', 'bottom_up_merge', 'bucket',
+            'counting', 'heap', 'insertion', 'intro', 'lsd_radix', 'merge',
+            'msd_radix' and 'natural_merge'.
+        key (callable/None) [None]: Extract the comparison key from each item.
+        reverse (bool) [False]: Sort in descending order.
+
+    Returns:
+        A
+
+    Raises:
+        ValueError: If the algorithm is not valid.
+
+    >>> sort([54, 26, 93, 17, 77, 31, 44, 55, 20])
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> sort([54, 26, 93, 17, 77, 31, 44, 55, 20], 'heap', reverse=True)
+    [93, 77, 55, 54, 44, 31, 26, 20, 17]
+    >>> sort(['bb', 'a', 'ccc'], key=len, reverse=True)
+    ['ccc', 'bb', 'a']
+    >>> sort(array.array('i', [3, 1, 2]), 'lsd_radix').tolist()
+    [1, 2, 3]
+    >>> sort([1, 2], 'bogo')
+    Traceback (most recent call last):
+        ...
+    ValueError: Unknown algorithm bogo.
+    """
+    keys = None
+    if algorithm == 'auto':
+        algorithm, keys = _chooseAlgorithm(A, key)
+    if algorithm in _DISTRIBUTION_SORTS:
+        if (algorithm in ('counting', 'lsd_radix') and key is None and
+                numpy is not None and _isIntegerArray(A)):
+            return _numpyRadixSort(A, reverse)
+        return _distributeWith(_DISTRIBUTION_SORTS[algorithm], A, key,
+                               reverse, keys)
+    if algorithm not in _SORTS:
+        raise ValueError('Unknown algorithm {}.'.format(algorithm))
+    return _sortWith(_SORTS[algorithm], A, key, reverse, keys)
+
+
+class _ReverseKey(object):
+    """Key which reverses the order of the wrapped key."""
+    __slots__ = ('k',)
+
+    def __init__(self, k):
+        self.k = k
+
+    def __lt__(self, other):
+        return other.k < self.k
+
+    def __eq__(self, other):
+        return self.k == other.k
+
+
+def kWayMerge(runs, key=None, reverse=False):
+    """Merge the sorted runs into one sorted iterator.
+
+    The current head of each run is kept in a binary min heap, using heapq,
+    the C implementation of the heap of PriorityQueue. Each step yields the
+    smallest head and replaces it by the next item of its run, so merging n
+    items from k runs takes O(n log k) time and O(k) extra space. Items with
+    equal keys are yielded in the order of their runs, i.e., it is stable.
+
+    Args:
+        runs (iterable of iterable): Runs sorted in ascending order, or in
+            descending order if reverse.
+        key (callable/None) [None]: Extract the comparison key from each item.
+        reverse (bool) [False]: Merge in descending order.
+
+    >>> list(kWayMerge([[1, 4, 7], [2, 5, 8], [], [3, 6, 9]]))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    >>> list(kWayMerge([['b', 'C'], ['A', 'c']], key=str.lower))
+    ['A', 'b', 'C', 'c']
+    >>> list(kWayMerge([[7, 4, 1], [8, 5, 2]], reverse=True))
+    [8, 7, 5, 4, 2, 1]
+    """
+    if reverse:
+        if key is None:
+            key = _ReverseKey
+        else:
+            key = lambda x, key=key: _ReverseKey(key(x))
+    heap = []
+    for r, run in enumerate(runs):
+        iterator = iter(run)
+        for x in iterator:
+            # The run index r is distinct, so x is never compared.
+            heap.append([x if key is None else key(x), r, x, iterator])
+            break
+    heapq.heapify(heap)
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        for x in entry[3]:
+            entry[0] = x if key is None else key(x)
+            entry[2] = x
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
+    if heap:
+        _, _, x, iterator = heap[0]
+        yield x
+        for x in iterator:
+            yield x
+
+
 def test():
     import doctest
     doctest.testmod()
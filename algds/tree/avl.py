@@ -7,6 +7,11 @@ to keep track of a balance factor for each node in the tree:
 We will define a tree to be balance if the balance factor is -1, 0, 1. Once the
 balance factor of a node in a tree is outside this range we will need to have
 a procedure to bring the tree back into balance.
+
+The procedure is a rotation, which moves a child up in place of its parent
+and keeps the order of the keys. An AVL tree of height h has at least
+F(h + 2) - 1 nodes, where F is the Fibonacci sequence, so its height is at most
+about 1.44 log2(n), and each operation takes O(log n) time.
 """
 
 from __future__ import division, print_function
@@ -18,51 +23,168 @@ __date__ = '2017-08-13'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-08-13'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
-from bst import _Node, BST
+import sys
+sys.path.append('../../')
+
+from algds.tree.bst import _Node, BST
+
+
+class _AVLNode(_Node):
+    """Node of an AVL tree, which also keeps its balance factor."""
+    __slots__ = ('balance_factor',)
+
+    def __init__(self, key, value, left=None, right=None, parent=None):
+        super(_AVLNode, self).__init__(key, value, left, right, parent)
+        self.balance_factor = 0
 
 
 class AVL(BST):
     """Implementation of an AVL tree.
+
+    After an insertion or a deletion, the balance factors are updated from the
+    changed node up to the root, and a node whose balance factor becomes 2 or
+    -2 is rotated back into balance. The keys are unique: setting an existing
+    key replaces its value.
+
+    >>> avl = AVL()
+    >>> for key in range(1000):
+    ...     avl[key] = str(key)
+    >>> len(avl), avl.height()
+    (1000, 10)
+    >>> avl[54], avl[1000], 54 in avl
+    ('54', None, True)
+    >>> avl[54] = 'cat'
+    >>> avl[54], len(avl)
+    ('cat', 1000)
+    >>> for key in range(0, 1000, 2):
+    ...     del avl[key]
+    >>> len(avl), avl.height(), avl[54], avl[55]
+    (500, 9, None, '55')
+    >>> del avl[54]
+    Traceback (most recent call last):
+        ...
+    KeyError: 'Key is not in the tree.'
     """
-    def _setItemHelper(self, key, value, node):
-        if key < node.key:
-            if node.hasLeft():
-                self._setItemHelper(key, value, node.left)
-            else:
-                node.left = _Node(key, value, parent=node)
-                self._updateBalance(node.left)   # Addition code
-        else:
-            if node.hasRight():
-                self._setItemHelper(key, value, node.right)
-            else:
-                node.right = _Node(key, value, parent=node)
-                self._updateBalance(node.right)  # Addition code
+    _NODE = _AVLNode
+
+    def __setitem__(self, key, value):
+        node = self._setItemHelper(key, value)
+        if node is not None:
+            self._updateBalance(node)
 
     def _updateBalance(self, node):
-        # Check if the current node is out of balance.
-        if node.balance_factor > 1 or node.balance_factor < -1:
-            self._rebalance(node)
-            return
-        # If the current node does not require rebalancing then the balance
-        # factor of the parent is adjusted.
-        if node.parent != None:
-            if node.isLeft():
-                node.parent.balance_factor += 1
-            if node.isRight():
-                node.parent.balance_factor -= 1
-            if node.parent.balance_factor != 0:
-                # If the balance factor is non-zero, then the algorithm
-                # continues to work its way up the tree toward the root.
-                self._updateBalance(node.parent)
+        """Update the balance factors after the leaf node is inserted.
+
+        The subtree of the node grew one level higher, so the balance factor
+        of its parent is adjusted. If it becomes 0, the parent's subtree kept
+        its height, and the ancestors are not affected. If it becomes 2 or -2,
+        a rotation restores the height the subtree had before the insertion.
+        Otherwise, the parent's subtree grew as well, and the algorithm
+        continues to work its way up the tree toward the root.
+        """
+        while node.parent is not None:
+            parent = node.parent
+            if parent.left is node:
+                parent.balance_factor += 1
+            else:
+                parent.balance_factor -= 1
+            if parent.balance_factor == 0:
+                return
+            if parent.balance_factor > 1 or parent.balance_factor < -1:
+                self._rebalance(parent)
+                return
+            node = parent
+
+    def __delitem__(self, key):
+        """Delete the node of the key, and rebalance the tree.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        node = self._getItemHelper(key, self._root)
+        if node is None:
+            raise KeyError('Key is not in the tree.')
+        parent, is_left = self._delItemHelper(node)
+        if parent is not None:
+            self._deleteBalance(parent, is_left)
+        self._size -= 1
+
+    def _deleteBalance(self, node, left_shorter):
+        """Update the balance factors after a subtree of the node got one
+        level lower.
+
+        Unlike the insertion, a rotation may leave the subtree one level
+        lower than before, so the update may go on up to the root.
+
+        Args:
+            node (_AVLNode): The parent of the lower subtree.
+            left_shorter (bool): Whether the lower subtree is the left one.
+        """
+        while node is not None:
+            if left_shorter:
+                node.balance_factor -= 1
+            else:
+                node.balance_factor += 1
+            if node.balance_factor == 1 or node.balance_factor == -1:
+                # The subtree of the node kept its height.
+                return
+            if node.balance_factor != 0:
+                node = self._rebalance(node)
+                if node.balance_factor != 0:
+                    return
+            parent = node.parent
+            if parent is not None:
+                left_shorter = parent.left is node
+            node = parent
 
     def rotateLeft(self, root):
-        pass
+        """Rotate the subtree of root to the left, and return its new root.
+
+        The right child of root becomes the root of the subtree, root becomes
+        its left child, and its old left subtree becomes the right subtree of
+        root.
+
+        With B and D the balance factors of root and of its right child, and
+        B' and D' after the rotation,
+            B' = B + 1 - min(D, 0),
+            D' = D + 1 + max(B', 0).
+        """
+        new_root = self._rotateLeft(root)
+        root.balance_factor += 1 - min(new_root.balance_factor, 0)
+        new_root.balance_factor += 1 + max(root.balance_factor, 0)
+        return new_root
+
+    def rotateRight(self, root):
+        """Rotate the subtree of root to the right, and return its new root.
+
+        It mirrors rotateLeft(), so
+            B' = B - 1 - max(D, 0),
+            D' = D - 1 + min(B', 0).
+        """
+        new_root = self._rotateRight(root)
+        root.balance_factor -= 1 + max(new_root.balance_factor, 0)
+        new_root.balance_factor -= 1 - min(root.balance_factor, 0)
+        return new_root
 
     def _rebalance(self, node):
-        pass
+        """Rotate the subtree of the node, whose balance factor is 2 or -2,
+        into balance, and return its new root.
+
+        If the node is right-heavy and its right child is left-heavy, a single
+        left rotation would leave the subtree left-heavy, so the right child is
+        first rotated to the right, i.e., a double rotation. The left-heavy
+        case is symmetric.
+        """
+        if node.balance_factor < 0:
+            if node.right.balance_factor > 0:
+                self.rotateRight(node.right)
+            return self.rotateLeft(node)
+        if node.left.balance_factor < 0:
+            self.rotateLeft(node.left)
+        return self.rotateRight(node)
 
 
 def test():
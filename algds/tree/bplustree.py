@@ -0,0 +1,824 @@
+"""Implementation of a B+ tree.
+
+A binary search tree has one node per key, so a lookup in a tree of n keys
+follows about log2(n) pointers to nodes scattered in memory, or on disk.
+A B+ tree packs up to B keys into each node (page), so it has only about
+log_B(n) levels: with pages of 4 KB, 50M keys take 4 levels. The keys and
+values are in the leaves, which are chained in key order, so a range scan
+reads consecutive leaves instead of walking up and down the tree. The internal
+nodes only hold separator keys to guide the search.
+
+The pages are accessed through a pager. In memory, the pages are Python
+objects in a list. On disk, they are fixed-size pages of a memory-mapped
+file, and the pager keeps the recently used pages decoded in a cache with
+least recently used (LRU) eviction. Opening an existing file only reads its
+header page, and a lookup then reads one page per level.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['BPlusTree']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import bisect
+import collections
+import mmap
+import numbers
+import os
+import struct
+import zlib
+
+# Page id of a missing page, e.g., the next page of the last leaf.
+_NO_PAGE = -1
+
+
+class _Page(object):
+    """A node of the B+ tree.
+
+    An internal page with keys K[0], ..., K[m - 1] has m + 1 children, and the
+    subtree of children[i] holds the keys in [K[i - 1], K[i]).
+
+    Attributes:
+        leaf (bool): Whether the page is a leaf.
+        keys (list): The sorted keys.
+        values (list): The values of the keys of a leaf.
+        children (list of int): The page ids of the children of an internal
+            page.
+        next (int): The page id of the next leaf, or _NO_PAGE.
+    """
+    __slots__ = ('leaf', 'keys', 'values', 'children', 'next')
+
+    def __init__(self, leaf):
+        self.leaf = leaf
+        self.keys = []
+        self.values = [] if leaf else None
+        self.children = None if leaf else []
+        self.next = _NO_PAGE
+
+
+class _MemoryPager(object):
+    """Keep the pages as Python objects in a list, indexed by page id."""
+    def __init__(self):
+        self._pages = []
+        self.reads = 0
+
+    def header(self):
+        return None
+
+    def check(self, items):
+        pass
+
+    def allocate(self, page):
+        self._pages.append(page)
+        return len(self._pages) - 1
+
+    def read(self, page_id):
+        return self._pages[page_id]
+
+    def write(self, page_id, page):
+        pass
+
+    def trim(self):
+        pass
+
+    def flush(self, header):
+        pass
+
+    def close(self, header):
+        pass
+
+
+class _FilePager(object):
+    """Store the pages in a memory-mapped file.
+
+    Page 0 is the header, and page i starts at byte i * page_size. A page
+    holds a flag for leaves, the number of keys m, the next leaf, and then m
+    keys and m values, or m keys and m + 1 children, all packed as 64-bit
+    signed integers.
+
+    The decoded pages are cached in an OrderedDict in LRU order, the most
+    recent last. A modified page is marked dirty, and is only encoded when
+    evicted or flushed. The tree calls trim() between operations, so the
+    pages it holds during an operation are never evicted.
+
+    The file always holds the tree of the last flush, so that a crash loses
+    the later changes only. A page allocated since the last flush is not
+    reachable from the header in the file, so it is encoded in place. A page
+    of the last flush is never overwritten before the next one, instead it is
+    encoded into a slot of the journal file, path + '-journal', and read from
+    there until then. A flush
+        1. encodes the dirty pages, and syncs the file;
+        2. writes the page ids of the slots after them, syncs the journal,
+           and then writes a record of the new header at its start and syncs
+           it again, which commits the flush;
+        3. copies the slots into place, writes the header, and empties the
+           journal.
+    After a crash, opening the file replays step 3 if the journal has a
+    valid record, and otherwise discards the journal.
+
+    Attributes:
+        reads (int): Number of pages decoded from the file or the journal.
+    """
+    _MAGIC = b'BPTREE01'
+    _JOURNAL_MAGIC = b'BPJRNL01'
+    # magic, page size, order, root, number of pages, size, first leaf.
+    _HEADER = struct.Struct('<8sIIqqqq')
+    # magic, order, root, number of pages, size, first leaf, number of slots,
+    # and then the CRC-32 of these fields and of the page ids of the slots.
+    _RECORD = struct.Struct('<8sIqqqqq')
+    # leaf, number of keys, next leaf.
+    _PAGE_HEADER = struct.Struct('<BHq')
+    _MIN_NUMBER = -2 ** 63
+    _MAX_NUMBER = 2 ** 63 - 1
+
+    def __init__(self, path, page_size, cache_pages):
+        """Open the file, or create it if it does not exist or is empty.
+
+        Raises:
+            ValueError: If the file is not a B+ tree file.
+        """
+        self._cache_pages = cache_pages
+        self._cache = collections.OrderedDict()
+        self._dirty = set()
+        # Slot in the journal of each page of the last flush modified since.
+        self._slots = {}
+        self.reads = 0
+        self._journal_path = path + '-journal'
+        if self.exists(path):
+            self._file = open(path, 'r+b')
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            fields = self._HEADER.unpack_from(self._map, 0)
+            if fields[0] != self._MAGIC:
+                self._map.close()
+                self._file.close()
+                raise ValueError('{} is not a B+ tree file.'.format(path))
+            self.page_size = fields[1]
+            self._openJournal()
+            self._recover()
+            fields = self._HEADER.unpack_from(self._map, 0)
+            self._number_pages = fields[4]
+            self._header = (fields[2], fields[3], fields[5], fields[6])
+        else:
+            self._file = open(path, 'w+b')
+            self._file.truncate(page_size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            self.page_size = page_size
+            self._openJournal()
+            self._number_pages = 1
+            self._header = None
+        # Number of pages of the last flush.
+        self._committed = self._number_pages
+
+    @staticmethod
+    def exists(path):
+        """Return whether path holds a file to open instead of creating."""
+        return os.path.exists(path) and os.path.getsize(path) > 0
+
+    @classmethod
+    def maxOrder(cls, page_size):
+        """Return the largest number of keys fitting in a page, and in the
+        16-bit count of the page header.
+
+        >>> _FilePager.maxOrder(4096), _FilePager.maxOrder(2 ** 21)
+        (254, 65535)
+        """
+        return min((page_size - cls._PAGE_HEADER.size - 8) // 16, 0xffff)
+
+    def header(self):
+        """Return (order, root, size, first leaf) of an existing file, or
+        None."""
+        return self._header
+
+    def check(self, items):
+        """Check that the keys and the values fit in the pages.
+
+        Args:
+            items (iterable): The keys and the values.
+
+        Raises:
+            TypeError: If they are not integers.
+            ValueError: If they are not 64-bit signed integers.
+        """
+        low, high = self._MIN_NUMBER, self._MAX_NUMBER
+        for number in items:
+            # Most of them are ints, which skips the slow ABC check.
+            if type(number) is int and low <= number <= high:
+                continue
+            if not isinstance(number, numbers.Integral):
+                raise TypeError('Keys and values should be integers in a '
+                                'persistent tree.')
+            if not low <= number <= high:
+                raise ValueError('Keys and values should be 64-bit signed '
+                                 'integers in a persistent tree.')
+
+    def allocate(self, page):
+        page_id = self._number_pages
+        self._number_pages += 1
+        self._grow(self._number_pages)
+        self.write(page_id, page)
+        return page_id
+
+    def _grow(self, number_pages):
+        """Make the file hold at least number_pages pages."""
+        needed = number_pages * self.page_size
+        if needed > len(self._map):
+            # Grow the file geometrically, and map it again.
+            length = max(needed, 2 * len(self._map))
+            self._map.close()
+            self._file.truncate(length)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def read(self, page_id):
+        page = self._cache.pop(page_id, None)
+        if page is None:
+            slot = self._slots.get(page_id)
+            if slot is None:
+                page = self._decode(self._map, page_id * self.page_size)
+            else:
+                self._journal.seek((slot + 1) * self.page_size)
+                page = self._decode(self._journal.read(self.page_size), 0)
+            self.reads += 1
+        self._cache[page_id] = page
+        return page
+
+    def write(self, page_id, page):
+        self._cache.pop(page_id, None)
+        self._cache[page_id] = page
+        self._dirty.add(page_id)
+
+    def trim(self):
+        """Evict the least recently used pages beyond the cache size.
+
+        A page leaves the cache only once it is stored, so that it is not
+        lost if the encoding fails.
+        """
+        while len(self._cache) > self._cache_pages:
+            page_id = next(iter(self._cache))
+            if page_id in self._dirty:
+                self._store(page_id, self._cache[page_id])
+                self._dirty.remove(page_id)
+            del self._cache[page_id]
+
+    def _store(self, page_id, page):
+        """Encode the page in place, or into its slot of the journal if the
+        last flush has it."""
+        if page_id >= self._committed:
+            self._encode(page, self._map, page_id * self.page_size)
+            return
+        slot = self._slots.get(page_id)
+        if slot is None:
+            slot = self._slots[page_id] = len(self._slots)
+        data = bytearray(self.page_size)
+        self._encode(page, data, 0)
+        self._journal.seek((slot + 1) * self.page_size)
+        self._journal.write(data)
+
+    def flush(self, header):
+        """Write the dirty pages and the header to the file atomically."""
+        for page_id in sorted(self._dirty):
+            self._store(page_id, self._cache[page_id])
+        self._dirty.clear()
+        self._map.flush()
+        os.fsync(self._file.fileno())
+        page_ids = [None] * len(self._slots)
+        for page_id, slot in self._slots.items():
+            page_ids[slot] = page_id
+        order, root, size, first_leaf = header
+        record = self._RECORD.pack(self._JOURNAL_MAGIC, order, root,
+                                   self._number_pages, size, first_leaf,
+                                   len(page_ids))
+        ids = struct.pack('<%dq' % len(page_ids), *page_ids)
+        self._journal.seek((len(page_ids) + 1) * self.page_size)
+        self._journal.write(ids)
+        self._syncJournal()
+        self._journal.seek(0)
+        self._journal.write(record + struct.pack('<I', _checksum(record,
+                                                                 ids)))
+        self._syncJournal()
+        self._replay(record, page_ids)
+        self._slots.clear()
+        self._committed = self._number_pages
+
+    def close(self, header):
+        if self._file.closed:
+            return
+        self.flush(header)
+        self._cache.clear()
+        self._map.close()
+        self._file.close()
+        self._journal.close()
+        os.remove(self._journal_path)
+
+    def _openJournal(self):
+        mode = 'r+b' if os.path.exists(self._journal_path) else 'w+b'
+        self._journal = open(self._journal_path, mode)
+
+    def _syncJournal(self):
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def _recover(self):
+        """Replay the flush committed in the journal, if any."""
+        self._journal.seek(0)
+        data = self._journal.read(self._RECORD.size + 4)
+        if len(data) < self._RECORD.size + 4:
+            self._replay(None, [])
+            return
+        record = data[:self._RECORD.size]
+        fields = self._RECORD.unpack(record)
+        count = fields[-1]
+        ids = b''
+        if fields[0] == self._JOURNAL_MAGIC and count >= 0:
+            self._journal.seek((count + 1) * self.page_size)
+            ids = self._journal.read(8 * count)
+        (checksum,) = struct.unpack_from('<I', data, self._RECORD.size)
+        if (fields[0] != self._JOURNAL_MAGIC or len(ids) != 8 * count or
+                checksum != _checksum(record, ids)):
+            # The crash happened before the commit.
+            self._replay(None, [])
+            return
+        self._replay(record, struct.unpack('<%dq' % count, ids))
+
+    def _replay(self, record, page_ids):
+        """Copy the slots of the journal to the pages, write the header of
+        the record, and empty the journal.
+
+        Args:
+            record (bytes/None): The record of the flush, None to only empty
+                the journal.
+            page_ids (list of int): The page id of each slot.
+        """
+        if record is not None:
+            (_, order, root, number_pages, size, first_leaf,
+             _) = self._RECORD.unpack(record)
+            self._grow(number_pages)
+            for slot, page_id in enumerate(page_ids):
+                self._journal.seek((slot + 1) * self.page_size)
+                offset = page_id * self.page_size
+                self._map[offset:offset + self.page_size] = (
+                    self._journal.read(self.page_size))
+            self._HEADER.pack_into(self._map, 0, self._MAGIC, self.page_size,
+                                   order, root, number_pages, size,
+                                   first_leaf)
+            self._map.flush()
+            os.fsync(self._file.fileno())
+        self._journal.seek(0)
+        self._journal.truncate()
+        self._syncJournal()
+
+    def _decode(self, buffer, offset):
+        leaf, count, next_page = self._PAGE_HEADER.unpack_from(buffer, offset)
+        page = _Page(bool(leaf))
+        fields = struct.unpack_from(
+            '<%dq' % (2 * count + (not leaf)), buffer,
+            offset + self._PAGE_HEADER.size)
+        page.keys = list(fields[:count])
+        if leaf:
+            page.values = list(fields[count:])
+            page.next = next_page
+        else:
+            page.children = list(fields[count:])
+        return page
+
+    def _encode(self, page, buffer, offset):
+        count = len(page.keys)
+        self._PAGE_HEADER.pack_into(buffer, offset, page.leaf, count,
+                                    page.next)
+        pointers = page.values if page.leaf else page.children
+        struct.pack_into('<%dq' % (count + len(pointers)), buffer,
+                         offset + self._PAGE_HEADER.size,
+                         *(page.keys + pointers))
+
+
+def _checksum(record, ids):
+    """Return the CRC-32 of the record of a flush and of its page ids."""
+    return zlib.crc32(ids, zlib.crc32(record)) & 0xffffffff
+
+
+class BPlusTree(object):
+    """Implementation of a B+ tree.
+
+    It implements the same map ADT as BST. A lookup or an insertion goes down
+    from the root to a leaf, choosing the child by a binary search among the
+    keys of each page. A leaf overflowing order keys is split into two
+    halves, and the first key of the right half is inserted into the parent
+    as a separator, which may split the parent in turn, up to the root. The
+    tree only grows at the root, so all the leaves are at the same depth.
+
+    A deletion removes the key from its leaf, without merging the underfull
+    pages with their siblings, as many databases do. The separators remain
+    valid, so the lookups are not affected, and the pages are refilled by
+    later insertions. Rebuilding the tree by fromSorted() compacts it.
+
+    In the persistent mode, i.e., given a path, the keys and the values are
+    64-bit signed integers, since the pages have a fixed size. The changes
+    reach the file atomically at flush() or close(), so the tree found after
+    a crash is that of the last flush. The tree is a context manager, which
+    closes it on exit.
+
+    Attributes:
+        _pager (_MemoryPager/_FilePager): Store the pages.
+        _order (int): Maximum number of keys of a page.
+        _root (int): Page id of the root.
+        _size (int): Number of key-value pairs.
+        _first_leaf (int): Page id of the leaf of the smallest keys.
+
+    >>> tree = BPlusTree(order=4)
+    >>> for key in [54, 26, 93, 17, 77, 31, 44, 55, 20]:
+    ...     tree[key] = str(key)
+    >>> len(tree), tree.height(), tree[44], tree[45], 44 in tree
+    (9, 2, '44', None, True)
+    >>> list(tree)
+    [17, 20, 26, 31, 44, 54, 55, 77, 93]
+    >>> list(tree.range(26, 55))
+    [26, 31, 44, 54]
+    >>> tree[44] = 'cat'
+    >>> del tree[26]
+    >>> list(tree.items(30, 50)), len(tree)
+    ([(31, '31'), (44, 'cat')], 8)
+    >>> del tree[26]
+    Traceback (most recent call last):
+        ...
+    KeyError: 'Key is not in the tree.'
+
+    A persistent tree survives a restart:
+
+    >>> import os, shutil, tempfile
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> path = os.path.join(temp_dir, 'tree.db')
+    >>> tree = BPlusTree.fromSorted(((k, k * k) for k in range(10 ** 5)),
+    ...                             path=path)
+    >>> tree.height()
+    3
+    >>> tree[100000] = 0
+    >>> tree.close()
+    >>> tree = BPlusTree(path=path)
+    >>> tree[54321], tree.pageReads()
+    (2950771041, 3)
+    >>> tree[100000], len(tree)
+    (0, 100001)
+    >>> tree[5] = None
+    Traceback (most recent call last):
+        ...
+    TypeError: Keys and values should be integers in a persistent tree.
+
+    The changes since the last flush are lost in a crash, which we simulate
+    by dropping the tree without closing it, but not the previous ones:
+
+    >>> tree = BPlusTree(path=path, cache_pages=4)
+    >>> for key in range(-1, -20000, -1):
+    ...     tree[key] = key
+    >>> del tree[54321]
+    >>> del tree
+    >>> with BPlusTree(path=path) as tree:
+    ...     len(tree), len(list(tree)), tree[54321], tree[-1]
+    (100001, 100001, 2950771041, None)
+
+    An existing file keeps its own order and page size:
+
+    >>> with BPlusTree(order=1000, path=path, page_size=512) as tree:
+    ...     tree._order, tree._pager.page_size
+    (254, 4096)
+    >>> BPlusTree.fromSorted([(1, 1)], path=path)
+    Traceback (most recent call last):
+        ...
+    ValueError: The tree should be empty.
+    >>> os.path.exists(path + '-journal')
+    False
+    >>> shutil.rmtree(temp_dir)
+    """
+    _DEFAULT_ORDER = 64
+
+    def __init__(self, order=None, path=None, page_size=4096,
+                 cache_pages=1024):
+        """Create an empty tree, or open the tree stored at path.
+
+        Args:
+            order (int/None) [None]: Maximum number of keys of a page, >= 3.
+                None means 64 in memory, and as many as fit in a page on disk.
+            path (str/None) [None]: File of the persistent tree. None means
+                an in-memory tree. If the file exists, the tree stored there
+                is opened, with its own order and page size, and the order
+                and page_size arguments are ignored.
+            page_size (int) [4096]: Bytes of each page of a new file.
+            cache_pages (int) [1024]: Number of pages kept in the cache.
+
+        Raises:
+            ValueError: If the arguments are not valid.
+        """
+        if cache_pages < 1:
+            raise ValueError('cache_pages should be >= 1.')
+        if path is None:
+            if order is None:
+                order = self._DEFAULT_ORDER
+        elif not _FilePager.exists(path):
+            max_order = _FilePager.maxOrder(page_size)
+            if order is None:
+                order = max_order
+            if order > max_order:
+                raise ValueError('order should be <= {} for pages of {} '
+                                 'bytes.'.format(max_order, page_size))
+        # The order of an existing file is read from it.
+        if order is not None and order < 3:
+            raise ValueError('order should be >= 3.')
+        if path is None:
+            self._pager = _MemoryPager()
+        else:
+            self._pager = _FilePager(path, page_size, cache_pages)
+        header = self._pager.header()
+        if header is not None:
+            self._order, self._root, self._size, self._first_leaf = header
+            return
+        self._order = order
+        self._root = self._first_leaf = self._pager.allocate(_Page(True))
+        self._size = 0
+        self.flush()
+
+    @classmethod
+    def fromSorted(cls, items, fill_factor=1.0, **kwargs):
+        """Build a tree from the key-value pairs sorted by key.
+
+        The leaves are filled from left to right, and then each level of
+        internal pages is built on top of the previous one, which takes O(n)
+        time and writes every page once, instead of n insertions from the
+        root. The items may be an iterator, so they need not fit in memory.
+
+        Args:
+            items (iterable): (key, value) pairs, strictly increasing keys.
+            fill_factor (float) [1.0]: Fraction of each leaf to fill, in
+                (0, 1]. A lower one leaves room for later insertions without
+                splits.
+            **kwargs: Arguments of BPlusTree(), for an empty tree.
+
+        Raises:
+            ValueError: If the fill factor is not valid, the keys are not
+                strictly increasing, or the tree of the path is not empty.
+        """
+        if not 0 < fill_factor <= 1:
+            raise ValueError('fill_factor should be in (0, 1].')
+        tree = cls(**kwargs)
+        if tree._size > 0:
+            tree.close()
+            raise ValueError('The tree should be empty.')
+        pager = tree._pager
+        capacity = max(1, int(tree._order * fill_factor))
+        # (smallest key, page id) of each page of the level being built.
+        level = []
+        leaf_id = tree._first_leaf
+        leaf = pager.read(leaf_id)
+        previous_key = None
+        for key, value in items:
+            if tree._size > 0 and not previous_key < key:
+                raise ValueError('keys should be strictly increasing.')
+            previous_key = key
+            if len(leaf.keys) == capacity:
+                pager.check(leaf.keys + leaf.values)
+                level.append((leaf.keys[0], leaf_id))
+                next_leaf = _Page(True)
+                leaf.next = pager.allocate(next_leaf)
+                pager.write(leaf_id, leaf)
+                pager.trim()
+                leaf_id, leaf = leaf.next, next_leaf
+            leaf.keys.append(key)
+            leaf.values.append(value)
+            tree._size += 1
+        pager.check(leaf.keys + leaf.values)
+        level.append((leaf.keys[0] if leaf.keys else None, leaf_id))
+        pager.write(leaf_id, leaf)
+        while len(level) > 1:
+            level = tree._buildLevel(level)
+        tree._root = level[0][1]
+        pager.trim()
+        return tree
+
+    def _buildLevel(self, children):
+        """Build the internal pages on top of the pages of a level.
+
+        The children are divided evenly, at most order + 1 per page.
+
+        Args:
+            children (list of tuple): (smallest key, page id) of each page of
+                the level, in order.
+
+        Returns:
+            list of tuple: (smallest key, page id) of each new page.
+        """
+        number_pages = -(-len(children) // (self._order + 1))
+        parents = []
+        for j in xrange(number_pages):
+            group = children[j * len(children) // number_pages:
+                             (j + 1) * len(children) // number_pages]
+            page = _Page(False)
+            page.keys = [key for key, _ in group[1:]]
+            page.children = [page_id for _, page_id in group]
+            parents.append((group[0][0], self._pager.allocate(page)))
+            self._pager.trim()
+        return parents
+
+    def __len__(self):
+        return self._size
+
+    def height(self):
+        """Return the number of levels, 1 for a single leaf."""
+        height = 1
+        page = self._pager.read(self._root)
+        while not page.leaf:
+            height += 1
+            page = self._pager.read(page.children[0])
+        self._pager.trim()
+        return height
+
+    def pageReads(self):
+        """Return the number of pages read from the file so far."""
+        return self._pager.reads
+
+    def _findLeaf(self, key, path=None):
+        """Go down to the leaf where the key belongs.
+
+        Args:
+            key
+            path (list/None) [None]: If given, (page id, page, child index) of
+                each internal page on the way are appended to it.
+
+        Returns:
+            tuple: (page id, page) of the leaf.
+        """
+        page_id = self._root
+        page = self._pager.read(page_id)
+        while not page.leaf:
+            i = bisect.bisect_right(page.keys, key)
+            if path is not None:
+                path.append((page_id, page, i))
+            page_id = page.children[i]
+            page = self._pager.read(page_id)
+        return page_id, page
+
+    def __getitem__(self, key):
+        """Return the value of the key, or None if it is not in the tree."""
+        _, leaf = self._findLeaf(key)
+        self._pager.trim()
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return None
+
+    def __contains__(self, key):
+        _, leaf = self._findLeaf(key)
+        self._pager.trim()
+        i = bisect.bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def __setitem__(self, key, value):
+        """Insert the key-value pair, or replace the value of the key.
+
+        Raises:
+            TypeError/ValueError: If a persistent tree cannot store the key
+                or the value.
+        """
+        pager = self._pager
+        pager.check((key, value))
+        path = []
+        page_id, page = self._findLeaf(key, path)
+        i = bisect.bisect_left(page.keys, key)
+        if i < len(page.keys) and page.keys[i] == key:
+            page.values[i] = value
+        else:
+            page.keys.insert(i, key)
+            page.values.insert(i, value)
+            self._size += 1
+            while len(page.keys) > self._order:
+                separator, right_id = self._split(page_id, page)
+                if not path:
+                    root = _Page(False)
+                    root.keys = [separator]
+                    root.children = [page_id, right_id]
+                    page_id, page = pager.allocate(root), root
+                    self._root = page_id
+                    break
+                page_id, page, i = path.pop()
+                page.keys.insert(i, separator)
+                page.children.insert(i + 1, right_id)
+        pager.write(page_id, page)
+        pager.trim()
+
+    def _split(self, page_id, page):
+        """Move the upper half of the overflowing page to a new right sibling.
+
+        A leaf keeps a copy of the first key of the right half as the
+        separator, while an internal page moves its middle key up.
+
+        Returns:
+            tuple: (separator, page id of the new page).
+        """
+        mid = len(page.keys) // 2
+        right = _Page(page.leaf)
+        if page.leaf:
+            right.keys = page.keys[mid:]
+            right.values = page.values[mid:]
+            del page.keys[mid:]
+            del page.values[mid:]
+            separator = right.keys[0]
+            right.next = page.next
+            right_id = self._pager.allocate(right)
+            page.next = right_id
+        else:
+            separator = page.keys[mid]
+            right.keys = page.keys[mid + 1:]
+            right.children = page.children[mid + 1:]
+            del page.keys[mid:]
+            del page.children[mid + 1:]
+            right_id = self._pager.allocate(right)
+        self._pager.write(page_id, page)
+        return separator, right_id
+
+    def __delitem__(self, key):
+        """Delete the key-value pair from its leaf.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        page_id, leaf = self._findLeaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i == len(leaf.keys) or leaf.keys[i] != key:
+            self._pager.trim()
+            raise KeyError('Key is not in the tree.')
+        del leaf.keys[i]
+        del leaf.values[i]
+        self._size -= 1
+        self._pager.write(page_id, leaf)
+        self._pager.trim()
+
+    def items(self, lo=None, hi=None):
+        """Iterate over the (key, value) pairs with keys in [lo, hi) in order.
+
+        The scan goes down to the leaf of lo, and then follows the chain of
+        the leaves, so it reads O(log_B(n)) pages plus the pages of the keys
+        yielded.
+
+        Args:
+            lo [None]: Smallest key, None means no lower bound.
+            hi [None]: Upper bound of the keys, excluded, None means no upper
+                bound.
+        """
+        if lo is None:
+            page = self._pager.read(self._first_leaf)
+            i = 0
+        else:
+            _, page = self._findLeaf(lo)
+            i = bisect.bisect_left(page.keys, lo)
+        while True:
+            keys = page.keys
+            values = page.values
+            next_page = page.next
+            self._pager.trim()
+            for j in xrange(i, len(keys)):
+                if hi is not None and not keys[j] < hi:
+                    return
+                yield keys[j], values[j]
+            if next_page == _NO_PAGE:
+                return
+            page = self._pager.read(next_page)
+            i = 0
+
+    def range(self, lo, hi):
+        """Iterate over the keys in [lo, hi) in order."""
+        for key, _ in self.items(lo, hi):
+            yield key
+
+    def __iter__(self):
+        """Iterate over the keys in order."""
+        for key, _ in self.items():
+            yield key
+
+    def flush(self):
+        """Write the changes to the file of a persistent tree."""
+        self._pager.flush(self._header())
+
+    def close(self):
+        """Flush, and close the file of a persistent tree."""
+        self._pager.close(self._header())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _header(self):
+        return self._order, self._root, self._size, self._first_leaf
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
@@ -1,4 +1,13 @@
 """The implementation of a binary search tree.
+
+All the operations walk the tree by loops instead of recursion, so a tree as
+deep as a linked list, e.g., after inserting sorted keys, does not exceed the
+recursion limit.
+
+Each node also keeps the size of its subtree. With the sizes, the position of
+a key in the sorted order and the key at a given position are found on the way
+down from the root, so the order-statistic and range queries take O(h) time
+plus the output, where h is the height of the tree.
 """
 
 from __future__ import division, print_function
@@ -10,7 +19,7 @@ __date__ = '2017-08-12'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-08-12'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
 
@@ -22,13 +31,20 @@ class _Node(object):
     as a child, (left or right) and the kind of children the node has. This
     class will also explicitly keep track of the parent as an attribute of each
     node.
+
+    The attributes are declared in __slots__, so a node has no __dict__ and
+    takes less memory. size is the number of nodes of the subtree rooted at the
+    node, which the tree keeps up to date.
     """
+    __slots__ = ('key', 'value', 'left', 'right', 'parent', 'size')
+
     def __init__(self, key, value, left=None, right=None, parent=None):
         self.key = key
         self.value = value
         self.left = left
         self.right = right
         self.parent = parent
+        self.size = 1
 
     def hasLeft(self):
         return self.left
@@ -65,14 +81,20 @@ class _Node(object):
             self.right.parent = self
 
     def __iter__(self):
-        if self:
-            if self.hasLeft():
-                for element in self.left():
-                    yield element
-            yield self.key
-            if self.hasRight():
-                for element in self.right():
-                    yield element
+        """Iterate over the keys of the subtree in order.
+
+        The stack holds the ancestors whose keys are still to be yielded, i.e.,
+        the nodes where the walk went left.
+        """
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
 
     def findSuccessor(self):
         if self.hasRight():
@@ -87,10 +109,12 @@ class _Node(object):
             else:
                 # If the node is the right child of its parent, and itself
                 # has no right child, then the successor to this node is the
-                # successor of its parent, excluding this node.
-                self.parent.right = None
-                successor = self.parent.findSuccessor()
-                self.parent.right = self
+                # successor of its parent, excluding this node, i.e., the
+                # parent of the first ancestor which is a left child.
+                current = self.parent
+                while current.isRight():
+                    current = current.parent
+                successor = current.parent
         else:
             successor = None
         return successor
@@ -124,6 +148,11 @@ class _Node(object):
                 self.right.parent = self.parent
 
 
+def _sizeOf(node):
+    """Return the size of the subtree of the node, which may be None."""
+    return 0 if node is None else node.size
+
+
 class BST(object):
     """Implementation of a binary search tree.
 
@@ -136,7 +165,37 @@ class BST(object):
     yellow
     >>> print(bst[2])
     at
+    >>> print(bst[5])
+    None
+    >>> bst[6] = 'green'
+    >>> len(bst), bst[6], 4 in bst, 5 in bst
+    (4, 'green', True, False)
+    >>> list(bst)
+    [2, 3, 4, 6]
+    >>> del bst[3]
+    >>> list(bst)
+    [2, 4, 6]
+    >>> deep = BST()
+    >>> for key in range(2000):
+    ...     deep[key] = key
+    >>> deep.height(), deep[1999], sum(deep)
+    (2000, 1999, 1999000)
+
+    Order-statistic and range queries:
+
+    >>> bst = BST()
+    >>> for key in [54, 26, 93, 17, 77, 31, 44, 55, 20]:
+    ...     bst[key] = str(key)
+    >>> bst.floor(30), bst.ceiling(30), bst.floor(10), bst.ceiling(94)
+    (26, 31, None, None)
+    >>> bst.rank(44), bst.rank(45), bst.select(0), bst.select(8)
+    (4, 5, 17, 93)
+    >>> list(bst.range(26, 55)), bst.count(26, 55)
+    ([26, 31, 44, 54], 4)
     """
+    # Class of the nodes.
+    _NODE = _Node
+
     def __init__(self):
         self._root = None
         self._size = 0
@@ -144,32 +203,65 @@ class BST(object):
     def __len__(self):
         return self._size
 
+    def height(self):
+        """Return the number of levels of the tree, 0 if it is empty."""
+        height = 0
+        level = [self._root] if self._root else []
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node.left, node.right) if child]
+        return height
+
     def __iter__(self):
-        return self._root.__iter__()
+        """Iterate over the keys in order."""
+        if self._root is None:
+            return iter(())
+        return iter(self._root)
 
     def __setitem__(self, key, value):
         """Overload the [] operator for assignment by having the __setitem__
         method call.
 
         This allow us to write Python statements like bst['Plymouth'] = 55446.
+        If the key is already in the tree, its value is replaced.
         """
-        if self._root:
-            self._setItemHelper(key, value, self._root)
-        else:
-            self._root = _Node(key, value)
-        self._size += 1
+        self._setItemHelper(key, value)
 
-    def _setItemHelper(self, key, value, node):
-        if key < node.key:
-            if node.hasLeft():
-                self._setItemHelper(key, value, node.left)
-            else:
-                node.left = _Node(key, value, parent=node)
-        else:
-            if node.hasRight():
-                self._setItemHelper(key, value, node.right)
+    def _setItemHelper(self, key, value):
+        """Insert the key-value pair.
+
+        Returns:
+            _Node/None: The new leaf, or None if the key was already in the
+                tree.
+        """
+        if self._root is None:
+            self._root = self._NODE(key, value)
+            self._size += 1
+            return self._root
+        node = self._root
+        while True:
+            if key == node.key:
+                node.value = value
+                return None
+            if key < node.key:
+                if node.left is None:
+                    node.left = self._NODE(key, value, parent=node)
+                    node = node.left
+                    break
+                node = node.left
             else:
-                node.right = _Node(key, value, parent=node)
+                if node.right is None:
+                    node.right = self._NODE(key, value, parent=node)
+                    node = node.right
+                    break
+                node = node.right
+        self._size += 1
+        ancestor = node.parent
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
+        return node
 
     def __getitem__(self, key):
         """It uses the same logic for choosing the left and right child as the
@@ -178,94 +270,209 @@ class BST(object):
         By overloading [], we can write a Python statement that looks just like
         we are accessing a dictionary: z = bst['Fargo'].
         """
-        if self._root:
-            node = self._getItemHelper(key, self._root)
-            if node:
-                return node.value
-            else:
-                return None
-        else:
+        node = self._getItemHelper(key, self._root)
+        if node is None:
             return None
+        return node.value
 
     def _getItemHelper(self, key, node):
-        if not node:
-            return None
-        elif node.key == key:
-            return node
-        elif node.key < key:
-            return self._getItemHelper(key, node.left)
-        else:
-            return self._getItemHelper(key, node.right)
+        """Return the node of the key in the subtree of node, or None."""
+        while node is not None and node.key != key:
+            if key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        return node
 
     def __contains__(self, key):
         """Implement the in operator."""
-        return self.__getitem__(key)
+        return self._getItemHelper(key, self._root) is not None
+
+    def _transplant(self, node, child):
+        """Put child, which may be None, in the place of node in the tree."""
+        parent = node.parent
+        if parent is None:
+            self._root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        if child is not None:
+            child.parent = parent
+
+    def _rotateLeft(self, root):
+        """Rotate the subtree of root to the left, and return its new root.
+
+        The right child of root becomes the root of the subtree, root becomes
+        its left child, and its old left subtree becomes the right subtree of
+        root. The order of the keys does not change.
+        """
+        new_root = root.right
+        root.right = new_root.left
+        if new_root.left is not None:
+            new_root.left.parent = root
+        self._transplant(root, new_root)
+        new_root.left = root
+        root.parent = new_root
+        new_root.size = root.size
+        root.size = 1 + _sizeOf(root.left) + _sizeOf(root.right)
+        return new_root
+
+    def _rotateRight(self, root):
+        """Rotate the subtree of root to the right, the mirror of
+        _rotateLeft(), and return its new root."""
+        new_root = root.left
+        root.left = new_root.right
+        if new_root.right is not None:
+            new_root.right.parent = root
+        self._transplant(root, new_root)
+        new_root.right = root
+        root.parent = new_root
+        new_root.size = root.size
+        root.size = 1 + _sizeOf(root.left) + _sizeOf(root.right)
+        return new_root
 
     def __delitem__(self, key):
         """Delete the node by searching the tree.
+
+        Raises:
+            KeyError: If the key is not in the tree.
         """
-        if self._size > 1:
-            node_to_delete = self._getItemHelper(key, self._root)
-            if node_to_delete:
-                self._delItemHelper(node_to_delete)
-                self._size -= 1
-            else:
-                raise KeyError('Key is not in the tree.')
-        elif self._size == 1 and self._root.key == key:
-            self._root = None
-            self._size -= 1
-        else:
+        node = self._getItemHelper(key, self._root)
+        if node is None:
             raise KeyError('Key is not in the tree.')
+        self._delItemHelper(node)
+        self._size -= 1
 
     def _delItemHelper(self, node):
-        if node.isLeaf():  # If the node to be deleted has no children
-            if node.isLeft():
-                node.parent.left = None
-            else:
-                node.parent.right = None
-        elif node.hasBothchildren():  # If the node has both children
-            successor = node.findSuccessor()
-            successor.spliceOut()
+        """Remove the node from the tree.
+
+        A node with two children takes the key and value of its successor,
+        which is the smallest key in its right subtree and has no left child,
+        and the successor is removed instead.
+
+        Returns:
+            tuple: (parent, is_left) of the node removed from its position,
+                see _splice().
+        """
+        if node.left is not None and node.right is not None:
+            successor = node.right.findMin()
             node.key = successor.key
             node.value = successor.value
-        else:
-            if node.hasLeft():  # If the node has only one children
-                if node.isLeft():
-                    # If the current node is a left child then we only need to
-                    # update the parent reference of the left child to point to
-                    # the parent of the current node, and then update the left
-                    # child reference of the parent to point to the current
-                    # node's left child.
-                    node.left.parent = node.parent
-                    node.parent.left = node.left
-                elif node.isRight():
-                    # If the current node is a right child then we only need
-                    # to update the parent reference of the left child to
-                    # point to the parent of the current node, and then
-                    # update the right child reference of the parent to point
-                    # to the current node's right child.
-                    node.left.parent = node.parent
-                    node.parent.right = node.left
-                else:
-                    # If the current node has no parent (i.e., it is the
-                    # root). We replace the key, value, left_child,
-                    # right_child data by calling replaceNodeData method on
-                    # the root.
-                    node.replaceNodeData(node.left.key, node.left.value,
-                                         node.left.left, node.left.right)
+            node = successor
+        return self._splice(node)
+
+    def _splice(self, node):
+        """Replace the node, which has at most one child, by its child.
+
+        Returns:
+            tuple: The parent of the node, or None if it was the root, and
+                whether the node was a left child.
+        """
+        parent = node.parent
+        is_left = parent is not None and parent.left is node
+        self._transplant(node,
+                         node.left if node.left is not None else node.right)
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+        return parent, is_left
+
+    def floor(self, key):
+        """Return the largest key <= key, or None if there is not any."""
+        result = None
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return node.key
+            if key < node.key:
+                node = node.left
             else:
-                # The cases are symmetric wrt either having a left or right
-                # child.
-                if node.isLeft():
-                    node.right.parent = node.parent
-                    node.parent.left = node.right
-                elif node.isRight():
-                    node.right.parent = node.parent
-                    node.parent.right = node.right
-                else:
-                    node.replaceNodeData(node.right.key, node.right.value,
-                                         node.right.left, node.right.right)
+                result = node.key
+                node = node.right
+        return result
+
+    def ceiling(self, key):
+        """Return the smallest key >= key, or None if there is not any."""
+        result = None
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return node.key
+            if key < node.key:
+                result = node.key
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def rank(self, key):
+        """Return the number of keys < key.
+
+        Going right at a node skips the node and its left subtree, whose keys
+        are all smaller.
+        """
+        rank = 0
+        node = self._root
+        while node is not None:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += 1 + _sizeOf(node.left)
+                node = node.right
+        return rank
 
+    def select(self, k):
+        """Return the k-th smallest key, counting from 0.
+
+        Raises:
+            IndexError: If k is not in [0, len).
+        """
+        if not 0 <= k < self._size:
+            raise IndexError('select index out of range.')
+        node = self._root
+        while True:
+            left_size = _sizeOf(node.left)
+            if k == left_size:
+                return node.key
+            if k < left_size:
+                node = node.left
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def range(self, lo, hi):
+        """Iterate over the keys in [lo, hi) in order.
+
+        The walk starts from the path down to lo, so it takes O(h) time plus
+        the number of keys yielded, instead of a full in-order walk.
+        """
+        # The stack holds the nodes on the path whose keys are >= lo, i.e.,
+        # the nodes where the walk went left, and are still to be yielded.
+        stack = []
+        node = self._root
+        while node is not None:
+            if lo <= node.key:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if not node.key < hi:
+                return
+            yield node.key
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def count(self, lo, hi):
+        """Return the number of keys in [lo, hi)."""
+        if not lo < hi:
+            return 0
+        return self.rank(hi) - self.rank(lo)
 
 
 def test():
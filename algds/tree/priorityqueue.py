@@ -15,7 +15,7 @@ __date__ = '2017-08-12'
 __email__ = 'zhangh0214@gmail.com'
 __license__ = 'CC BY-SA 3.0'
 __status__ = 'Development'
-__updated__ = '2017-08-12'
+__updated__ = '2026-10-17'
 __version__ = '1.0'
 
 
@@ -37,6 +37,18 @@ class PriorityQueue(object):
     7
     >>> print(priority_queue.delMin())
     11
+    >>> priority_queue.isEmpty()
+    True
+    >>> for key in [5, 7, 3, 11]:
+    ...     priority_queue.insert(key)
+    >>> priority_queue.size(), priority_queue.findMin()
+    (4, 3)
+    >>> print(priority_queue.replaceMin(9))
+    3
+    >>> print(priority_queue.replaceMin(1))
+    5
+    >>> [priority_queue.delMin() for _ in range(len(priority_queue))]
+    [1, 7, 9, 11]
     """
     def __init__(self):
         # An empty binary heap has a single zero as the first element, and that
@@ -45,6 +57,19 @@ class PriorityQueue(object):
         self._heap = [0]
         self._current_size = 0
 
+    def isEmpty(self):
+        return self._current_size == 0
+
+    def size(self):
+        return self._current_size
+
+    def __len__(self):
+        return self._current_size
+
+    def findMin(self):
+        """Return the smallest item without removing it."""
+        return self._heap[1]
+
     def insert(self, key):
         """Add an item to the heap."""
         self._heap.append(key)
@@ -84,6 +109,17 @@ class PriorityQueue(object):
         self._percDown(1)
         return retrieval
 
+    def replaceMin(self, key):
+        """Remove the smallest and add key in one pass.
+
+        It is faster than delMin() followed by insert(), since key is put at
+        the root and pushed down once, instead of the last item.
+        """
+        retrieval = self._heap[1]
+        self._heap[1] = key
+        self._percDown(1)
+        return retrieval
+
     def _percDown(self, i):
         while i * 2 <= self._current_size:
             min_child = self._minChild(i)
@@ -0,0 +1,344 @@
+"""Implementation of a red-black tree.
+
+A red-black tree is a binary search tree whose nodes are colored red or black,
+such that
+    1. the root and the leaves (NIL) are black;
+    2. a red node has black children;
+    3. all the paths from a node down to the leaves have the same number of
+       black nodes.
+The longest path from the root alternates red and black nodes, and the
+shortest is all black, so the height is at most 2 log2(n + 1).
+
+The balance is looser than that of an AVL tree, whose height is at most about
+1.44 log2(n), so the lookups go a little deeper. In return, an insertion does
+at most 2 rotations and a deletion at most 3, and most of the fixing up only
+recolors nodes, which suits the write-heavy workloads.
+
+We follow Introduction to Algorithms (CLRS), chapter 13. All the leaves and
+the parent of the root are one black sentinel node NIL, so that the fix-ups
+can read the color of a missing child and set the parent of a missing node
+without special cases.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['RBTree']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+
+class _RBNode(object):
+    """Node of a red-black tree.
+
+    Attributes:
+        key
+        value
+        left (_RBNode): The left child, or NIL.
+        right (_RBNode): The right child, or NIL.
+        parent (_RBNode): The parent, or NIL for the root.
+        red (bool): Whether the node is red, otherwise it is black.
+    """
+    __slots__ = ('key', 'value', 'left', 'right', 'parent', 'red')
+
+    def __init__(self, key, value, nil, red=True):
+        self.key = key
+        self.value = value
+        self.left = nil
+        self.right = nil
+        self.parent = nil
+        self.red = red
+
+
+class RBTree(object):
+    """Implementation of a red-black tree.
+
+    It implements the same map ADT as BST. The keys are unique: setting an
+    existing key replaces its value.
+
+    Attributes:
+        _nil (_RBNode): The sentinel.
+        _root (_RBNode): The root, or NIL if the tree is empty.
+        _size (int): Number of key-value pairs.
+
+    >>> tree = RBTree()
+    >>> for key in range(1000):
+    ...     tree[key] = str(key)
+    >>> len(tree), tree.height()
+    (1000, 17)
+    >>> tree[54], tree[1000], 54 in tree, 1000 in tree
+    ('54', None, True, False)
+    >>> tree[54] = 'cat'
+    >>> tree[54], len(tree)
+    ('cat', 1000)
+    >>> for key in range(0, 1000, 2):
+    ...     del tree[key]
+    >>> len(tree), tree[54], tree[55], list(tree)[:3]
+    (500, None, '55', [1, 3, 5])
+    >>> del tree[54]
+    Traceback (most recent call last):
+        ...
+    KeyError: 'Key is not in the tree.'
+    """
+    def __init__(self):
+        self._nil = _RBNode(None, None, None, red=False)
+        self._nil.left = self._nil.right = self._nil.parent = self._nil
+        self._root = self._nil
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def height(self):
+        """Return the number of levels of the tree, 0 if it is empty."""
+        nil = self._nil
+        height = 0
+        level = [self._root] if self._root is not nil else []
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node.left, node.right) if child is not nil]
+        return height
+
+    def __iter__(self):
+        """Iterate over the keys in order."""
+        nil = self._nil
+        stack = []
+        node = self._root
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def _find(self, key):
+        """Return the node of the key, or NIL."""
+        nil = self._nil
+        node = self._root
+        while node is not nil and node.key != key:
+            if key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        return node
+
+    def __getitem__(self, key):
+        """Return the value of the key, or None if it is not in the tree."""
+        node = self._find(key)
+        if node is self._nil:
+            return None
+        return node.value
+
+    def __contains__(self, key):
+        return self._find(key) is not self._nil
+
+    def __setitem__(self, key, value):
+        """Insert the key-value pair as a red leaf, and fix the tree up."""
+        nil = self._nil
+        parent = nil
+        node = self._root
+        while node is not nil:
+            if key == node.key:
+                node.value = value
+                return
+            parent = node
+            if key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        node = _RBNode(key, value, nil)
+        node.parent = parent
+        if parent is nil:
+            self._root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        self._size += 1
+        self._insertFixup(node)
+
+    def _insertFixup(self, node):
+        """Restore the properties after the red node is inserted.
+
+        Only property 2 can be violated, by the node and its red parent. If
+        the uncle is red as well, the parent and the uncle become black and
+        the grandparent red, which moves the violation two levels up.
+        Otherwise, one or two rotations at the grandparent end the fix-up.
+        """
+        while node.parent.red:
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.right:
+                    node = parent
+                    self._rotateLeft(node)
+                    parent = node.parent
+                parent.red = False
+                grandparent.red = True
+                self._rotateRight(grandparent)
+            else:
+                uncle = grandparent.left
+                if uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.left:
+                    node = parent
+                    self._rotateRight(node)
+                    parent = node.parent
+                parent.red = False
+                grandparent.red = True
+                self._rotateLeft(grandparent)
+        self._root.red = False
+
+    def __delitem__(self, key):
+        """Delete the node of the key, and fix the tree up.
+
+        A node with two children is replaced by its successor, which takes
+        its color, so the node removed from its position is the successor.
+        Removing a black node leaves one black node too few on the paths
+        through its child, which the fix-up restores.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        nil = self._nil
+        node = self._find(key)
+        if node is nil:
+            raise KeyError('Key is not in the tree.')
+        removed_red = node.red
+        if node.left is nil:
+            child = node.right
+            self._transplant(node, child)
+        elif node.right is nil:
+            child = node.left
+            self._transplant(node, child)
+        else:
+            successor = node.right
+            while successor.left is not nil:
+                successor = successor.left
+            removed_red = successor.red
+            child = successor.right
+            if successor.parent is node:
+                # The child may be NIL, whose parent is read by the fix-up.
+                child.parent = successor
+            else:
+                self._transplant(successor, child)
+                successor.right = node.right
+                successor.right.parent = successor
+            self._transplant(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.red = node.red
+        self._size -= 1
+        if not removed_red:
+            self._deleteFixup(child)
+
+    def _deleteFixup(self, node):
+        """Restore the properties after a black node above the node is removed.
+
+        The node counts as "doubly black". A red node simply becomes black.
+        Otherwise, with a black sibling whose children are black, the sibling
+        becomes red and the extra black moves up to the parent. A red sibling
+        is first rotated above the parent, and a sibling with a red child ends
+        the fix-up by at most two rotations.
+        """
+        while node is not self._root and not node.red:
+            parent = node.parent
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotateLeft(parent)
+                    sibling = parent.right
+                if not sibling.left.red and not sibling.right.red:
+                    sibling.red = True
+                    node = parent
+                    continue
+                if not sibling.right.red:
+                    sibling.left.red = False
+                    sibling.red = True
+                    self._rotateRight(sibling)
+                    sibling = parent.right
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self._rotateLeft(parent)
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotateRight(parent)
+                    sibling = parent.left
+                if not sibling.left.red and not sibling.right.red:
+                    sibling.red = True
+                    node = parent
+                    continue
+                if not sibling.left.red:
+                    sibling.right.red = False
+                    sibling.red = True
+                    self._rotateLeft(sibling)
+                    sibling = parent.left
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self._rotateRight(parent)
+            node = self._root
+        node.red = False
+
+    def _transplant(self, node, child):
+        """Put child, which may be NIL, in the place of node in the tree."""
+        parent = node.parent
+        if parent is self._nil:
+            self._root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        child.parent = parent
+
+    def _rotateLeft(self, root):
+        """Move the right child of root up in place of root, which becomes its
+        left child."""
+        new_root = root.right
+        root.right = new_root.left
+        if new_root.left is not self._nil:
+            new_root.left.parent = root
+        self._transplant(root, new_root)
+        new_root.left = root
+        root.parent = new_root
+
+    def _rotateRight(self, root):
+        """Mirror of _rotateLeft()."""
+        new_root = root.left
+        root.left = new_root.right
+        if new_root.right is not self._nil:
+            new_root.right.parent = root
+        self._transplant(root, new_root)
+        new_root.right = root
+        root.parent = new_root
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
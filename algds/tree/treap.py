@@ -0,0 +1,121 @@
+"""Implementation of a treap.
+
+A treap is a binary search tree in the order of the keys, and a heap in the
+order of random priorities drawn for the nodes: the priority of a node is
+smaller than those of its children. For distinct priorities, there is only one
+such tree, which is the binary search tree we would get by inserting the keys
+in the order of their priorities, i.e., in a random order whatever the real
+order of the insertions. Hence its expected height is O(log n), about
+3 log2(n), without any balance information kept.
+
+An insertion adds a leaf as in a binary search tree, and rotates it up until
+its parent has a smaller priority. A deletion rotates the node down until it
+has at most one child, and splices it out. Both take 2 rotations on average.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['Treap']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import random
+import sys
+sys.path.append('../../')
+
+from algds.tree.bst import _Node, BST
+
+
+class _TreapNode(_Node):
+    """Node of a treap, which also keeps its priority."""
+    __slots__ = ('priority',)
+
+    def __init__(self, key, value, left=None, right=None, parent=None):
+        super(_TreapNode, self).__init__(key, value, left, right, parent)
+        self.priority = 0
+
+
+class Treap(BST):
+    """Implementation of a treap.
+
+    It implements the same map ADT as BST. The keys are unique: setting an
+    existing key replaces its value.
+
+    Attributes:
+        _random (random.Random): Draw the priorities of the new nodes.
+
+    >>> treap = Treap(seed=0)
+    >>> for key in range(1000):
+    ...     treap[key] = str(key)
+    >>> len(treap), treap.height() < 40
+    (1000, True)
+    >>> treap[54], treap[1000], 54 in treap
+    ('54', None, True)
+    >>> treap[54] = 'cat'
+    >>> treap[54], len(treap)
+    ('cat', 1000)
+    >>> for key in range(0, 1000, 2):
+    ...     del treap[key]
+    >>> len(treap), treap[54], treap[55], list(treap)[:3]
+    (500, None, '55', [1, 3, 5])
+    >>> del treap[54]
+    Traceback (most recent call last):
+        ...
+    KeyError: 'Key is not in the tree.'
+    """
+    _NODE = _TreapNode
+
+    def __init__(self, seed=None):
+        """Initialize an empty treap.
+
+        Args:
+            seed [None]: Seed of the random priorities.
+        """
+        super(Treap, self).__init__()
+        self._random = random.Random(seed)
+
+    def __setitem__(self, key, value):
+        node = self._setItemHelper(key, value)
+        if node is None:
+            return
+        node.priority = self._random.random()
+        while node.parent is not None and node.priority < node.parent.priority:
+            if node.parent.left is node:
+                self._rotateRight(node.parent)
+            else:
+                self._rotateLeft(node.parent)
+
+    def __delitem__(self, key):
+        """Rotate the node of the key down, and splice it out.
+
+        The child of smaller priority is rotated up, which keeps the heap
+        order among the other nodes.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        node = self._getItemHelper(key, self._root)
+        if node is None:
+            raise KeyError('Key is not in the tree.')
+        while node.left is not None and node.right is not None:
+            if node.left.priority < node.right.priority:
+                self._rotateRight(node)
+            else:
+                self._rotateLeft(node)
+        self._splice(node)
+        self._size -= 1
+
+
+def test():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Benchmarks of the hash tables.
+
+benchmark() compares the collision resolution strategies, and memoryReport()
+compares the memory layouts of the slots.
+
+For each hash table and each target load factor, we fill a table of a fixed
+number of slots up to the load factor, then search for every inserted key and
+for as many absent keys. We report the mean and the worst probe length of the
+inserted keys, the mean probe length of the absent keys, and the throughput of
+the insertions and the searches.
+
+The tables are not allowed to grow before the target load factor is reached.
+A cuckoo table may still have to grow if the keys cannot be placed, in which
+case the load factor actually reached is lower than the target.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['benchmark', 'memoryReport']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import random
+import sys
+import time
+
+sys.path.append('../../')
+from algds.ds.hash import (HashTable, IntHashTable, QuadraticHashTable,
+                           DoubleHashTable, RobinHoodHashTable,
+                           CuckooHashTable, ChainedHashTable)
+
+ENGINES = [('linear', HashTable),
+           ('quadratic', QuadraticHashTable),
+           ('double', DoubleHashTable),
+           ('robinhood', RobinHoodHashTable),
+           ('cuckoo', CuckooHashTable),
+           ('chaining', ChainedHashTable)]
+LOAD_FACTORS = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95)
+
+
+def benchmark(number_slots=1 << 14, load_factors=LOAD_FACTORS,
+              engines=ENGINES, seed=0):
+    """Run the benchmark.
+
+    Args:
+        number_slots (int) [2^14]: Number of slots of each table.
+        load_factors (tuple of float) [LOAD_FACTORS]: Target load factors.
+        engines (list) [ENGINES]: Pairs of the name and the hash table class.
+        seed (int) [0]: Seed of the random keys.
+
+    Returns:
+        list of dict: One record for each engine and load factor, with the
+            probe statistics of HashTable.probeStats() and the throughputs
+            'insert_ops', 'hit_ops' and 'miss_ops' in operations per second.
+
+    >>> records = benchmark(number_slots=64, load_factors=(0.5,))
+    >>> [r['engine'] for r in records]
+    ['linear', 'quadratic', 'double', 'robinhood', 'cuckoo', 'chaining']
+    >>> all(abs(r['load_factor'] - 0.5) < 0.02 for r in records)
+    True
+    """
+    records = []
+    for name, cls in engines:
+        for load_factor in load_factors:
+            table = cls(number_slots=number_slots, max_load_factor=1)
+            n = int(load_factor * table.capacity())
+            generator = random.Random(seed)
+            keys = generator.sample(xrange(1 << 40), 2 * n)
+            present, absent = keys[:n], keys[n:]
+
+            start = time.time()
+            for key in present:
+                table[key] = key
+            insert_time = time.time() - start
+            start = time.time()
+            for key in present:
+                table[key]
+            hit_time = time.time() - start
+            start = time.time()
+            for key in absent:
+                table[key]
+            miss_time = time.time() - start
+
+            record = table.probeStats()
+            record.update({
+                'engine': name,
+                'target_load_factor': load_factor,
+                'insert_ops': n / max(insert_time, 1e-9),
+                'hit_ops': n / max(hit_time, 1e-9),
+                'miss_ops': n / max(miss_time, 1e-9),
+            })
+            records.append(record)
+    return records
+
+
+def report(records):
+    """Print the records as a table."""
+    print('%-10s %6s %6s %9s %9s %9s %10s %10s %10s' % (
+        'engine', 'target', 'load', 'avg probe', 'max probe', 'avg miss',
+        'insert/s', 'hit/s', 'miss/s'))
+    for r in records:
+        print('%-10s %6.2f %6.2f %9.2f %9d %9.2f %10.0f %10.0f %10.0f' % (
+            r['engine'], r['target_load_factor'], r['load_factor'],
+            r['average_probe_length'], r['max_probe_length'],
+            r['average_miss_length'], r['insert_ops'], r['hit_ops'],
+            r['miss_ops']))
+
+
+def memoryReport(n=10 ** 5):
+    """Compare the bytes per key-value pair of the slot layouts.
+
+    The slot layout replaced by the struct of arrays is one [key, value] list
+    for each slot, which we rebuild here for comparison. 'storage' counts the
+    slots only, and 'total' also counts the int key and value objects, which
+    IntHashTable does not need.
+
+    Args:
+        n (int) [10^5]: Number of int key-value pairs.
+
+    Returns:
+        dict: Map the name of each layout to a pair of bytes per key-value
+            pair (storage, total).
+
+    >>> report = memoryReport(1000)
+    >>> report['arrays'][0] < report['list of slots'][0]
+    True
+    >>> report['typed arrays'][1] < report['arrays'][1]
+    True
+    """
+    keys = [(1 << 40) + i for i in xrange(n)]
+    values = [(1 << 41) + i for i in xrange(n)]
+    objects = sum(sys.getsizeof(x) for x in keys + values)
+
+    result = {}
+    capacities = {}
+    for name, cls in [('arrays', HashTable), ('typed arrays', IntHashTable)]:
+        table = cls()
+        for key, val in zip(keys, values):
+            table[key] = val
+        capacities[name] = table.capacity()
+        storage = table.storageBytes()
+        total = storage + (objects if cls is HashTable else 0)
+        result[name] = (storage / n, total / n)
+
+    # The list of slots gets as many slots as the HashTable of 'arrays'.
+    slots = [[None, None] for _ in xrange(capacities['arrays'])]
+    for i, (key, val) in enumerate(zip(keys, values)):
+        slots[i][0] = key
+        slots[i][1] = val
+    storage = sys.getsizeof(slots) + sum(sys.getsizeof(slot) for slot in slots)
+    result['list of slots'] = (storage / n, (storage + objects) / n)
+    return result
+
+
+def main():
+    report(benchmark())
+    print()
+    print('%-14s %14s %14s' % ('layout', 'storage B/key', 'total B/key'))
+    for name, (storage, total) in sorted(memoryReport().items()):
+        print('%-14s %14.1f %14.1f' % (name, storage, total))
+
+
+if __name__ == '__main__':
+    main()
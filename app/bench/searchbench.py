@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""Benchmark of the search in a sorted array against the static indexes.
+
+For each size n, we build n sorted random 64-bit keys in an array.array, and
+time m random rank queries by
+- Search.binary(), the binary search in Python;
+- Search.bisect_left(), the binary search by the C bisect module;
+- EytzingerIndex.rank() and StaticBTreeIndex.rank().
+Half of the queries are keys of the array and half are not. We report the
+queries per second, and the bytes of the keys of each structure.
+
+Sizes of 10^8 keys need about 2 GB of memory for the array and the indexes.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['benchmark']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import array
+import random
+import sys
+import time
+
+sys.path.append('../../')
+from algds.search.search import Search
+
+SIZES = (10 ** 6, 10 ** 7, 10 ** 8)
+
+
+def _sortedKeys(n, generator):
+    """Return n sorted distinct random keys, without sorting.
+
+    Consecutive keys are at least 2 apart, so that there are absent keys
+    between any two of them.
+    """
+    keys = array.array('l', [0]) * n
+    key = 0
+    for i in xrange(n):
+        key += generator.randint(2, 16)
+        keys[i] = key
+    return keys
+
+
+def _queries(keys, number_queries, generator):
+    """Return the queries, alternately a random key of the array, and a
+    random absent key in the gap after a random key.
+
+    >>> keys = _sortedKeys(1000, random.Random(0))
+    >>> queries = _queries(keys, 1000, random.Random(0))
+    >>> present = set(keys)
+    >>> sum(x in present for x in queries)
+    500
+    """
+    n = len(keys)
+    queries = []
+    for j in xrange(number_queries):
+        i = generator.randrange(n)
+        if j % 2 == 0:
+            queries.append(keys[i])
+        else:
+            gap = keys[i + 1] - keys[i] if i + 1 < n else 2
+            queries.append(keys[i] + generator.randint(1, gap - 1))
+    return queries
+
+
+def benchmark(sizes=SIZES, number_queries=10 ** 5, seed=0):
+    """Run the benchmark.
+
+    Args:
+        sizes (tuple of int) [SIZES]: Numbers of keys.
+        number_queries (int) [10^5]: Number of queries for each size.
+        seed (int) [0]: Seed of the random keys and queries.
+
+    Returns:
+        list of tuple: (n, method, queries per second, bytes of the keys).
+
+    >>> rows = benchmark(sizes=(1000,), number_queries=100)
+    >>> [method for _, method, _, _ in rows]
+    ['binary', 'bisect', 'eytzinger', 'btree']
+    """
+    rows = []
+    for n in sizes:
+        generator = random.Random(seed)
+        keys = _sortedKeys(n, generator)
+        queries = _queries(keys, number_queries, generator)
+        search = Search(keys)
+        eytzinger = search.staticIndex('eytzinger')
+        btree = search.staticIndex('btree')
+        methods = [
+            ('binary', search.binary, keys),
+            ('bisect', search.bisect_left, keys),
+            ('eytzinger', eytzinger.rank, eytzinger._keys),
+            ('btree', btree.rank, btree._keys),
+        ]
+        for name, query, storage in methods:
+            start = time.time()
+            for x in queries:
+                query(x)
+            seconds = time.time() - start
+            rows.append((n, name, number_queries / max(seconds, 1e-9),
+                         storage.itemsize * len(storage)))
+    return rows
+
+
+def main():
+    print('%11s %-10s %12s %14s' % ('n', 'method', 'queries/s', 'key bytes'))
+    for n, method, qps, key_bytes in benchmark():
+        print('%11d %-10s %12.0f %14d' % (n, method, qps, key_bytes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,443 @@
+#!/usr/bin/env python
+"""Benchmark of the sorts of algds.sort.sort.
+
+Every sort is run on every input distribution and size, and we record
+- the wall time of sorting a plain list, the best of a few repeats;
+- the number of comparisons, counted by wrapping each item in Counted, whose
+  comparison operators increase a counter;
+- the number of writes into the list, counted by sorting a CountingList,
+  whose item assignments increase a counter. A swap counts as two writes. A
+  sort returning a new list, such as mergeSort(), does not write into the
+  list, so its writes are not measured;
+- the peak bytes allocated during the sort, by tracemalloc, which needs
+  Python 3.4 or later. The module runs on Python 2 as well, without them.
+
+The operation counts need a second, instrumented run, which is much slower
+than the timed one, so they are only taken up to a maximum size. The records
+can be saved as JSON or CSV, and compare() reports the regressions of a new
+run against a saved baseline:
+
+    python sortbench.py --output baseline.json
+    ... change the sorts ...
+    python sortbench.py --output current.json --compare baseline.json
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['DISTRIBUTIONS', 'SORTS', 'Counted', 'CountingList', 'benchmark',
+           'saveRecords', 'loadRecords', 'compare']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+
+sys.path.append('../../')
+from algds.sort import sort as sorts
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+try:
+    xrange
+except NameError:  # Python 3
+    xrange = range
+
+
+def _random(n, generator):
+    return [generator.randrange(n) for _ in xrange(n)]
+
+
+def _sorted(n, generator):
+    return list(xrange(n))
+
+
+def _reversed(n, generator):
+    return list(xrange(n - 1, -1, -1))
+
+
+def _fewUnique(n, generator):
+    return [generator.randrange(10) for _ in xrange(n)]
+
+
+def _organPipe(n, generator):
+    return list(xrange(n // 2)) + list(xrange((n + 1) // 2 - 1, -1, -1))
+
+
+def _nearlySorted(n, generator):
+    """Sorted, except for n / 100 random swaps."""
+    A = list(xrange(n))
+    for _ in xrange(max(1, n // 100)):
+        i = generator.randrange(n)
+        j = generator.randrange(n)
+        A[i], A[j] = A[j], A[i]
+    return A
+
+
+DISTRIBUTIONS = [('random', _random),
+                 ('sorted', _sorted),
+                 ('reversed', _reversed),
+                 ('few_unique', _fewUnique),
+                 ('organ_pipe', _organPipe),
+                 ('nearly_sorted', _nearlySorted)]
+
+# (name, sort, whether it compares the items, maximum size). The quadratic
+# sorts are limited, and so is the quick sort, whose recursion is as deep as
+# the size of a sorted input and hits the recursion limit at 1000 items.
+SORTS = [('bubble', sorts.bubbleSort, True, 10 ** 4),
+         ('selection', sorts.selectionSort, True, 10 ** 4),
+         ('insertion', sorts.insertionSort, True, 10 ** 4),
+         ('shell', sorts.shellSort, True, 10 ** 6),
+         ('merge', sorts.mergeSort, True, 10 ** 7),
+         ('quick', sorts.quickSort, True, 10 ** 2),
+         ('heap', sorts.heapSort, True, 10 ** 7),
+         ('intro', sorts.introSort, True, 10 ** 7),
+         ('natural_merge', sorts.naturalMergeSort, True, 10 ** 7),
+         ('buffered_merge', sorts.bufferedMergeSort, True, 10 ** 7),
+         ('bottom_up_merge', sorts.bottomUpMergeSort, True, 10 ** 7),
+         ('counting', sorts.countingSort, False, 10 ** 7),
+         ('lsd_radix', sorts.lsdRadixSort, False, 10 ** 7),
+         ('msd_radix', sorts.msdRadixSort, False, 10 ** 7),
+         ('bucket', sorts.bucketSort, False, 10 ** 7),
+         ('auto', sorts.sort, True, 10 ** 7)]
+SIZES = (10, 100, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+# Columns of the records, in the order of the CSV files.
+FIELDS = ['sort', 'distribution', 'size', 'seconds', 'comparisons', 'writes',
+          'peak_bytes']
+
+
+class Counted(object):
+    """Item which counts the comparisons made on all the Counted items.
+
+    >>> Counted.comparisons = 0
+    >>> Counted(1) < Counted(2) <= Counted(2)
+    True
+    >>> Counted.comparisons
+    2
+    """
+    __slots__ = ('value',)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        Counted.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        Counted.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        Counted.comparisons += 1
+        return self.value != other.value
+
+    __hash__ = None
+
+
+class _CountedInt(int):
+    """Integer which counts its comparisons in Counted.comparisons.
+
+    sort() still sees integers, so that it picks the same algorithm as for
+    the plain integers, and the distribution sorts it picks count no
+    comparisons beyond those of finding the range of the keys.
+
+    >>> Counted.comparisons = 0
+    >>> max([_CountedInt(1), _CountedInt(3), _CountedInt(2)])
+    3
+    >>> Counted.comparisons
+    2
+    """
+    __slots__ = ()
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return int(self) < int(other)
+
+    def __le__(self, other):
+        Counted.comparisons += 1
+        return int(self) <= int(other)
+
+    def __gt__(self, other):
+        Counted.comparisons += 1
+        return int(self) > int(other)
+
+    def __ge__(self, other):
+        Counted.comparisons += 1
+        return int(self) >= int(other)
+
+    def __eq__(self, other):
+        Counted.comparisons += 1
+        return int(self) == int(other)
+
+    def __ne__(self, other):
+        Counted.comparisons += 1
+        return int(self) != int(other)
+
+    __hash__ = int.__hash__
+
+
+class CountingList(list):
+    """List which counts the items written into it.
+
+    Writes made by the sorts through list methods, such as reverse(), are not
+    counted.
+
+    >>> A = CountingList([2, 1, 3])
+    >>> A[0], A[1] = A[1], A[0]
+    >>> A[1:3] = [3, 2]
+    >>> A.writes
+    4
+    """
+    def __init__(self, iterable=()):
+        list.__init__(self, iterable)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.writes += len(value)
+        else:
+            self.writes += 1
+        list.__setitem__(self, index, value)
+
+    def __setslice__(self, i, j, value):  # Python 2
+        self.__setitem__(slice(i, j), value)
+
+
+def _time(sort, A, repeat):
+    """Return the best time of sorting copies of A."""
+    best = float('inf')
+    for _ in xrange(repeat):
+        B = list(A)
+        start = time.time()
+        sort(B)
+        best = min(best, time.time() - start)
+    return best
+
+
+def _count(sort, A, compares):
+    """Return the comparisons and the writes of sorting A.
+
+    The writes are None if the sort returns a new list instead of sorting A
+    in place.
+    """
+    comparisons = None
+    if compares:
+        wrap = _CountedInt if all(type(x) is int for x in A) else Counted
+        Counted.comparisons = 0
+        sort([wrap(x) for x in A])
+        comparisons = Counted.comparisons
+    B = CountingList(A)
+    result = sort(B)
+    if result is not None and result is not B:
+        return comparisons, None
+    return comparisons, B.writes
+
+
+def _peakBytes(sort, A):
+    B = list(A)
+    tracemalloc.start()
+    try:
+        sort(B)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(sizes=SIZES, sort_names=None, distribution_names=None,
+              repeat=3, count_max=10 ** 5, seed=0):
+    """Run the benchmark.
+
+    Args:
+        sizes (tuple of int) [SIZES]: Input sizes. A sort is skipped on sizes
+            beyond its maximum in SORTS.
+        sort_names (list of str/None) [None]: Sorts to run, None means all.
+        distribution_names (list of str/None) [None]: Input distributions,
+            None means all.
+        repeat (int) [3]: Take the best time of repeat runs.
+        count_max (int) [10^5]: Count the operations up to this size only.
+        seed (int) [0]: Seed of the random inputs.
+
+    Returns:
+        list of dict: One record for each sort, distribution and size, with
+            the FIELDS. The fields not measured are None.
+
+    >>> records = benchmark(sizes=(100,), sort_names=['heap', 'counting'],
+    ...                     distribution_names=['sorted'], repeat=1)
+    >>> [(r['sort'], r['size'], r['writes']) for r in records]
+    [('heap', 100, 888), ('counting', 100, 100)]
+    >>> records[0]['comparisons'] > 0, records[1]['comparisons']
+    (True, None)
+    >>> records[0]['peak_bytes'] is not None or tracemalloc is None
+    True
+    >>> benchmark(sizes=(100,), sort_names=['merge'],
+    ...           distribution_names=['sorted'], repeat=1)[0]['writes'] is None
+    True
+
+    The auto sort picks the counting sort for these integers, and its
+    comparisons are those of finding their range:
+
+    >>> benchmark(sizes=(100,), sort_names=['auto'],
+    ...           distribution_names=['random'], repeat=1)[0]['comparisons']
+    396
+    """
+    records = []
+    for name, sort, compares, max_size in SORTS:
+        if sort_names is not None and name not in sort_names:
+            continue
+        for distribution, generate in DISTRIBUTIONS:
+            if (distribution_names is not None and
+                    distribution not in distribution_names):
+                continue
+            for n in sizes:
+                if n > max_size:
+                    continue
+                A = generate(n, random.Random(seed))
+                record = dict((field, None) for field in FIELDS)
+                record.update({'sort': name, 'distribution': distribution,
+                               'size': n,
+                               'seconds': _time(sort, A, repeat)})
+                if n <= count_max:
+                    record['comparisons'], record['writes'] = _count(
+                        sort, A, compares)
+                    if tracemalloc is not None:
+                        record['peak_bytes'] = _peakBytes(sort, A)
+                records.append(record)
+    return records
+
+
+def saveRecords(records, path):
+    """Save the records to a .json or .csv file."""
+    if path.endswith('.csv'):
+        with open(path, 'w') as f:
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+    else:
+        with open(path, 'w') as f:
+            json.dump(records, f, indent=1, sort_keys=True)
+
+
+def loadRecords(path):
+    """Load the records from a .json or .csv file."""
+    with open(path) as f:
+        if not path.endswith('.csv'):
+            return json.load(f)
+        records = []
+        for row in csv.DictReader(f):
+            for field in FIELDS[2:]:
+                row[field] = float(row[field]) if row[field] else None
+            row['size'] = int(row['size'])
+            records.append(row)
+        return records
+
+
+def compare(baseline, current, tolerance=0.2, min_seconds=1e-3):
+    """Find the regressions of the current records against the baseline.
+
+    A metric regresses if it grows by more than the tolerance. Times below
+    min_seconds in both runs are too noisy to compare.
+
+    Args:
+        baseline (list of dict): Records of the reference run.
+        current (list of dict): Records of the new run.
+        tolerance (float) [0.2]: Relative growth allowed.
+        min_seconds (float) [1e-3]: Ignore times shorter than this.
+
+    Returns:
+        list of tuple: (sort, distribution, size, metric, baseline value,
+            current value) of each regression.
+
+    >>> old = [{'sort': 'heap', 'distribution': 'random', 'size': 10,
+    ...         'seconds': 1.0, 'comparisons': 100, 'writes': 50,
+    ...         'peak_bytes': None}]
+    >>> new = [dict(old[0], seconds=1.1, comparisons=130)]
+    >>> compare(old, new)
+    [('heap', 'random', 10, 'comparisons', 100, 130)]
+    """
+    reference = dict(((r['sort'], r['distribution'], r['size']), r)
+                     for r in baseline)
+    regressions = []
+    for r in current:
+        case = (r['sort'], r['distribution'], r['size'])
+        if case not in reference:
+            continue
+        old = reference[case]
+        for metric in FIELDS[3:]:
+            if old[metric] is None or r[metric] is None:
+                continue
+            if (metric == 'seconds' and
+                    max(old[metric], r[metric]) < min_seconds):
+                continue
+            if r[metric] > old[metric] * (1 + tolerance):
+                regressions.append(case + (metric, old[metric], r[metric]))
+    return regressions
+
+
+def report(records):
+    """Print the records as a table."""
+    print('%-16s %-14s %9s %10s %12s %12s %12s' % (
+        'sort', 'distribution', 'size', 'seconds', 'comparisons', 'writes',
+        'peak bytes'))
+    for r in records:
+        print('%-16s %-14s %9d %10.4f %12s %12s %12s' % (
+            r['sort'], r['distribution'], r['size'], r['seconds'],
+            r['comparisons'], r['writes'], r['peak_bytes']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--sorts', nargs='+', default=None)
+    parser.add_argument('--distributions', nargs='+', default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--count-max', type=int, default=10 ** 5)
+    parser.add_argument('--output', help='Save the records to .json/.csv.')
+    parser.add_argument('--compare', help='Baseline .json/.csv to compare.')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    records = benchmark(args.sizes, args.sorts, args.distributions,
+                        args.repeat, args.count_max)
+    report(records)
+    if args.output:
+        saveRecords(records, args.output)
+    if args.compare:
+        regressions = compare(loadRecords(args.compare), records,
+                              args.tolerance)
+        for regression in regressions:
+            print('Regression: %s on %s of size %d, %s %s -> %s'
+                  % regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Microbenchmark of the list-backed and the typed stacks.
+
+We push n floats and pop them all, as an expression evaluator does with its
+operands, in three ways: one method call per item, the batched
+push_many()/pop_many(), and the primitives() fast path. We also report the
+memory taken by the n items in each stack.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['benchmark']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import sys
+import time
+
+sys.path.append('../../')
+from algds.ds.stack import Stack
+
+
+def _methods(stack, values):
+    for x in values:
+        stack.push(x)
+    for _ in xrange(len(values)):
+        stack.pop()
+
+
+def _batched(stack, values):
+    stack.push_many(values)
+    stack.pop_many(len(values))
+
+
+def _primitives(stack, values):
+    push, pop = stack.primitives()
+    for x in values:
+        push(x)
+    for _ in xrange(len(values)):
+        pop()
+
+
+def benchmark(n=10 ** 6, repeat=3):
+    """Run the benchmark.
+
+    Args:
+        n (int) [10^6]: Number of items.
+        repeat (int) [3]: Take the best of repeat runs.
+
+    Returns:
+        list of tuple: (stack, mode, seconds, bytes per item) for each stack
+            and each mode.
+
+    >>> rows = benchmark(n=100, repeat=1)
+    >>> [(stack, mode) for stack, mode, _, _ in rows][:3]
+    [('list', 'methods'), ('list', 'batched'), ('list', 'primitives')]
+    """
+    values = [float(i) for i in xrange(n)]
+    rows = []
+    for name, typecode in [('list', None), ("array('d')", 'd')]:
+        stack = Stack(typecode)
+        stack.push_many(values)
+        # The floats pushed into a list are kept alive as objects, while an
+        # array.array packs them.
+        item_bytes = sys.getsizeof(stack._items)
+        if typecode is None:
+            item_bytes += sum(sys.getsizeof(x) for x in values)
+        stack.pop_many(n)
+        for mode, run in [('methods', _methods), ('batched', _batched),
+                          ('primitives', _primitives)]:
+            best = float('inf')
+            for _ in xrange(repeat):
+                start = time.time()
+                run(stack, values)
+                best = min(best, time.time() - start)
+            rows.append((name, mode, best, item_bytes / n))
+    return rows
+
+
+def main():
+    print('%-10s %-10s %10s %10s' % ('stack', 'mode', 'seconds', 'B/item'))
+    for name, mode, seconds, item_bytes in benchmark():
+        print('%-10s %-10s %10.3f %10.1f' % (name, mode, seconds, item_bytes))
+
+
+if __name__ == '__main__':
+    main()
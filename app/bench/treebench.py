@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""Benchmark of the ordered maps: BST, AVL, red-black tree and treap.
+
+The workloads are
+- sorted_insert: insert the keys 0, 1, ..., n - 1. Keys arriving in sorted
+  order, such as timestamps or auto-incremented ids, are the worst case of a
+  plain binary search tree: every key goes to the right of the previous one,
+  so the tree degenerates into a linked list of height n, and inserting n
+  keys takes O(n^2) time;
+- insert_heavy: n operations on random keys, 90% insertions and 10% lookups,
+  starting from an empty tree;
+- read_heavy: n operations, 90% lookups, 5% insertions and 5% deletions, on a
+  tree of n random keys;
+- mixed: n operations, 40% insertions, 40% lookups and 20% deletions, on a
+  tree of n random keys.
+Half of the lookups are for keys in the tree. The same operations are applied
+to every tree, and we report the time of the n operations, excluding the
+initial keys, and the height of the resulting tree. A tree is skipped at the
+sorted_insert sizes above its max_size in TREES, where it would take too long.
+"""
+
+from __future__ import division, print_function
+
+__all__ = ['benchmark']
+__author__ = 'Hao Zhang'
+__copyright__ = 'Copyright @2017'
+__date__ = '2026-10-17'
+__email__ = 'zhangh0214@gmail.com'
+__license__ = 'CC BY-SA 3.0'
+__status__ = 'Development'
+__updated__ = '2026-10-17'
+__version__ = '1.0'
+
+import random
+import sys
+import time
+
+sys.path.append('../../')
+from algds.tree.avl import AVL
+from algds.tree.bst import BST
+from algds.tree.rbtree import RBTree
+from algds.tree.treap import Treap
+
+# (name, class, max_size). BST takes about 10 seconds for 10^4 sorted keys,
+# and 100 times longer for 10 times more keys.
+TREES = (
+    ('BST', BST, 10 ** 4),
+    ('AVL', AVL, None),
+    ('RB', RBTree, None),
+    ('treap', Treap, None),
+)
+# (name, whether the tree starts with n keys, fractions of the insertions,
+# lookups and deletions). sorted_insert is handled separately.
+WORKLOADS = (
+    ('sorted_insert', False, None),
+    ('insert_heavy', False, (0.9, 0.1, 0.0)),
+    ('read_heavy', True, (0.05, 0.9, 0.05)),
+    ('mixed', True, (0.4, 0.4, 0.2)),
+)
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+_INSERT = 0
+_LOOKUP = 1
+_DELETE = 2
+
+
+def _operations(n, initial, fractions, generator):
+    """Draw the initial keys and the n operations of a random workload.
+
+    Returns:
+        tuple: (list of the initial keys, list of (operation, key)).
+    """
+    present = []
+    initial_keys = []
+    if initial:
+        initial_keys = generator.sample(xrange(4 * n), n)
+        present = list(initial_keys)
+    positions = dict((key, i) for i, key in enumerate(present))
+    insert_fraction, lookup_fraction, _ = fractions
+    operations = []
+    for _ in xrange(n):
+        u = generator.random()
+        if u < insert_fraction or not present:
+            key = generator.randrange(4 * n)
+            if key not in positions:
+                positions[key] = len(present)
+                present.append(key)
+            operations.append((_INSERT, key))
+        elif u < insert_fraction + lookup_fraction:
+            if generator.random() < 0.5:
+                key = present[generator.randrange(len(present))]
+            else:
+                key = generator.randrange(4 * n, 8 * n)
+            operations.append((_LOOKUP, key))
+        else:
+            # Delete a random present key, moving the last one to its place.
+            i = generator.randrange(len(present))
+            key = present[i]
+            present[i] = present[-1]
+            positions[present[i]] = i
+            present.pop()
+            del positions[key]
+            operations.append((_DELETE, key))
+    return initial_keys, operations
+
+
+def _run(tree, operations):
+    for operation, key in operations:
+        if operation == _INSERT:
+            tree[key] = key
+        elif operation == _LOOKUP:
+            tree[key]
+        else:
+            del tree[key]
+
+
+def benchmark(sizes=SIZES, trees=TREES, workloads=WORKLOADS, seed=0):
+    """Run the benchmark.
+
+    Args:
+        sizes (tuple of int) [SIZES]: Numbers of operations.
+        trees (tuple of tuple) [TREES]: (name, class, max_size) of each tree.
+        workloads (tuple of tuple) [WORKLOADS]: The workloads to run.
+        seed (int) [0]: Seed of the random operations.
+
+    Returns:
+        list of tuple: (workload, tree, n, seconds, height).
+
+    >>> rows = benchmark(sizes=(100,))
+    >>> [row[0] for row in rows[::4]]
+    ['sorted_insert', 'insert_heavy', 'read_heavy', 'mixed']
+    >>> [(row[1], row[4]) for row in rows[:3]]
+    [('BST', 100), ('AVL', 7), ('RB', 11)]
+    """
+    rows = []
+    for workload, initial, fractions in workloads:
+        for n in sizes:
+            if fractions is None:
+                initial_keys = []
+                operations = [(_INSERT, key) for key in xrange(n)]
+            else:
+                initial_keys, operations = _operations(
+                    n, initial, fractions, random.Random(seed))
+            for name, cls, max_size in trees:
+                if (fractions is None and max_size is not None and
+                        n > max_size):
+                    continue
+                tree = cls()
+                for key in initial_keys:
+                    tree[key] = key
+                start = time.time()
+                _run(tree, operations)
+                seconds = time.time() - start
+                rows.append((workload, name, n, seconds, tree.height()))
+    return rows
+
+
+def main():
+    print('%-14s %-6s %9s %10s %8s' % ('workload', 'tree', 'n', 'seconds',
+                                      'height'))
+    for workload, name, n, seconds, height in benchmark():
+        print('%-14s %-6s %9d %10.3f %8d' % (workload, name, n, seconds,
+                                            height))
+
+
+if __name__ == '__main__':
+    main()